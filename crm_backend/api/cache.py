@@ -0,0 +1,137 @@
+import hashlib
+from urllib.parse import urlencode
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+
+RESPONSE_CACHE_ALIAS = "responses"
+RESPONSE_CACHE_STATS = ("hits", "misses")
+
+
+def get_response_cache():
+    """Кэш ответов списков API."""
+    return caches[RESPONSE_CACHE_ALIAS]
+
+
+def response_cache_enabled():
+    """Кэш ответов настроен: без него списки строятся при каждом запросе."""
+    return not isinstance(get_response_cache(), DummyCache)
+
+
+def model_version_key(model):
+    """Ключ версии данных модели в кэше ответов."""
+    return f"response-version:{model._meta.label_lower}"
+
+
+def model_versions(models):
+    """
+    Текущие версии данных моделей models.
+
+    Версия -- случайная строка, которая меняется при каждом изменении
+    объектов модели. Отсутствующая версия создается, чтобы ключи ответов
+    не совпадали с ключами, построенными до ее вытеснения из кэша.
+    """
+    cache = get_response_cache()
+    keys = [model_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            version = uuid4().hex
+            if not cache.add(key, version, None):
+                version = cache.get(key, version)
+            versions[key] = version
+    return [versions[key] for key in keys]
+
+
+def bump_model_version(model):
+    """Смена версии данных модели: кэшированные ответы с ней устаревают."""
+    get_response_cache().set(model_version_key(model), uuid4().hex, None)
+
+
+def response_cache_key(request, basename, models):
+    """
+    Ключ кэша ответа на запрос списка.
+
+    Ключ строится из пользователя, хоста, пути, отсортированных непустых
+    параметров запроса и версий данных моделей models, поэтому порядок
+    параметров не влияет на попадание в кэш, а изменение любой из моделей
+    делает старые ключи недостижимыми. Хост входит в ключ, потому что
+    ссылки next и ссылки на файлы в ответе абсолютные.
+    """
+    params = sorted(
+        (name, value)
+        for name, values in request.query_params.lists()
+        for value in values
+        if value != ""
+    )
+    digest = hashlib.sha256(
+        "\n".join(
+            [
+                request.get_host(),
+                request.path,
+                urlencode(params),
+                *model_versions(models),
+            ]
+        ).encode()
+    ).hexdigest()
+    return f"response:{basename}:{request.user.pk}:{digest}"
+
+
+def response_stats_key(basename, name):
+    """Ключ счетчика попаданий или промахов кэша ответов."""
+    return f"response-stats:{basename}:{name}"
+
+
+def count_response(basename, name):
+    """Увеличение счетчика попаданий или промахов кэша ответов."""
+    cache = get_response_cache()
+    key = response_stats_key(basename, name)
+    if not cache.add(key, 1, None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+
+
+def response_stats(basenames, reset=False):
+    """Счетчики кэша ответов {basename: {"hits", "misses"}}."""
+    cache = get_response_cache()
+    keys = {
+        (basename, name): response_stats_key(basename, name)
+        for basename in basenames
+        for name in RESPONSE_CACHE_STATS
+    }
+    values = cache.get_many(keys.values())
+    if reset:
+        cache.delete_many(keys.values())
+    stats = {basename: {} for basename in basenames}
+    for (basename, name), key in keys.items():
+        stats[basename][name] = values.get(key, 0)
+    return stats
+
+
+def response_etag(request, *parts):
+    """
+    Значение ETag ответа на запрос пользователя.
+
+    parts -- значения, от которых зависит тело ответа (даты изменения,
+    хэш тела). В ETag входят пользователь и полный путь запроса.
+    """
+    digest = hashlib.sha256(
+        "\n".join(
+            [str(request.user.pk), request.get_full_path(), *map(str, parts)]
+        ).encode()
+    ).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def get_cached_response(key):
+    """Данные ответа из кэша или None."""
+    return get_response_cache().get(key)
+
+
+def set_cached_response(key, data):
+    """Сохранение данных ответа на RESPONSE_CACHE_TIMEOUT секунд."""
+    get_response_cache().set(key, data, settings.RESPONSE_CACHE_TIMEOUT)
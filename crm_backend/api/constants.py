@@ -1,2 +1,9 @@
 MAX_AGE = 100
 MIN_AGE = 13
+AGENDA_MAX_DAYS = 62
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_MAX_ERRORS = 1000
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_FORMATS = ("csv", "jsonl")
+FUNNEL_SCOPES = ("vacancy", "recruiter")
+SPARSE_FIELDS_PARAMS = ("fields", "omit")
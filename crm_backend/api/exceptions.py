@@ -1,5 +1,8 @@
+from django.core.exceptions import RequestDataTooBig
 from drf_standardized_errors.formatter import ExceptionFormatter
+from drf_standardized_errors.handler import ExceptionHandler
 from drf_standardized_errors.types import ErrorResponse
+from rest_framework.exceptions import ParseError
 
 
 class MyExceptionFormatter(ExceptionFormatter):
@@ -23,3 +26,19 @@ class MyExceptionFormatter(ExceptionFormatter):
             "field_name": error.attr,
             "message": error.detail,
         }
+
+
+class MyExceptionHandler(ExceptionHandler):
+    """
+    Обработчик исключений API.
+
+    RequestDataTooBig (например, от api.uploads.MaxSizeUploadHandler)
+    возвращается как ошибка разбора запроса 400 с текстом исключения, а не
+    как необработанная ошибка 500.
+    """
+
+    def convert_known_exceptions(self, exc):
+        """Преобразование исключений Django в исключения DRF."""
+        if isinstance(exc, RequestDataTooBig):
+            return ParseError(str(exc))
+        return super().convert_known_exceptions(exc)
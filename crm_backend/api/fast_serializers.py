@@ -0,0 +1,462 @@
+from collections import defaultdict
+from datetime import date, time
+from operator import itemgetter
+
+from django.utils import timezone
+from recruitment.models import Candidate, Company, SkillStack, WorkExperience
+
+from .utils import (
+    CANDIDATE_STATUS_LABELS,
+    EDUCATION_LABELS,
+    EMPLOYMENT_TYPE_LABELS,
+    EXPERIENCE_LABELS,
+    INTERVIEW_STATUS_LABELS,
+    SCHEDULE_WORK_LABELS,
+    VACANCY_STATUS_LABELS,
+    get_salary_dict,
+    get_sparse_fields,
+    has_sparse_fields,
+    render_choice_labels,
+)
+
+
+class FastField:
+    """
+    Поле быстрого сериализатора: значение колонки из строки .values().
+
+    source -- путь колонки для .values() (по умолчанию имя поля),
+    to_representation -- преобразование непустого значения, как у поля DRF.
+    """
+
+    def __init__(self, source=None, to_representation=None):
+        """Поле с колонкой source и преобразованием значения."""
+        self.source = source
+        self.to_representation = to_representation
+
+    def bind(self, name):
+        """Привязка поля к имени в сериализаторе."""
+        self.name = name
+        self.source = self.source or name
+
+    @property
+    def sources(self):
+        """Колонки, которые нужно выбрать в .values()."""
+        return (self.source,)
+
+    def get_accessor(self, serializer, rows):
+        """Функция получения значения поля из строки."""
+        convert = self.to_representation
+        if convert is None:
+            return itemgetter(self.source)
+        getter = itemgetter(self.source)
+
+        def accessor(row):
+            value = getter(row)
+            return None if value is None else convert(value)
+
+        return accessor
+
+
+class FastDateTimeField(FastField):
+    """
+    Дата и время в текущем часовом поясе в формате ISO 8601.
+
+    Часовой пояс определяется один раз на страницу, а не для каждой строки,
+    как в timezone.localtime.
+    """
+
+    def get_accessor(self, serializer, rows):
+        """Функция перевода значения в текущий часовой пояс."""
+        getter = itemgetter(self.source)
+        tz = timezone.get_current_timezone()
+
+        def accessor(row):
+            value = getter(row)
+            return None if value is None else value.astimezone(tz).isoformat()
+
+        return accessor
+
+
+class FastFileField(FastField):
+    """
+    Ссылка на файл, как у FileField DRF.
+
+    Хранилище и запрос определяются один раз на страницу; при наличии
+    запроса ссылка абсолютная.
+    """
+
+    def __init__(self, storage_field, source=None):
+        """Поле ссылки на файл модельного поля storage_field."""
+        super().__init__(source)
+        self.storage_field = storage_field
+
+    def get_accessor(self, serializer, rows):
+        """Функция получения ссылки на файл."""
+        getter = itemgetter(self.source)
+        url = self.storage_field.storage.url
+        request = serializer.context.get("request")
+
+        def accessor(row):
+            name = getter(row)
+            if not name:
+                return None
+            if request is None:
+                return url(name)
+            return request.build_absolute_uri(url(name))
+
+        return accessor
+
+
+class FastMethodField(FastField):
+    """Значение, вычисляемое методом сериализатора get_<имя поля>(row)."""
+
+    def __init__(self, *sources):
+        """Поле метода, которому нужны колонки sources."""
+        super().__init__()
+        self.method_sources = sources
+
+    @property
+    def sources(self):
+        """Колонки, которые нужны методу сериализатора."""
+        return self.method_sources
+
+    def get_accessor(self, serializer, rows):
+        """Метод сериализатора для поля."""
+        return getattr(serializer, f"get_{self.name}")
+
+
+class FastPrefetchField(FastField):
+    """
+    Список связанных значений, загружаемый одним запросом на страницу.
+
+    model -- связанная модель, lookup -- путь от нее к объекту списка,
+    values -- колонки связанной модели; to_representation получает кортеж
+    значений, а без него в список попадает единственная колонка.
+    """
+
+    def __init__(self, model, lookup, *values, to_representation=None):
+        """Поле списка колонок values модели model, связанной через lookup."""
+        super().__init__(to_representation=to_representation)
+        self.model = model
+        self.lookup = lookup
+        self.values = values
+
+    @property
+    def sources(self):
+        """Для связи нужен только первичный ключ строки."""
+        return ("id",)
+
+    def get_accessor(self, serializer, rows):
+        """Загрузка связанных значений для всех строк страницы."""
+        related = defaultdict(list)
+        queryset = self.model.objects.filter(
+            **{f"{self.lookup}__in": [row["id"] for row in rows]}
+        ).values_list(self.lookup, *self.values)
+        convert = self.to_representation or itemgetter(0)
+        for row_id, *values in queryset:
+            related[row_id].append(convert(values))
+        return lambda row: related.get(row["id"], [])
+
+
+def get_sources(fields):
+    """Колонки для .values(), нужные полям fields, без повторов."""
+    return tuple(
+        dict.fromkeys(source for field in fields.values() for source in field.sources)
+    )
+
+
+class FastListSerializer:
+    """
+    Сериализатор списков только для чтения на основе строк .values().
+
+    Поля объявляются атрибутами класса (FastField и его наследники) в порядке
+    вывода. Для каждого поля заранее собирается функция доступа к строке,
+    поэтому сериализация не проходит через поля и to_representation DRF.
+    Результат должен совпадать с выводом обычного сериализатора списка;
+    коды вариантов выбора заменяются названиями по колонкам, как в
+    ChoiceLabelsListSerializer. Параметры запроса fields и omit отбирают
+    поля и колонки так же, как SparseFieldsMixin.
+    """
+
+    fields = {}
+    choice_labels = None
+    multiple_choice_labels = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = {}
+        for base in reversed(cls.__mro__):
+            for name, value in vars(base).items():
+                if isinstance(value, FastField):
+                    value.bind(name)
+                    fields[name] = value
+        cls.fields = fields
+        cls.sources = get_sources(fields)
+
+    def __init__(self, context=None):
+        """Сериализатор с контекстом; параметры fields и omit сужают поля."""
+        self.context = context or {}
+        request = self.context.get("request")
+        if request is not None and has_sparse_fields(request):
+            self.fields = {
+                name: self.fields[name]
+                for name in get_sparse_fields(request, self.fields)
+            }
+            self.sources = get_sources(self.fields)
+
+    def get_values(self, queryset, extra=()):
+        """
+        Queryset строк для сериализации.
+
+        В строки попадают колонки полей, аннотации queryset и extra (например,
+        поля сортировки для курсорной пагинации).
+        """
+        names = dict.fromkeys((*self.sources, *queryset.query.annotations, *extra))
+        return queryset.prefetch_related(None).values(*names)
+
+    def to_representation(self, rows):
+        """Сериализация списка строк .values()."""
+        rows = list(rows)
+        accessors = [
+            (name, field.get_accessor(self, rows))
+            for name, field in self.fields.items()
+        ]
+        data = [{name: accessor(row) for name, accessor in accessors} for row in rows]
+        return render_choice_labels(
+            data, self.choice_labels, self.multiple_choice_labels
+        )
+
+
+def skill_stack_str(values):
+    """Строковое представление SkillStack по колонкам."""
+    name, skill_stack_time = values
+    return f"{name} - {skill_stack_time} года"
+
+
+def work_experience_str(values):
+    """Строковое представление WorkExperience по колонкам."""
+    organization, position = values
+    return f"{organization}, {position}"
+
+
+class VacanciesFastSerializer(FastListSerializer):
+    """Быстрый вариант VacanciesSerializer."""
+
+    id = FastField()
+    vacancy_title = FastField()
+    company = FastField("company__company_title")
+    required_experience = FastField()
+    employment_type = FastField()
+    schedule_work = FastField()
+    salary_range = FastMethodField("salary")
+    city = FastField()
+    skill_stack = FastPrefetchField(
+        SkillStack,
+        "vacancies",
+        "skill_stack__name",
+        "skill_stack_time",
+        to_representation=skill_stack_str,
+    )
+    deadline = FastField(to_representation=date.isoformat)
+    candidates_count = FastField()
+    vacancy_status = FastField()
+
+    choice_labels = {
+        "vacancy_status": VACANCY_STATUS_LABELS,
+        "required_experience": EXPERIENCE_LABELS,
+    }
+    multiple_choice_labels = {
+        "employment_type": EMPLOYMENT_TYPE_LABELS,
+        "schedule_work": SCHEDULE_WORK_LABELS,
+    }
+
+    def get_salary_range(self, row):
+        """Зарплата в виде {min, max}."""
+        return get_salary_dict(row["salary"])
+
+
+class ResumesFastSerializer(FastListSerializer):
+    """Быстрый вариант ResumesSerializer."""
+
+    applicant = FastField()
+    job_title = FastField()
+    work_experiences = FastPrefetchField(WorkExperience, "applicantresume", "id")
+    current_company = FastField()
+
+
+class CandidatesFastSerializer(FastListSerializer):
+    """Быстрый вариант CandidatesSerializer."""
+
+    id = FastField()
+    first_name = FastField()
+    last_name = FastField()
+    patronymic = FastField()
+    photo_thumbnail = FastFileField(Candidate._meta.get_field("photo_thumbnail"))
+    cur_position = FastField()
+    work_experiences = FastField()
+    last_job = FastField()
+    interview_status = FastField()
+    custom_status = FastField()
+    candidate_status = FastField()
+
+    choice_labels = {
+        "interview_status": INTERVIEW_STATUS_LABELS,
+        "work_experiences": EXPERIENCE_LABELS,
+        "candidate_status": CANDIDATE_STATUS_LABELS,
+    }
+
+
+class CompanyShortFastSerializer(FastListSerializer):
+    """Быстрый вариант CompanyShortSerializer."""
+
+    id = FastField()
+    company_title = FastField()
+    website = FastField()
+    logo_thumbnail = FastFileField(Company._meta.get_field("logo_thumbnail"))
+
+
+class AgendaFastSerializer(FastListSerializer):
+    """Быстрый вариант AgendaEventSerializer."""
+
+    id = FastField()
+    title = FastField()
+    start_date = FastField(to_representation=date.isoformat)
+    start_time = FastField(to_representation=time.isoformat)
+    end_date = FastField(to_representation=date.isoformat)
+    end_time = FastField(to_representation=time.isoformat)
+    description = FastField()
+    conference_link = FastField()
+    candidate = FastMethodField(
+        "candidate_id",
+        "candidate__first_name",
+        "candidate__last_name",
+        "candidate__patronymic",
+        "candidate__cur_position",
+        "candidate__vacancy_id",
+        "candidate__vacancy__vacancy_title",
+    )
+
+    def get_candidate(self, row):
+        """Краткая информация о кандидате."""
+        if row["candidate_id"] is None:
+            return None
+        return {
+            "id": row["candidate_id"],
+            "first_name": row["candidate__first_name"],
+            "last_name": row["candidate__last_name"],
+            "patronymic": row["candidate__patronymic"],
+            "cur_position": row["candidate__cur_position"],
+            "vacancy": row["candidate__vacancy_id"],
+            "vacancy_title": row["candidate__vacancy__vacancy_title"],
+        }
+
+
+class VacancyExportSerializer(FastListSerializer):
+    """Выгрузка вакансий в CSV и JSONL."""
+
+    id = FastField()
+    vacancy_title = FastField()
+    company = FastField("company__company_title")
+    city = FastField()
+    required_experience = FastField()
+    employment_type = FastField()
+    schedule_work = FastField()
+    education = FastField()
+    salary_range = FastMethodField("salary")
+    skill_stack = FastPrefetchField(
+        SkillStack,
+        "vacancies",
+        "skill_stack__name",
+        "skill_stack_time",
+        to_representation=skill_stack_str,
+    )
+    job_conditions = FastField()
+    job_responsibilities = FastField()
+    vacancy_status = FastField()
+    deadline = FastField(to_representation=date.isoformat)
+    pub_date = FastDateTimeField()
+    candidates_count = FastField()
+
+    choice_labels = {
+        **VacanciesFastSerializer.choice_labels,
+        "education": EDUCATION_LABELS,
+    }
+    multiple_choice_labels = VacanciesFastSerializer.multiple_choice_labels
+
+    def get_salary_range(self, row):
+        """Зарплата в виде {min, max}."""
+        return get_salary_dict(row["salary"])
+
+
+class CandidateExportSerializer(FastListSerializer):
+    """Выгрузка кандидатов в CSV и JSONL."""
+
+    id = FastField()
+    last_name = FastField()
+    first_name = FastField()
+    patronymic = FastField()
+    bday = FastField(to_representation=date.isoformat)
+    city = FastField()
+    phone_number = FastField()
+    email = FastField()
+    telegram = FastField()
+    portfolio = FastField()
+    last_job = FastField()
+    cur_position = FastField()
+    salary_expectations = FastMethodField("salary_expectations")
+    employment_type = FastField()
+    schedule_work = FastField()
+    work_experiences = FastField()
+    education = FastField()
+    candidate_status = FastField()
+    interview_status = FastField()
+    custom_status = FastField()
+    pub_date = FastDateTimeField()
+
+    choice_labels = {
+        **CandidatesFastSerializer.choice_labels,
+        "education": EDUCATION_LABELS,
+    }
+    multiple_choice_labels = {
+        "employment_type": EMPLOYMENT_TYPE_LABELS,
+        "schedule_work": SCHEDULE_WORK_LABELS,
+    }
+
+    def get_salary_expectations(self, row):
+        """Ожидаемая зарплата в виде {min, max}."""
+        return get_salary_dict(row["salary_expectations"])
+
+
+class ResumeExportSerializer(FastListSerializer):
+    """Выгрузка резюме в CSV и JSONL."""
+
+    id = FastField()
+    applicant = FastField()
+    job_title = FastField()
+    current_company = FastField()
+    current_job = FastField()
+    town = FastField()
+    citizenship = FastField()
+    bday = FastField(to_representation=date.isoformat)
+    phone_number = FastField()
+    education = FastField()
+    employment_type = FastField()
+    schedule_work = FastField()
+    salary_expectations = FastMethodField("salary_expectations")
+    working_trip = FastField()
+    work_experiences = FastPrefetchField(
+        WorkExperience,
+        "applicantresume",
+        "organization",
+        "position",
+        to_representation=work_experience_str,
+    )
+    about_me = FastField()
+    pub_date = FastDateTimeField()
+
+    choice_labels = {"education": EDUCATION_LABELS}
+    multiple_choice_labels = CandidateExportSerializer.multiple_choice_labels
+
+    def get_salary_expectations(self, row):
+        """Ожидаемая зарплата в виде {min, max}."""
+        return get_salary_dict(row["salary_expectations"])
@@ -1,9 +1,14 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import DecimalField, F
+from django.db.models.functions import Cast
 from django_filters import (
+    BaseRangeFilter,
     BooleanFilter,
     CharFilter,
     ChoiceFilter,
     FilterSet,
     MultipleChoiceFilter,
+    NumberFilter,
     filters,
 )
 from recruitment.constants import (
@@ -16,6 +21,130 @@ from recruitment.constants import (
     VACANCY_STATUS,
 )
 from recruitment.models import ApplicantResume, Candidate, Vacancy
+from recruitment.salary import salary_to_range
+from recruitment.search import SEARCH_CONFIG
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    Полнотекстовый поиск PostgreSQL по полю search_vector.
+
+    Заменяет SearchFilter: вместо icontains по каждому полю выполняется один
+    поиск по GIN-индексу. Результаты сортируются по релевантности, если в
+    запросе не указан параметр ordering.
+
+    Релевантность приводится к numeric с rank_decimal_places знаками: она
+    служит позицией курсора пагинации, а значение float4 не восстанавливается
+    точно из строки, и страницы повторялись бы или теряли строки.
+    """
+
+    search_vector_field = "search_vector"
+    rank_field = "search_rank"
+    rank_decimal_places = 6
+
+    def get_search_query(self, request):
+        """Возвращает поисковый запрос или None, если поиск не задан."""
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return None
+        return SearchQuery(
+            " ".join(search_terms), config=SEARCH_CONFIG, search_type="websearch"
+        )
+
+    def get_rank_ordering(self, request, view):
+        """
+        Сортировка по релевантности для текущего запроса.
+
+        Возвращает None, если поиск не задан или сортировка указана явно.
+        """
+        if api_settings.ORDERING_PARAM in request.query_params:
+            return None
+        if self.get_search_query(request) is None:
+            return None
+        return (f"-{self.rank_field}", "-id")
+
+    def filter_queryset(self, request, queryset, view):
+        """Фильтрация queryset по поисковому запросу."""
+        search_query = self.get_search_query(request)
+        if search_query is None:
+            return queryset
+        rank = Cast(
+            SearchRank(F(self.search_vector_field), search_query),
+            DecimalField(max_digits=12, decimal_places=self.rank_decimal_places),
+        )
+        queryset = queryset.filter(**{self.search_vector_field: search_query}).annotate(
+            **{self.rank_field: rank}
+        )
+        rank_ordering = self.get_rank_ordering(request, view)
+        if not rank_ordering:
+            return queryset
+        return queryset.order_by(*rank_ordering)
+
+    def get_schema_operation_parameters(self, view):
+        """Описание параметра поиска для документации API."""
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": str(self.search_description),
+                "schema": {"type": "string"},
+            },
+        ]
+
+
+class TrigramContainsFilter(CharFilter):
+    """
+    Фильтр подстроки без учета регистра по триграммному индексу.
+
+    Использует лукап trgm_icontains (ILIKE) вместо icontains, чтобы запрос
+    обслуживался GIN-индексом gin_trgm_ops, а не полным сканированием таблицы.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Фильтр с лукапом trgm_icontains по умолчанию."""
+        kwargs.setdefault("lookup_expr", "trgm_icontains")
+        super().__init__(*args, **kwargs)
+
+
+class SalaryRangeFilter(BaseRangeFilter, NumberFilter):
+    """
+    Фильтр по диапазону зарплаты вида ?salary_overlap=100000,150000.
+
+    Работает с полем salary_band, поэтому запрос обслуживается GiST-индексом.
+    lookup_expr: overlap -- диапазоны пересекаются, contained_by -- диапазон
+    объекта целиком лежит внутри указанного.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Фильтр по полю salary_band по умолчанию."""
+        kwargs.setdefault("field_name", "salary_band")
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        """Фильтрация queryset по диапазону с включенными границами."""
+        if value:
+            value = salary_to_range([int(bound) for bound in value])
+        return super().filter(qs, value)
+
+
+class ChoiceArrayFilter(MultipleChoiceFilter):
+    """
+    Фильтр по вариантам множественного выбора, хранящимся в массиве.
+
+    Выбранные варианты проверяются одним оператором массива: && (хотя бы
+    один вариант) или @> при conjoined=True (все варианты), что позволяет
+    использовать GIN-индекс поля.
+    """
+
+    def filter(self, qs, value):
+        """Фильтрация queryset по выбранным вариантам."""
+        if not value or self.is_noop(qs, value):
+            return qs
+        lookup = "contains" if self.conjoined else "overlap"
+        return self.get_method(qs)(**{f"{self.field_name}__{lookup}": list(value)})
 
 
 class BaseFilterSet(FilterSet):
@@ -24,12 +153,12 @@ class BaseFilterSet(FilterSet):
     salary_expectations = filters.BaseCSVFilter(
         field_name="salary_expectations", lookup_expr="contains"
     )
-    employment_type = MultipleChoiceFilter(
-        field_name="employment_type", choices=EMPLOYMENT_TYPE, lookup_expr="contains"
-    )
-    schedule_work = MultipleChoiceFilter(
-        field_name="schedule_work", choices=SCHEDULE_WORK, lookup_expr="contains"
+    salary_expectations_overlap = SalaryRangeFilter(lookup_expr="overlap")
+    salary_expectations_within = SalaryRangeFilter(lookup_expr="contained_by")
+    employment_type = ChoiceArrayFilter(
+        field_name="employment_type", choices=EMPLOYMENT_TYPE
     )
+    schedule_work = ChoiceArrayFilter(field_name="schedule_work", choices=SCHEDULE_WORK)
     education = ChoiceFilter(field_name="education", choices=EDUCATION)
     work_experiences = ChoiceFilter(field_name="work_experiences", choices=EXPERIENCE)
     interview_status = ChoiceFilter(
@@ -39,6 +168,8 @@ class BaseFilterSet(FilterSet):
     class Meta:
         fields = [
             "salary_expectations",
+            "salary_expectations_overlap",
+            "salary_expectations_within",
             "employment_type",
             "schedule_work",
             "education",
@@ -51,12 +182,12 @@ class VacancyFilterSet(FilterSet):
     """Кастомный фильтр для вакансий."""
 
     salary = filters.BaseCSVFilter(field_name="salary", lookup_expr="contains")
-    employment_type = MultipleChoiceFilter(
-        field_name="employment_type", choices=EMPLOYMENT_TYPE, lookup_expr="contains"
-    )
-    schedule_work = MultipleChoiceFilter(
-        field_name="schedule_work", choices=SCHEDULE_WORK, lookup_expr="contains"
+    salary_overlap = SalaryRangeFilter(lookup_expr="overlap")
+    salary_within = SalaryRangeFilter(lookup_expr="contained_by")
+    employment_type = ChoiceArrayFilter(
+        field_name="employment_type", choices=EMPLOYMENT_TYPE
     )
+    schedule_work = ChoiceArrayFilter(field_name="schedule_work", choices=SCHEDULE_WORK)
     vacancy_status = ChoiceFilter(field_name="vacancy_status", choices=VACANCY_STATUS)
     required_experience = ChoiceFilter(
         field_name="required_experience", choices=EXPERIENCE
@@ -65,12 +196,14 @@ class VacancyFilterSet(FilterSet):
         field_name="company",
         lookup_expr="exact",
     )
-    city = CharFilter(lookup_expr="icontains")
+    city = TrigramContainsFilter()
 
     class Meta:
         model = Vacancy
         fields = [
             "salary",
+            "salary_overlap",
+            "salary_within",
             "vacancy_title",
             "author",
             "company",
@@ -89,8 +222,8 @@ class ResumeFilterSet(BaseFilterSet):
     """Кастомный фильтр для резюме."""
 
     working_trip = BooleanFilter(field_name="working_trip")
-    town = CharFilter(lookup_expr="icontains")
-    job_title = CharFilter(lookup_expr="icontains")
+    town = TrigramContainsFilter()
+    job_title = TrigramContainsFilter()
 
     class Meta:
         model = ApplicantResume
@@ -110,10 +243,14 @@ class CandidatesFilterSet(BaseFilterSet):
     candidate_status = ChoiceFilter(
         field_name="candidate_status", choices=CANDIDATE_STATUS
     )
-    first_name = CharFilter(lookup_expr="icontains")
-    last_name = CharFilter(lookup_expr="icontains")
-    city = CharFilter(lookup_expr="icontains")
-    last_job = CharFilter(lookup_expr="icontains")
+    first_name = TrigramContainsFilter()
+    last_name = TrigramContainsFilter()
+    city = TrigramContainsFilter()
+    last_job = TrigramContainsFilter()
+    resume_q = CharFilter(
+        method="filter_resume_q",
+        label="Полнотекстовый поиск по тексту резюме",
+    )
 
     class Meta:
         model = Candidate
@@ -128,4 +265,18 @@ class CandidatesFilterSet(BaseFilterSet):
             "bday",
             "custom_status",
             "candidate_status",
+            "resume_q",
         ]
+
+    def filter_resume_q(self, queryset, name, value):
+        """
+        Поиск по тексту резюме, извлеченному командой extract_resume_texts.
+
+        Учитывается только текст текущего файла резюме кандидата.
+        """
+        return queryset.filter(
+            resume_text__search_vector=SearchQuery(
+                value, config=SEARCH_CONFIG, search_type="websearch"
+            ),
+            resume_text__file_name=F("resume"),
+        )
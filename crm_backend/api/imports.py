@@ -0,0 +1,181 @@
+import csv
+import io
+from datetime import date, datetime
+from itertools import islice
+from pathlib import Path
+
+from django.db import transaction
+from recruitment.dashboard import invalidate_vacancy_summary
+from recruitment.models import Candidate
+from recruitment.search import update_search_vectors
+from rest_framework.exceptions import ValidationError
+
+from .cache import bump_model_version
+from .constants import IMPORT_CHUNK_SIZE, IMPORT_MAX_ERRORS
+from .serializers import CandidateImportSerializer
+
+
+def iter_csv_rows(file):
+    """Строки CSV-файла в виде словарей; файл читается построчно."""
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        yield from csv.DictReader(text)
+    finally:
+        text.detach()
+
+
+def iter_xlsx_rows(file):
+    """
+    Строки первого листа XLSX-файла в виде словарей.
+
+    Книга открывается в режиме read_only: openpyxl читает лист потоково и
+    не держит в памяти все ячейки.
+    """
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValidationError("Для импорта XLSX нужен пакет openpyxl.")
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(name).strip() for name in next(rows, ()) if name is not None]
+        for row in rows:
+            yield dict(zip(header, row))
+    finally:
+        workbook.close()
+
+
+ROW_READERS = {
+    ".csv": iter_csv_rows,
+    ".xlsx": iter_xlsx_rows,
+}
+
+
+def iter_rows(file, name):
+    """Строки файла импорта; формат определяется по расширению имени."""
+    reader = ROW_READERS.get(Path(name).suffix.lower())
+    if reader is None:
+        raise ValidationError(
+            f"Поддерживаются файлы {', '.join(ROW_READERS)}, получен {name}."
+        )
+    return reader(file)
+
+
+def clean_value(value):
+    """Значение ячейки в виде строки для полей сериализатора."""
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value).strip()
+
+
+def clean_row(row, multiple_choice_fields):
+    """
+    Данные строки для CandidateImportSerializer.
+
+    Пустые ячейки пропускаются, коды множественного выбора разделяются
+    запятыми ("PO,CH").
+    """
+    data = {}
+    for name, value in row.items():
+        if name is None or value is None:
+            continue
+        value = clean_value(value)
+        if not value:
+            continue
+        if name in multiple_choice_fields:
+            value = [code.strip() for code in value.split(",") if code.strip()]
+        data[name] = value
+    return data
+
+
+class CandidateImport:
+    """
+    Импорт кандидатов на вакансию из CSV или XLSX.
+
+    Строки читаются из файла потоково и обрабатываются пачками по
+    chunk_size: каждая строка проверяется правилами CandidateSerializer
+    (один экземпляр сериализатора на весь импорт), уникальность почты
+    проверяется одним запросом на пачку, а корректные строки сохраняются
+    одним bulk_create. В памяти одновременно находится только одна пачка,
+    поэтому размер файла не ограничен памятью процесса.
+
+    После run() доступны created -- число созданных кандидатов,
+    error_count -- число строк с ошибками и errors -- первые
+    IMPORT_MAX_ERRORS ошибок вида {"row": номер строки, "errors": {...}}.
+    Номер строки считается как в таблице: заголовок -- строка 1.
+    """
+
+    def __init__(self, vacancy, chunk_size=IMPORT_CHUNK_SIZE):
+        """Импорт в вакансию vacancy пачками по chunk_size строк."""
+        self.vacancy = vacancy
+        self.chunk_size = chunk_size
+        self.serializer = CandidateImportSerializer()
+        self.multiple_choice_fields = self.serializer.multiple_choice_fields
+        self.created = 0
+        self.error_count = 0
+        self.errors = []
+
+    def run(self, rows):
+        """Импорт строк; возвращает self для чтения итогов."""
+        rows = enumerate(rows, start=2)
+        while chunk := list(islice(rows, self.chunk_size)):
+            self.import_chunk(chunk)
+        return self
+
+    def add_error(self, number, errors):
+        """Запись ошибки строки."""
+        self.error_count += 1
+        if len(self.errors) < IMPORT_MAX_ERRORS:
+            self.errors.append({"row": number, "errors": errors})
+
+    def validate_chunk(self, chunk):
+        """Проверенные данные пачки в виде списка (номер строки, данные)."""
+        valid = []
+        for number, row in chunk:
+            try:
+                data = self.serializer.run_validation(
+                    clean_row(row, self.multiple_choice_fields)
+                )
+            except ValidationError as error:
+                self.add_error(number, error.detail)
+            else:
+                valid.append((number, data))
+        return valid
+
+    def import_chunk(self, chunk):
+        """Проверка и сохранение одной пачки строк."""
+        valid = self.validate_chunk(chunk)
+        existing = set(
+            Candidate.objects.filter(
+                email__in=[data["email"] for _, data in valid]
+            ).values_list("email", flat=True)
+        )
+        candidates = []
+        for number, data in valid:
+            if data["email"] in existing:
+                self.add_error(
+                    number, {"email": ["Кандидат с такой почтой уже существует."]}
+                )
+                continue
+            existing.add(data["email"])
+            candidates.append(Candidate(vacancy=self.vacancy, **data))
+        with transaction.atomic():
+            created = Candidate.objects.bulk_create(candidates)
+            update_search_vectors(
+                Candidate.objects.filter(id__in=[candidate.id for candidate in created])
+            )
+            vacancy_id = self.vacancy.id
+            transaction.on_commit(lambda: invalidate_vacancy_summary(vacancy_id))
+            transaction.on_commit(lambda: bump_model_version(Candidate))
+        self.created += len(created)
+
+    @property
+    def report(self):
+        """Итоги импорта для ответа API и вывода команды."""
+        return {
+            "created": self.created,
+            "error_count": self.error_count,
+            "errors": self.errors,
+        }
@@ -0,0 +1,123 @@
+import random
+import statistics
+import time
+from datetime import date
+from types import SimpleNamespace
+
+from api.filters import FullTextSearchFilter
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from recruitment.models import Candidate, Company, Vacancy
+from recruitment.search import update_search_vectors
+from rest_framework.filters import SearchFilter
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from users.models import User
+
+FIRST_NAMES = ("Иван", "Петр", "Анна", "Мария", "Олег", "Светлана", "Дмитрий")
+LAST_NAMES = ("Иванов", "Петров", "Сидоров", "Смирнов", "Кузнецов", "Попов")
+CITIES = ("Москва", "Казань", "Самара", "Волгоград", "Пермь", "Томск")
+POSITIONS = ("Разработчик", "Аналитик", "Тестировщик", "Дизайнер", "Менеджер")
+SEARCH_TERMS = ("Петров", "Разработчик", "Казань", "аналитики", "Светлана Попов")
+
+# Поля поиска SearchFilter, которые использовал CandidateViewSet до перехода
+# на полнотекстовый поиск.
+ICONTAINS_SEARCH_FIELDS = (
+    "first_name",
+    "last_name",
+    "city",
+    "candidate_status",
+    "last_job",
+    "cur_position",
+    "phone_number",
+    "email",
+    "telegram",
+    "employment_type",
+    "schedule_work",
+    "education",
+    "interview_status",
+)
+
+
+class Command(BaseCommand):
+    """Сравнение SearchFilter и полнотекстового поиска на кандидатах."""
+
+    help = (
+        "Создает кандидатов во временной транзакции и сравнивает время поиска "
+        "SearchFilter (icontains) и FullTextSearchFilter (GIN)."
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument("--candidates", type=int, default=1_000_000)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--page-size", type=int, default=50)
+
+    def handle(self, *args, **options):
+        """Запуск бенчмарка в транзакции, которая откатывается в конце."""
+        with transaction.atomic():
+            self.create_fixture(options["candidates"], options["batch_size"])
+            backends = {
+                "SearchFilter (icontains)": (
+                    SearchFilter(),
+                    SimpleNamespace(search_fields=ICONTAINS_SEARCH_FIELDS),
+                ),
+                "FullTextSearchFilter": (FullTextSearchFilter(), SimpleNamespace()),
+            }
+            for term in SEARCH_TERMS:
+                for name, (backend, view) in backends.items():
+                    timings = self.measure(
+                        backend, view, term, options["repeat"], options["page_size"]
+                    )
+                    self.stdout.write(
+                        f"{term!r:20} {name:26} "
+                        f"median {statistics.median(timings) * 1000:9.2f} ms, "
+                        f"max {max(timings) * 1000:9.2f} ms"
+                    )
+            transaction.set_rollback(True)
+
+    def create_fixture(self, count, batch_size):
+        """Создание кандидатов и расчет поисковых векторов."""
+        started = time.perf_counter()
+        author = User.objects.create_user("benchmark@example.com", "benchmark")
+        company = Company.objects.create(
+            company_title="Benchmark", website="https://example.com"
+        )
+        vacancy = Vacancy.objects.create(
+            company=company,
+            author=author,
+            vacancy_title="Benchmark",
+            city="Москва",
+            vacancy_status="A",
+        )
+        for offset in range(0, count, batch_size):
+            Candidate.objects.bulk_create(
+                Candidate(
+                    first_name=random.choice(FIRST_NAMES),
+                    last_name=random.choice(LAST_NAMES),
+                    bday=date(1990, 1, 1),
+                    city=random.choice(CITIES),
+                    cur_position=random.choice(POSITIONS),
+                    email=f"benchmark{number}@example.com",
+                    vacancy=vacancy,
+                )
+                for number in range(offset, min(offset + batch_size, count))
+            )
+        update_search_vectors(Candidate.objects.filter(vacancy=vacancy))
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Candidate._meta.db_table}")
+        self.stdout.write(
+            f"Создано кандидатов: {count} за {time.perf_counter() - started:.1f} c"
+        )
+
+    def measure(self, backend, view, term, repeat, page_size):
+        """Время получения первой страницы результатов поиска."""
+        request = Request(APIRequestFactory().get("/", {"search": term}))
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            queryset = backend.filter_queryset(request, Candidate.objects.all(), view)
+            list(queryset[:page_size])
+            timings.append(time.perf_counter() - started)
+        return timings
@@ -0,0 +1,167 @@
+import random
+import statistics
+import time
+from unittest.mock import patch
+
+from api.pagination import ListCursorPagination
+from api.serializers import VacanciesSerializer
+from api.views import VacancyViewSet
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from recruitment.constants import (
+    EMPLOYMENT_TYPE,
+    EXPERIENCE,
+    SCHEDULE_WORK,
+    VACANCY_STATUS,
+)
+from recruitment.models import Company, Vacancy
+from rest_framework.serializers import ListSerializer, SerializerMethodField
+from rest_framework.test import APIRequestFactory, force_authenticate
+from users.models import User
+
+
+def legacy_display_values(keys, choices):
+    """get_display_values до перехода на таблицы названий."""
+    if keys:
+        return [dict(choices).get(key) for key in keys]
+    return [None]
+
+
+class LegacyVacanciesSerializer(VacanciesSerializer):
+    """VacanciesSerializer с названиями через SerializerMethodField."""
+
+    schedule_work = SerializerMethodField()
+    employment_type = SerializerMethodField()
+    vacancy_status = SerializerMethodField()
+    required_experience = SerializerMethodField()
+
+    class Meta(VacanciesSerializer.Meta):
+        list_serializer_class = ListSerializer
+        choice_labels = None
+        multiple_choice_labels = None
+
+    def get_schedule_work(self, obj):
+        """Названия графиков работы."""
+        return legacy_display_values(obj.schedule_work, SCHEDULE_WORK)
+
+    def get_employment_type(self, obj):
+        """Названия типов занятости."""
+        return legacy_display_values(obj.employment_type, EMPLOYMENT_TYPE)
+
+    def get_vacancy_status(self, obj):
+        """Название статуса вакансии."""
+        return legacy_display_values(obj.vacancy_status, VACANCY_STATUS)[0]
+
+    def get_required_experience(self, obj):
+        """Название требуемого опыта."""
+        return legacy_display_values(obj.required_experience, EXPERIENCE)[0]
+
+
+class Command(BaseCommand):
+    """Сравнение стоимости сериализации списка вакансий."""
+
+    help = (
+        "Создает вакансии во временной транзакции и измеряет время "
+        "сериализации списка на строку: названия вариантов выбора через "
+        "SerializerMethodField и dict(choices) против таблиц названий с "
+        "заменой по колонкам. Затем сравнивает скорость получения страницы "
+        "списка вакансий целиком (строк в секунду) через обычный "
+        "сериализатор и FastListSerializer."
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument("--vacancies", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        """Запуск бенчмарка в транзакции, которая откатывается в конце."""
+        with transaction.atomic():
+            vacancies = self.create_fixture(options["vacancies"])
+            serializers = {
+                "SerializerMethodField + dict(choices)": LegacyVacanciesSerializer,
+                "таблицы названий по колонкам": VacanciesSerializer,
+            }
+            results = {
+                name: serializer(vacancies, many=True).data
+                for name, serializer in serializers.items()
+            }
+            if len({repr(data) for data in results.values()}) != 1:
+                self.stderr.write("Результаты сериализаторов различаются")
+            for name, serializer in serializers.items():
+                timings = self.measure(serializer, vacancies, options["repeat"])
+                per_row = statistics.median(timings) / len(vacancies) * 1_000_000
+                self.stdout.write(
+                    f"{name:40} median {statistics.median(timings) * 1000:9.2f} ms, "
+                    f"{per_row:7.2f} мкс/строка"
+                )
+            self.measure_pages(vacancies[0].author, len(vacancies), options["repeat"])
+            transaction.set_rollback(True)
+
+    def create_fixture(self, count):
+        """Создание вакансий и загрузка списка с зависимыми объектами."""
+        author = User.objects.create_user("benchmark@example.com", "benchmark")
+        company = Company.objects.create(
+            company_title="Benchmark", website="https://example.com"
+        )
+        Vacancy.objects.bulk_create(
+            Vacancy(
+                company=company,
+                author=author,
+                vacancy_title=f"Вакансия {number}",
+                city="Москва",
+                vacancy_status=random.choice(VACANCY_STATUS)[0],
+                required_experience=random.choice(EXPERIENCE)[0],
+                employment_type=random.sample([key for key, _ in EMPLOYMENT_TYPE], 2),
+                schedule_work=random.sample([key for key, _ in SCHEDULE_WORK], 2),
+                salary=[100_000, 150_000],
+            )
+            for number in range(count)
+        )
+        return list(
+            Vacancy.objects.filter(author=author)
+            .select_related("author", "company")
+            .prefetch_related("skill_stack__skill_stack")
+            .annotate(candidates_count=Count("candidates"))
+        )
+
+    def measure_pages(self, author, count, repeat):
+        """Скорость получения страницы списка вакансий через вьюсет."""
+        request = APIRequestFactory().get(
+            "/", {"page_size": count}, HTTP_HOST=settings.ALLOWED_HOSTS[0]
+        )
+        force_authenticate(request, author)
+        view = VacancyViewSet.as_view({"get": "list"})
+        fast_serializer = VacancyViewSet.fast_list_serializer_class
+        contents = {}
+        for name, serializer in (
+            ("VacanciesSerializer", None),
+            ("VacanciesFastSerializer", fast_serializer),
+        ):
+            timings = []
+            with patch.object(
+                ListCursorPagination, "max_page_size", count
+            ), patch.object(VacancyViewSet, "fast_list_serializer_class", serializer):
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    response = view(request).render()
+                    timings.append(time.perf_counter() - started)
+            contents[name] = response.content
+            self.stdout.write(
+                f"страница {count} строк, {name:24} "
+                f"median {statistics.median(timings) * 1000:9.2f} ms, "
+                f"{count / statistics.median(timings):10.0f} строк/с"
+            )
+        if len(set(contents.values())) != 1:
+            self.stderr.write("Ответы сериализаторов различаются")
+
+    def measure(self, serializer, vacancies, repeat):
+        """Время сериализации списка вакансий."""
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            serializer(vacancies, many=True).data
+            timings.append(time.perf_counter() - started)
+        return timings
@@ -0,0 +1,125 @@
+import base64
+import io
+import os
+import tempfile
+from pathlib import Path
+
+from api.views import CandidateViewSet
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+from PIL import Image
+from recruitment.models import Company, Vacancy
+from rest_framework.test import APIRequestFactory, force_authenticate
+from users.models import User
+
+PROC_STATUS = Path("/proc/self/status")
+PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+CANDIDATE = {
+    "first_name": "Иван",
+    "last_name": "Петров",
+    "bday": "1990-01-01",
+    "city": "Москва",
+    "email": "benchmark@example.com",
+    "employment_type": ["PO"],
+    "schedule_work": ["U"],
+    "work_experiences": "2",
+    "education": "SR",
+    "candidate_status": "A",
+}
+
+
+def read_memory(name):
+    """Значение VmRSS или VmHWM процесса в байтах."""
+    for line in PROC_STATUS.read_text().splitlines():
+        if line.startswith(f"{name}:"):
+            return int(line.split()[1]) * 1024
+    raise CommandError(f"В {PROC_STATUS} нет {name}.")
+
+
+class Command(BaseCommand):
+    """Замер пиковой памяти при загрузке резюме."""
+
+    help = (
+        "Создает кандидата с резюме PDF размером --size-mb, переданным в base64 "
+        "(JSON) и файлом multipart, и выводит прирост пикового RSS процесса "
+        "за время обработки запроса. Кандидаты создаются во временной "
+        "транзакции, файлы сохраняются во временный MEDIA_ROOT. Работает "
+        "только в Linux: пик RSS сбрасывается через /proc/self/clear_refs."
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument("--size-mb", type=int, default=20)
+
+    def handle(self, *args, **options):
+        """Запуск замеров."""
+        if not PROC_CLEAR_REFS.exists():
+            raise CommandError("Замер пикового RSS доступен только в Linux.")
+        content = b"%PDF-1.4\n" + os.urandom(options["size_mb"] * 1024**2)
+        self.stdout.write(f"Размер PDF: {len(content) / 1024**2:.1f} МБ")
+        with tempfile.TemporaryDirectory() as media_root, override_settings(
+            MEDIA_ROOT=media_root, ALLOWED_HOSTS=["testserver"]
+        ), transaction.atomic():
+            user = User.objects.create_user("benchmark@example.com", "password")
+            company = Company.objects.create(
+                company_title="Benchmark", website="https://example.com"
+            )
+            vacancy = Vacancy.objects.create(
+                company=company,
+                author=user,
+                vacancy_title="Benchmark",
+                city="Москва",
+            )
+            factory = APIRequestFactory()
+            url = f"/api/vacancies/{vacancy.id}/candidates/"
+            photo = self.photo()
+            encoded = base64.b64encode(content).decode()
+            requests = {
+                "base64": factory.post(
+                    url,
+                    {
+                        **CANDIDATE,
+                        "resume": f"data:application/pdf;base64,{encoded}",
+                        "photo": base64.b64encode(photo).decode(),
+                    },
+                    format="json",
+                ),
+                "multipart": factory.post(
+                    url,
+                    {
+                        **CANDIDATE,
+                        "resume": SimpleUploadedFile(
+                            "resume.pdf", content, "application/pdf"
+                        ),
+                        "photo": SimpleUploadedFile("photo.png", photo, "image/png"),
+                    },
+                    format="multipart",
+                ),
+            }
+            del encoded
+            for name, request in requests.items():
+                self.measure(name, request, user, vacancy)
+            transaction.set_rollback(True)
+
+    def photo(self):
+        """Небольшое изображение PNG для обязательного поля photo."""
+        file = io.BytesIO()
+        Image.new("RGB", (64, 64)).save(file, "PNG")
+        return file.getvalue()
+
+    def measure(self, name, request, user, vacancy):
+        """Обработка запроса с замером прироста пикового RSS."""
+        force_authenticate(request, user)
+        view = CandidateViewSet.as_view({"post": "create"})
+        with transaction.atomic():
+            PROC_CLEAR_REFS.write_text("5")
+            before = read_memory("VmRSS")
+            response = view(request, vacancy_id=vacancy.id)
+            peak = read_memory("VmHWM") - before
+            request.close()
+            transaction.set_rollback(True)
+        if response.status_code != 201:
+            raise CommandError(f"{name}: {response.status_code} {response.data}")
+        self.stdout.write(f"{name:10} пик RSS +{peak / 1024**2:.1f} МБ")
@@ -0,0 +1,41 @@
+from api.constants import IMPORT_CHUNK_SIZE
+from api.imports import CandidateImport, iter_rows
+from django.core.management.base import BaseCommand, CommandError
+from recruitment.models import Vacancy
+from rest_framework.exceptions import ValidationError
+
+
+class Command(BaseCommand):
+    """Импорт кандидатов на вакансию из CSV или XLSX."""
+
+    help = (
+        "Создает кандидатов на вакансию из CSV или XLSX файла пачками по "
+        "--chunk-size строк и выводит ошибки строк. Заголовки столбцов -- "
+        "имена полей кандидата, коды множественного выбора перечисляются "
+        "через запятую."
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument("vacancy_id", type=int)
+        parser.add_argument("path")
+        parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        """Запуск импорта."""
+        try:
+            vacancy = Vacancy.objects.get(pk=options["vacancy_id"])
+        except Vacancy.DoesNotExist:
+            raise CommandError(f"Вакансия {options['vacancy_id']} не найдена.")
+        candidate_import = CandidateImport(vacancy, options["chunk_size"])
+        with open(options["path"], "rb") as file:
+            try:
+                candidate_import.run(iter_rows(file, options["path"]))
+            except ValidationError as error:
+                raise CommandError(error.detail[0])
+        for error in candidate_import.errors:
+            self.stderr.write(f"Строка {error['row']}: {error['errors']}")
+        self.stdout.write(
+            f"Создано кандидатов: {candidate_import.created}, "
+            f"строк с ошибками: {candidate_import.error_count}"
+        )
@@ -0,0 +1,112 @@
+import re
+
+from api.urls import router
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.filters import OrderingFilter
+from rest_framework.generics import GenericAPIView
+
+URL_KWARG_REGEX = re.compile(r"\(\?P<(\w+)>")
+# Параметры URL, имя которых не совпадает с колонкой внешнего ключа.
+URL_KWARG_FIELDS = {"funnel_id": "stage"}
+
+
+class Command(BaseCommand):
+    """Отчет о составных индексах для queryset вьюсетов API."""
+
+    help = (
+        "Проверяет, что для каждого вьюсета API есть индекс вида "
+        "(внешний ключ, поля сортировки). Внешний ключ определяется по "
+        "параметру URL (candidate_id -> candidate, funnel_id -> stage), а "
+        "для вьюсетов без параметров -- по ключам на модель пользователя, "
+        "если queryset ограничен в get_queryset. Параметр URL без внешнего "
+        "ключа считается недостающим индексом."
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument(
+            "--fail",
+            action="store_true",
+            help="Завершиться с ошибкой, если найдены недостающие индексы.",
+        )
+
+    def handle(self, *args, **options):
+        """Проверка индексов всех зарегистрированных вьюсетов."""
+        missing = 0
+        for prefix, viewset, basename in router.registry:
+            view = viewset(action="list", kwargs={})
+            model = view.get_serializer_class().Meta.model
+            ordering = self.get_ordering(view, model)
+            try:
+                filter_fields = self.get_filter_fields(prefix, viewset, model)
+            except LookupError as error:
+                missing += 1
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"UNKNOWN  {basename}: {model._meta.label} {error}"
+                    )
+                )
+                continue
+            for field in filter_fields:
+                columns = [field.name, *ordering]
+                index = self.find_index(model, columns)
+                label = f"{basename}: {model._meta.label}({', '.join(columns)})"
+                if index:
+                    self.stdout.write(f"OK       {label} -> {index}")
+                else:
+                    missing += 1
+                    self.stdout.write(self.style.WARNING(f"MISSING  {label}"))
+        if missing and options["fail"]:
+            raise CommandError(f"Недостающих индексов: {missing}")
+
+    def get_ordering(self, view, model):
+        """Поля сортировки списка без направления сортировки."""
+        if OrderingFilter in getattr(view, "filter_backends", ()):
+            ordering = list(view.ordering or model._meta.ordering)
+        else:
+            ordering = list(model._meta.ordering)
+        pagination_class = getattr(view, "pagination_class", None)
+        if pagination_class and hasattr(pagination_class, "get_ordering"):
+            if not {"id", "-id", "pk", "-pk"}.intersection(ordering):
+                ordering.append("id")
+        return [field.lstrip("-") for field in ordering]
+
+    def get_filter_fields(self, prefix, viewset, model):
+        """
+        Внешние ключи, по которым фильтруется queryset вьюсета.
+
+        Вьюсеты без параметров URL и без своего get_queryset не ограничены
+        пользователем, поэтому для них индекс не требуется. Если последний
+        параметр URL не соответствует внешнему ключу модели, выбрасывается
+        LookupError: такой вьюсет нельзя молча пропускать.
+        """
+        foreign_keys = [
+            field for field in model._meta.concrete_fields if field.many_to_one
+        ]
+        url_kwargs = URL_KWARG_REGEX.findall(prefix)
+        if url_kwargs:
+            kwarg = url_kwargs[-1]
+            fields = [
+                field
+                for field in foreign_keys
+                if field.name == URL_KWARG_FIELDS.get(kwarg) or field.attname == kwarg
+            ]
+            if not fields:
+                raise LookupError(f"нет внешнего ключа для параметра URL {kwarg}")
+            return fields
+        if viewset.get_queryset is GenericAPIView.get_queryset:
+            return []
+        return [
+            field
+            for field in foreign_keys
+            if field.related_model._meta.label == settings.AUTH_USER_MODEL
+        ]
+
+    def find_index(self, model, columns):
+        """Имя индекса, который начинается с указанных колонок."""
+        for index in model._meta.indexes:
+            fields = [field.lstrip("-") for field in index.fields]
+            if fields[: len(columns)] == columns:
+                return index.name
+        return None
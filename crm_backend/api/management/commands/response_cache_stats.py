@@ -0,0 +1,37 @@
+from api.cache import response_stats
+from api.mixins import CachedListMixin
+from api.urls import router
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """Счетчики попаданий и промахов кэша ответов списков."""
+
+    help = (
+        "Выводит для каждого кэшируемого вьюсета API количество ответов, "
+        "взятых из кэша, и промахов с долей попаданий."
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Обнулить счетчики после вывода.",
+        )
+
+    def handle(self, *args, **options):
+        """Вывод счетчиков кэша ответов."""
+        basenames = [
+            basename
+            for _, viewset, basename in router.registry
+            if issubclass(viewset, CachedListMixin)
+        ]
+        stats = response_stats(basenames, reset=options["reset"])
+        for basename, counters in stats.items():
+            total = counters["hits"] + counters["misses"]
+            ratio = counters["hits"] / total if total else 0
+            self.stdout.write(
+                f"{basename}: hits={counters['hits']} "
+                f"misses={counters['misses']} hit_ratio={ratio:.1%}"
+            )
@@ -0,0 +1,306 @@
+import hashlib
+from calendar import timegm
+from datetime import datetime, time
+
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.decorators import action
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from .cache import (
+    count_response,
+    get_cached_response,
+    response_cache_enabled,
+    response_cache_key,
+    response_etag,
+    set_cached_response,
+)
+from .constants import EXPORT_FORMATS
+from .exports import stream_export
+from .serializers import ExportParamsSerializer
+from .utils import has_sparse_fields
+
+
+class QueryPlanMixin:
+    """
+    Миксин для декларативной загрузки связанных объектов во вьюсетах.
+
+    Атрибут query_plan описывает для каждого действия вьюсета поля для
+    select_related и prefetch_related. Ключ "default" используется для
+    действий, которые не описаны явно:
+
+        query_plan = {
+            "list": {
+                "select_related": ("company",),
+                "prefetch_related": ("skill_stack__skill_stack",),
+            },
+        }
+
+    Если в запросе list или retrieve выбраны поля ответа (параметры fields
+    и omit, см. SparseFieldsMixin), queryset загружает через only() только
+    нужные им колонки, а связи, которые не попали в ответ, не загружаются.
+    """
+
+    query_plan = {}
+
+    def get_query_plan(self):
+        """Возвращает план загрузки связанных объектов для текущего действия."""
+        return self.query_plan.get(self.action, self.query_plan.get("default", {}))
+
+    def filter_queryset(self, queryset):
+        """Применение плана загрузки связанных объектов к queryset."""
+        plan = self.get_query_plan()
+        select_related = plan.get("select_related", ())
+        prefetch_related = plan.get("prefetch_related", ())
+        sources = self.get_sparse_sources(queryset)
+        if sources is not None:
+            select_related = get_used_lookups(select_related, sources)
+            prefetch_related = get_used_lookups(prefetch_related, sources)
+            queryset = queryset.only(*get_only_fields(queryset, sources))
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return super().filter_queryset(queryset)
+
+    def get_required_sources(self, queryset):
+        """Атрибуты модели, нужные вьюсету независимо от полей ответа."""
+        return get_ordering_fields(self, queryset)
+
+    def get_sparse_sources(self, queryset):
+        """
+        Атрибуты модели, которые читают выбранные поля ответа.
+
+        Возвращает None, если запрос не нужно сужать: поля не выбраны или
+        одно из полей читает атрибут, который не является полем модели или
+        аннотацией queryset и не описан в Meta.sparse_sources сериализатора.
+        """
+        if self.action not in ("list", "retrieve"):
+            return None
+        if not has_sparse_fields(self.request):
+            return None
+        serializer = self.get_serializer()
+        sparse_sources = getattr(serializer.Meta, "sparse_sources", {})
+        sources = set(self.get_required_sources(queryset))
+        for name, field in serializer.fields.items():
+            if field.source != "*":
+                sources.add(field.source.split(".")[0])
+            elif name in sparse_sources:
+                sources.update(sparse_sources[name])
+            else:
+                return None
+        for source in sources.difference(queryset.query.annotations):
+            try:
+                queryset.model._meta.get_field(source)
+            except FieldDoesNotExist:
+                return None
+        return sources
+
+
+def get_used_lookups(lookups, sources):
+    """Пути связей, которые начинаются с одного из атрибутов sources."""
+    return [lookup for lookup in lookups if lookup.split("__")[0] in sources]
+
+
+def get_only_fields(queryset, sources):
+    """Колонки модели queryset для only() из атрибутов sources."""
+    return sorted(
+        source
+        for source in sources.difference(queryset.query.annotations)
+        if queryset.model._meta.get_field(source).concrete
+    )
+
+
+def get_ordering_fields(view, queryset):
+    """Поля сортировки пагинатора вьюсета, по которым строится курсор."""
+    if not hasattr(view.paginator, "get_ordering"):
+        return ()
+    ordering = view.paginator.get_ordering(view.request, queryset, view)
+    return [field.lstrip("-") for field in ordering]
+
+
+class FastListMixin:
+    """
+    Миксин для вывода списков через FastListSerializer.
+
+    Действие list строит ответ из строк .values() сериализатором
+    fast_list_serializer_class; остальные действия и схема API используют
+    обычный get_serializer_class. Ответ совпадает с ответом обычного
+    сериализатора списка, включая курсорную пагинацию.
+    """
+
+    fast_list_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        """Список объектов через быстрый сериализатор."""
+        if self.fast_list_serializer_class is None:
+            return super().list(request, *args, **kwargs)
+        serializer = self.fast_list_serializer_class(
+            context=self.get_serializer_context()
+        )
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = serializer.get_values(queryset, self.get_ordering_fields(queryset))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serializer.to_representation(page))
+        return Response(serializer.to_representation(rows))
+
+    def get_ordering_fields(self, queryset):
+        """Поля сортировки пагинатора, по которым строится курсор."""
+        return get_ordering_fields(self, queryset)
+
+
+class CachedListMixin:
+    """
+    Миксин кэширования ответов действия list.
+
+    Ответ сохраняется в кэш "responses" по ключу из пользователя, пути,
+    параметров запроса и версий данных моделей cache_models. Сохранение
+    или удаление объекта любой из этих моделей меняет ее версию (см.
+    api.signals), поэтому следующий запрос строит ответ заново. Заголовок
+    X-Cache сообщает, был ли ответ взят из кэша. Если кэш "responses" не
+    настроен, ответы не кэшируются.
+    """
+
+    cache_models = ()
+
+    def list(self, request, *args, **kwargs):
+        """Список объектов из кэша ответов."""
+        if not response_cache_enabled():
+            return super().list(request, *args, **kwargs)
+        key = response_cache_key(request, self.basename, self.cache_models)
+        data = get_cached_response(key)
+        if data is not None:
+            count_response(self.basename, "hits")
+            response = Response(data)
+            response["X-Cache"] = "HIT"
+            return response
+        count_response(self.basename, "misses")
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            set_cached_response(key, response.data)
+        response["X-Cache"] = "MISS"
+        return response
+
+
+class ConditionalGetMixin:
+    """
+    Миксин условных GET-запросов для действий retrieve и list.
+
+    Объект получает ETag из дат изменения last_modified_fields: полей
+    объекта или связанных объектов через "__". Если клиент прислал
+    If-None-Match с тем же ETag или If-Modified-Since не раньше
+    Last-Modified, возвращается 304 без сериализации. ETag списка -- хэш
+    тела страницы и полного пути с фильтрами и курсором: он считается по
+    уже полученной странице, без агрегатов по всему отфильтрованному
+    queryset, поэтому 304 экономит только передачу тела, а ответ из кэша
+    ответов не требует запросов к БД. Last-Modified у списков не отдается.
+
+    depends_on_today -- тело ответа зависит от текущей даты (например,
+    возраст), поэтому начало текущего дня считается датой изменения.
+    """
+
+    last_modified_fields = ("updated_at",)
+    depends_on_today = False
+
+    def get_required_sources(self, queryset):
+        """Поля дат изменения нужны для ETag при любых полях ответа."""
+        return [
+            *super().get_required_sources(queryset),
+            *(field.split("__")[0] for field in self.last_modified_fields),
+        ]
+
+    def get_timestamps(self, timestamps):
+        """Даты изменения ответа с учетом depends_on_today."""
+        if not self.depends_on_today:
+            return timestamps
+        today = timezone.make_aware(datetime.combine(timezone.localdate(), time()))
+        return [*timestamps, today]
+
+    def retrieve(self, request, *args, **kwargs):
+        """Объект или 304, если он не изменился."""
+        instance = self.get_object()
+        timestamps = self.get_timestamps(
+            [get_path_value(instance, field) for field in self.last_modified_fields]
+        )
+        etag = response_etag(request, *timestamps)
+        last_modified = max(filter(None, timestamps), default=None)
+        if last_modified is not None:
+            last_modified = timegm(last_modified.utctimetuple())
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = Response(self.get_serializer(instance).data)
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        """Страница списка или 304, если ее тело не изменилось."""
+        response = super().list(request, *args, **kwargs)
+        if response.status_code != 200:
+            return response
+        body = hashlib.sha256(JSONRenderer().render(response.data)).hexdigest()
+        etag = response_etag(request, body)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            response = not_modified
+        response["ETag"] = etag
+        return response
+
+
+def get_path_value(instance, path):
+    """Значение поля объекта или связанного объекта по пути через "__"."""
+    for name in path.split("__"):
+        if instance is None:
+            return None
+        instance = getattr(instance, name)
+    return instance
+
+
+class ExportMixin:
+    """
+    Миксин выгрузки списка в CSV или JSONL.
+
+    Действие export применяет к queryset списка те же фильтры, поиск и
+    сортировку, что и list, и отдает все строки потоком через
+    export_serializer_class (наследник FastListSerializer), без пагинации.
+    Формат выбирается параметром export_format: csv (по умолчанию) или jsonl.
+    """
+
+    export_serializer_class = None
+
+    @extend_schema(
+        summary="Выгрузить список",
+        filters=True,
+        description=(
+            "Выгружает отфильтрованный список в CSV или JSONL потоком, без "
+            "пагинации. Фильтры, поиск и сортировка те же, что у списка."
+        ),
+        parameters=[
+            OpenApiParameter("export_format", enum=EXPORT_FORMATS, default="csv")
+        ],
+        responses={
+            (200, "text/csv"): OpenApiTypes.STR,
+            (200, "application/x-ndjson"): OpenApiTypes.STR,
+        },
+    )
+    @action(detail=False, methods=["get"])
+    def export(self, request, *args, **kwargs):
+        """Потоковая выгрузка отфильтрованного списка."""
+        params = ExportParamsSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        serializer = self.export_serializer_class(context=self.get_serializer_context())
+        return stream_export(
+            serializer,
+            self.filter_queryset(self.get_queryset()),
+            params.validated_data["export_format"],
+            self.basename,
+        )
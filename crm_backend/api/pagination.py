@@ -0,0 +1,122 @@
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import JSONField
+from rest_framework.pagination import CursorPagination, _positive_int
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class ListCursorPagination(CursorPagination):
+    """
+    Курсорная пагинация для списков.
+
+    Позиция курсора строится по первому полю сортировки (по умолчанию
+    pub_date, при полнотекстовом поиске -- релевантность), поэтому глубокие
+    страницы не требуют OFFSET по всей таблице. id добавляется к сортировке,
+    чтобы строки с одинаковой позицией шли в одном порядке: такие строки
+    курсор пропускает смещением от позиции.
+
+    Позиция курсора -- строковое значение поля, а страницы выбираются
+    сравнением < и >, поэтому для сортировки по полю с NULL, массиву или
+    связи строки терялись бы или запрос падал. Для таких полей страницы
+    выбираются по смещению (параметр offset) с тем же видом ответа.
+
+    Параметры запроса:
+    page_size -- количество объектов на странице (не больше max_page_size);
+    paginate=false -- вернуть список целиком, без пагинации.
+    """
+
+    ordering = ("pub_date", "id")
+    page_size = settings.API_PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = settings.API_MAX_PAGE_SIZE
+    paginate_query_param = "paginate"
+    offset_query_param = "offset"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Пагинация queryset, если она не отключена параметром запроса."""
+        if request.query_params.get(self.paginate_query_param) == "false":
+            return None
+        ordering = self.get_ordering(request, queryset, view)
+        self.offset = None
+        if is_cursor_field(queryset.model, ordering[0]):
+            return super().paginate_queryset(queryset, request, view)
+        return self.paginate_by_offset(queryset, request, ordering)
+
+    def paginate_by_offset(self, queryset, request, ordering):
+        """Страница по смещению для сортировки, непригодной для курсора."""
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        try:
+            self.offset = _positive_int(
+                request.query_params.get(self.offset_query_param, 0)
+            )
+        except ValueError:
+            self.offset = 0
+        start, stop = self.offset, self.offset + self.page_size + 1
+        rows = list(queryset.order_by(*ordering)[start:stop])
+        self.has_next = len(rows) > self.page_size
+        self.has_previous = self.offset > 0
+        self.page = rows[: self.page_size]
+        return self.page
+
+    def get_next_link(self):
+        """Ссылка на следующую страницу."""
+        if self.offset is None:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        return self.get_offset_link(self.offset + self.page_size)
+
+    def get_previous_link(self):
+        """Ссылка на предыдущую страницу."""
+        if self.offset is None:
+            return super().get_previous_link()
+        if not self.has_previous:
+            return None
+        return self.get_offset_link(max(self.offset - self.page_size, 0))
+
+    def get_offset_link(self, offset):
+        """Ссылка на страницу со смещением offset."""
+        url = remove_query_param(self.base_url, self.cursor_query_param)
+        if not offset:
+            return remove_query_param(url, self.offset_query_param)
+        return replace_query_param(url, self.offset_query_param, offset)
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Сортировка страниц.
+
+        При полнотекстовом поиске страницы идут по релевантности, иначе по
+        сортировке вьюсета; id добавляется для однозначного порядка строк.
+        """
+        for backend in getattr(view, "filter_backends", []):
+            if hasattr(backend, "get_rank_ordering"):
+                rank_ordering = backend().get_rank_ordering(request, view)
+                if rank_ordering:
+                    return rank_ordering
+        ordering = super().get_ordering(request, queryset, view)
+        if not {"id", "-id", "pk", "-pk"}.intersection(ordering):
+            ordering += ("-id",) if ordering[0].startswith("-") else ("id",)
+        return ordering
+
+
+def is_cursor_field(model, name):
+    """
+    Подходит ли поле сортировки для позиции курсора.
+
+    Подходят поля модели без NULL со скалярными значениями и аннотации
+    queryset (например, релевантность поиска).
+    """
+    try:
+        field = model._meta.get_field(name.lstrip("-"))
+    except FieldDoesNotExist:
+        return True
+    return (
+        field.concrete
+        and not field.is_relation
+        and not field.null
+        and not isinstance(field, (ArrayField, JSONField))
+    )
@@ -1,9 +1,10 @@
-import base64
 from datetime import date
 
+import filetype
+from django.conf import settings
 from django.contrib.auth.password_validation import validate_password
-from django.core.files.base import ContentFile
 from drf_extra_fields.fields import Base64ImageField
+from PIL import Image
 from recruitment.constants import (
     CANDIDATE_STATUS,
     EDUCATION,
@@ -20,7 +21,9 @@ from recruitment.models import (
     Comment,
     Company,
     Education,
+    Event,
     FunnelStage,
+    FunnelSummary,
     Note,
     Skills,
     SkillStack,
@@ -31,11 +34,17 @@ from recruitment.models import (
 from rest_framework.serializers import (
     CharField,
     ChoiceField,
+    DateField,
+    DictField,
     EmailField,
     FileField,
+    ImageField,
+    IntegerField,
+    ListSerializer,
     ModelSerializer,
     MultipleChoiceField,
     PrimaryKeyRelatedField,
+    ReadOnlyField,
     Serializer,
     SerializerMethodField,
     StringRelatedField,
@@ -44,32 +53,145 @@ from rest_framework.serializers import (
 from users.models import User
 from users.validators import custom_validate_email
 
-from .constants import MAX_AGE, MIN_AGE
+from .constants import AGENDA_MAX_DAYS, EXPORT_FORMATS, FUNNEL_SCOPES, MAX_AGE, MIN_AGE
+from .uploads import check_file_size, decode_base64_file
 from .utils import (
+    CANDIDATE_STATUS_LABELS,
+    EMPLOYMENT_TYPE_LABELS,
+    EXPERIENCE_LABELS,
+    INTERVIEW_STATUS_LABELS,
+    SCHEDULE_WORK_LABELS,
+    VACANCY_STATUS_LABELS,
     DateOnlyField,
-    get_display_values,
+    get_candidates_count,
     get_salary_expectations,
     get_salary_range,
+    get_sparse_fields,
+    render_choice_labels,
 )
 
 
+class ChoiceLabelsListSerializer(ListSerializer):
+    """
+    Список объектов с названиями вариантов выбора вместо кодов.
+
+    Дочерний сериализатор отдает коды, а названия подставляются одним
+    проходом по каждой колонке после сериализации всего списка.
+    """
+
+    def to_representation(self, data):
+        """Сериализация списка с заменой кодов на названия."""
+        return render_choice_labels(
+            super().to_representation(data),
+            getattr(self.child.Meta, "choice_labels", None),
+            getattr(self.child.Meta, "multiple_choice_labels", None),
+        )
+
+
+class ChoiceLabelsMixin:
+    """
+    Вывод названий вариантов выбора для полей из Meta.choice_labels.
+
+    Meta.choice_labels -- поля с одним кодом, Meta.multiple_choice_labels --
+    поля со списком кодов. В Meta нужно указать
+    list_serializer_class = ChoiceLabelsListSerializer.
+    """
+
+    def to_representation(self, instance):
+        """Сериализация объекта; в списке названия подставляет родитель."""
+        data = super().to_representation(instance)
+        if isinstance(self.parent, ChoiceLabelsListSerializer):
+            return data
+        return render_choice_labels(
+            [data],
+            getattr(self.Meta, "choice_labels", None),
+            getattr(self.Meta, "multiple_choice_labels", None),
+        )[0]
+
+
+class SparseFieldsMixin:
+    """
+    Выбор полей ответа параметрами запроса fields и omit.
+
+    Поля отбираются у корневого сериализатора (или у дочернего сериализатора
+    корневого списка) в запросах на чтение, вложенные сериализаторы отдают
+    все поля. Meta.sparse_sources описывает атрибуты модели, которые читают
+    поля с source="*" (SerializerMethodField): по ним QueryPlanMixin сужает
+    запрос к БД.
+    """
+
+    def get_fields(self):
+        """Поля сериализатора, выбранные параметрами запроса."""
+        fields = super().get_fields()
+        request = self.context.get("request")
+        parent = getattr(self, "parent", None)
+        if isinstance(parent, ListSerializer):
+            parent = parent.parent
+        if request is None or parent is not None:
+            return fields
+        return {name: fields[name] for name in get_sparse_fields(request, fields)}
+
+
 class Base64PDFField(FileField):
-    """Кастомное поле для загрузки pdf файлов."""
+    """
+    Кастомное поле для загрузки pdf файлов.
+
+    Принимает data URL "data:application/pdf;base64,..." или файл из
+    multipart-запроса. Размер файла ограничен UPLOAD_PDF_MAX_SIZE.
+    """
 
     def to_internal_value(self, data):
         """
         Функция декодирования файла из base64.
 
+        base64 декодируется потоково во временный файл, а не в память.
         Возвращает адрес с нужным файлом из каталога media/candidates/.
         """
         if isinstance(data, str) and data.startswith("data:application/pdf"):
-            format, pdfstr = data.split(";base64,")
-            ext = format.split("/")[-1]
-            data = ContentFile(base64.b64decode(pdfstr), name="temp." + ext)
-
+            data = decode_base64_file(data, "temp.pdf", settings.UPLOAD_PDF_MAX_SIZE)
+        elif hasattr(data, "size"):
+            check_file_size(data, settings.UPLOAD_PDF_MAX_SIZE)
         return super().to_internal_value(data)
 
 
+class StreamingBase64ImageField(Base64ImageField):
+    """
+    Поле загрузки изображений в base64 без декодирования в память.
+
+    В отличие от Base64ImageField строка base64 декодируется потоково во
+    временный файл, тип изображения определяется по его первым байтам, а
+    размер ограничен UPLOAD_IMAGE_MAX_SIZE. Принимает также файл из
+    multipart-запроса.
+    """
+
+    def to_internal_value(self, data):
+        """Декодирование base64 или проверка загруженного файла."""
+        if data in self.EMPTY_VALUES:
+            return None
+        if isinstance(data, str):
+            data = decode_base64_file(data, "temp", settings.UPLOAD_IMAGE_MAX_SIZE)
+            extension = self.get_file_extension(data.name, data)
+            if extension not in self.ALLOWED_TYPES:
+                data.close()
+                raise ValidationError(self.INVALID_TYPE_MESSAGE)
+            data.name = f"{self.get_file_name(data)}.{extension}"
+        elif hasattr(data, "size"):
+            check_file_size(data, settings.UPLOAD_IMAGE_MAX_SIZE)
+        return ImageField.to_internal_value(self, data)
+
+    def get_file_extension(self, filename, decoded_file):
+        """Расширение по содержимому временного файла."""
+        path = decoded_file.temporary_file_path()
+        extension = filetype.guess_extension(path)
+        if extension is None:
+            try:
+                with Image.open(path) as image:
+                    extension = image.format.lower()
+            except OSError:
+                raise ValidationError(self.INVALID_FILE_MESSAGE)
+        return "jpg" if extension == "jpeg" else extension
+
+
 class UserSignupSerializer(ModelSerializer):
     """Сериализатор пользователя при регистрации."""
 
@@ -112,10 +234,10 @@ class UserSignupSerializer(ModelSerializer):
         return data
 
 
-class UserSerializer(ModelSerializer):
+class UserSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для модели User."""
 
-    photo = Base64ImageField()
+    photo = StreamingBase64ImageField()
 
     class Meta:
         model = User
@@ -152,7 +274,7 @@ class ChangePasswordSerializer(Serializer):
         return data
 
 
-class EducationSerializer(ModelSerializer):
+class EducationSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для модели Education."""
 
     class Meta:
@@ -167,10 +289,10 @@ class EducationSerializer(ModelSerializer):
         )
 
 
-class CompanySerializer(ModelSerializer):
+class CompanySerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для модели Company."""
 
-    logo = Base64ImageField()
+    logo = StreamingBase64ImageField()
 
     class Meta:
         model = Company
@@ -187,15 +309,15 @@ class CompanySerializer(ModelSerializer):
         )
 
 
-class CompanyShortSerializer(ModelSerializer):
+class CompanyShortSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для краткой версии модели Company."""
 
     class Meta:
         model = Company
-        fields = ("id", "company_title", "website")
+        fields = ("id", "company_title", "website", "logo_thumbnail")
 
 
-class WorkExperienceSerializer(ModelSerializer):
+class WorkExperienceSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор карточки опыта работы."""
 
     experience_length = SerializerMethodField()
@@ -209,6 +331,7 @@ class WorkExperienceSerializer(ModelSerializer):
             "organization",
             "experience_length",
         )
+        sparse_sources = {"experience_length": ("start_date", "end_date")}
 
     def get_experience_length(self, obj):
         """
@@ -226,7 +349,7 @@ class WorkExperienceSerializer(ModelSerializer):
         return f"{int(years)} года/лет и {round(months)} месяца(ев)"
 
 
-class SkillsSerializer(ModelSerializer):
+class SkillsSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для модели Skills."""
 
     class Meta:
@@ -234,7 +357,7 @@ class SkillsSerializer(ModelSerializer):
         fields = ["name"]
 
 
-class SkillStackSerializer(ModelSerializer):
+class SkillStackSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для модели SkillStack."""
 
     skill_stack = SkillsSerializer()
@@ -254,7 +377,7 @@ class SkillStackSerializer(ModelSerializer):
         return SkillStack.objects.create(skill_stack=skill, **validated_data)
 
 
-class VacancySerializer(ModelSerializer):
+class VacancySerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор карточки вакансии."""
 
     company = CompanyShortSerializer()
@@ -289,6 +412,7 @@ class VacancySerializer(ModelSerializer):
             "candidates_count",
         )
         read_only_fields = ("author",)
+        sparse_sources = {"candidates_count": ("candidates_count",)}
 
     def create(self, validated_data):
         """
@@ -326,20 +450,20 @@ class VacancySerializer(ModelSerializer):
 
     def get_candidates_count(self, obj):
         """Подсчет количества кандидатов на вакансию."""
-        return obj.candidates.count()
+        return get_candidates_count(obj)
 
 
-class VacanciesSerializer(ModelSerializer):
+class VacanciesSerializer(SparseFieldsMixin, ChoiceLabelsMixin, ModelSerializer):
     """Сериализатор для просмотра карточек вакансий."""
 
     company = StringRelatedField(read_only=True)
-    schedule_work = SerializerMethodField()
-    employment_type = SerializerMethodField()
+    schedule_work = ReadOnlyField()
+    employment_type = ReadOnlyField()
     salary_range = SerializerMethodField()
     candidates_count = SerializerMethodField()
     skill_stack = StringRelatedField(many=True, read_only=True)
-    vacancy_status = SerializerMethodField()
-    required_experience = SerializerMethodField()
+    vacancy_status = ReadOnlyField()
+    required_experience = ReadOnlyField()
 
     class Meta:
         model = Vacancy
@@ -357,49 +481,30 @@ class VacanciesSerializer(ModelSerializer):
             "candidates_count",
             "vacancy_status",
         )
-
-    def get_schedule_work(self, obj):
-        """
-        Функция преобразования вывода информации.
-
-        Возвращает значение поля schedule_work.
-        """
-        return get_display_values(obj.schedule_work, SCHEDULE_WORK)
-
-    def get_employment_type(self, obj):
-        """
-        Функция преобразования вывода информации.
-
-        Возвращает значение поля employment_type.
-        """
-        return get_display_values(obj.employment_type, EMPLOYMENT_TYPE)
+        list_serializer_class = ChoiceLabelsListSerializer
+        choice_labels = {
+            "vacancy_status": VACANCY_STATUS_LABELS,
+            "required_experience": EXPERIENCE_LABELS,
+        }
+        multiple_choice_labels = {
+            "employment_type": EMPLOYMENT_TYPE_LABELS,
+            "schedule_work": SCHEDULE_WORK_LABELS,
+        }
+        sparse_sources = {
+            "salary_range": ("salary",),
+            "candidates_count": ("candidates_count",),
+        }
 
     def get_salary_range(self, obj):
         """Функция преобразования вывода информации для поля salary."""
         return get_salary_range(obj)
 
-    def get_vacancy_status(self, obj):
-        """
-        Функция преобразования вывода информации.
-
-        Возвращает значение поля vacancy_status.
-        """
-        return get_display_values(obj.vacancy_status, VACANCY_STATUS)[0]
-
-    def get_required_experience(self, obj):
-        """
-        Функция преобразования вывода информации.
-
-        Возвращает значение поля required_experience.
-        """
-        return get_display_values(obj.required_experience, EXPERIENCE)[0]
-
     def get_candidates_count(self, obj):
         """Подсчет количества кандидатов на вакансию."""
-        return obj.candidates.count()
+        return get_candidates_count(obj)
 
 
-class ResumeSerializer(ModelSerializer):
+class ResumeSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор карточки резюме."""
 
     schedule_work = MultipleChoiceField(choices=SCHEDULE_WORK)
@@ -431,6 +536,10 @@ class ResumeSerializer(ModelSerializer):
             "current_company",
             "current_job",
         )
+        sparse_sources = {
+            "age": ("bday",),
+            "salary_expectations": ("salary_expectations",),
+        }
 
     def get_age(self, obj):
         """Функция для подсчета возраста соискателя."""
@@ -452,7 +561,7 @@ class ResumeSerializer(ModelSerializer):
         return get_salary_expectations(obj)
 
 
-class ResumesSerializer(ModelSerializer):
+class ResumesSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для карточек резюме."""
 
     class Meta:
@@ -465,7 +574,7 @@ class ResumesSerializer(ModelSerializer):
         )
 
 
-class CandidateSerializer(ModelSerializer):
+class CandidateSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для кандидата."""
 
     education = ChoiceField(choices=EDUCATION)
@@ -477,7 +586,7 @@ class CandidateSerializer(ModelSerializer):
     employment_type = MultipleChoiceField(choices=EMPLOYMENT_TYPE)
     work_experiences = ChoiceField(choices=EXPERIENCE)
     resume = Base64PDFField()
-    photo = Base64ImageField()
+    photo = StreamingBase64ImageField()
     custom_status = CharField(required=False, allow_null=True)
     pub_date = DateOnlyField(read_only=True)
     vacancy = StringRelatedField(read_only=True)
@@ -511,6 +620,10 @@ class CandidateSerializer(ModelSerializer):
             "custom_status",
             "pub_date",
         )
+        sparse_sources = {
+            "age": ("bday",),
+            "salary_expectations": ("salary_expectations",),
+        }
 
     def validate(self, data):
         """Валидация полей на одновременное заполнение."""
@@ -538,13 +651,64 @@ class CandidateSerializer(ModelSerializer):
         return get_salary_expectations(obj)
 
 
-class CandidatesSerializer(ModelSerializer):
+class CandidateImportSerializer(CandidateSerializer):
+    """
+    Сериализатор строки импорта кандидатов.
+
+    Правила CandidateSerializer без файлов резюме и фотографии.
+    Уникальность почты проверяет CandidateImport одним запросом на пачку
+    строк, а не UniqueValidator на каждую строку.
+    """
+
+    age = None
+    salary_expectations = None
+    resume = None
+    photo = None
+    vacancy = None
+    pub_date = None
+
+    class Meta(CandidateSerializer.Meta):
+        fields = (
+            "first_name",
+            "last_name",
+            "patronymic",
+            "bday",
+            "city",
+            "last_job",
+            "cur_position",
+            "phone_number",
+            "email",
+            "telegram",
+            "portfolio",
+            "employment_type",
+            "schedule_work",
+            "work_experiences",
+            "education",
+            "candidate_status",
+            "interview_status",
+            "custom_status",
+        )
+        extra_kwargs = {
+            "email": {"validators": Candidate._meta.get_field("email").validators}
+        }
+
+    @property
+    def multiple_choice_fields(self):
+        """Поля множественного выбора: в файле коды через запятую."""
+        return {
+            name
+            for name, field in self.fields.items()
+            if isinstance(field, MultipleChoiceField)
+        }
+
+
+class CandidatesSerializer(SparseFieldsMixin, ChoiceLabelsMixin, ModelSerializer):
     """Сериализатор для карточек кандидатов."""
 
-    interview_status = SerializerMethodField()
-    candidate_status = SerializerMethodField()
+    interview_status = ReadOnlyField()
+    candidate_status = ReadOnlyField()
     custom_status = CharField(required=False)
-    work_experiences = SerializerMethodField()
+    work_experiences = ReadOnlyField()
 
     class Meta:
         model = Candidate
@@ -553,6 +717,7 @@ class CandidatesSerializer(ModelSerializer):
             "first_name",
             "last_name",
             "patronymic",
+            "photo_thumbnail",
             "cur_position",
             "work_experiences",
             "last_job",
@@ -560,33 +725,15 @@ class CandidatesSerializer(ModelSerializer):
             "custom_status",
             "candidate_status",
         )
-
-    def get_interview_status(self, obj):
-        """
-        Функция преобразования вывода информации.
-
-        Возвращает значение поля interview_status.
-        """
-        return get_display_values([obj.interview_status], INTERVIEW_STATUS)[0]
-
-    def get_work_experiences(self, obj):
-        """
-        Функция преобразования вывода информации.
-
-        Возвращает значение поля work_experiences.
-        """
-        return get_display_values(obj.work_experiences, EXPERIENCE)[0]
-
-    def get_candidate_status(self, obj):
-        """
-        Функция преобразования вывода информации.
-
-        Возвращает значение поля candidate_status.
-        """
-        return get_display_values(obj.candidate_status, CANDIDATE_STATUS)[0]
+        list_serializer_class = ChoiceLabelsListSerializer
+        choice_labels = {
+            "interview_status": INTERVIEW_STATUS_LABELS,
+            "work_experiences": EXPERIENCE_LABELS,
+            "candidate_status": CANDIDATE_STATUS_LABELS,
+        }
 
 
-class SubStageSerializer(ModelSerializer):
+class SubStageSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для подэтапов воронок."""
 
     stage = StringRelatedField(read_only=True)
@@ -603,7 +750,7 @@ class SubStageSerializer(ModelSerializer):
         )
 
 
-class FunnelSerializer(ModelSerializer):
+class FunnelSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для воронок кандидатов."""
 
     candidate = StringRelatedField(read_only=True)
@@ -620,11 +767,11 @@ class FunnelSerializer(ModelSerializer):
         )
 
 
-class FunnelDetailSerializer(ModelSerializer):
+class FunnelDetailSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для воронок c подэтапами кандидатов."""
 
     candidate = StringRelatedField(read_only=True)
-    substages = SubStageSerializer(many=True, required=False)
+    substages = SubStageSerializer(many=True, required=False, source="substage")
     status = ChoiceField(choices=FUNNEL_STATUS)
 
     def create(self, validated_data):
@@ -632,7 +779,7 @@ class FunnelDetailSerializer(ModelSerializer):
         if "substages" not in self.initial_data:
             funnel = FunnelStage.objects.create(**validated_data)
             return funnel
-        substages = validated_data.pop("substages")
+        substages = validated_data.pop("substage")
         funnel = FunnelStage.objects.create(**validated_data)
         for substage in substages:
             SubStage.objects.create(stage=funnel, **substage)
@@ -650,7 +797,7 @@ class FunnelDetailSerializer(ModelSerializer):
         )
 
 
-class NoteSerializer(ModelSerializer):
+class NoteSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для заметок."""
 
     author_id = PrimaryKeyRelatedField(read_only=True, source="author")
@@ -667,7 +814,7 @@ class NoteSerializer(ModelSerializer):
         read_only_fields = ("candidate",)
 
 
-class CommentSerializer(ModelSerializer):
+class CommentSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для ответов."""
 
     author_id = PrimaryKeyRelatedField(read_only=True, source="author")
@@ -685,7 +832,7 @@ class CommentSerializer(ModelSerializer):
         read_only_fields = ("note_id",)
 
 
-class NoteDetailSerializer(ModelSerializer):
+class NoteDetailSerializer(SparseFieldsMixin, ModelSerializer):
     """Сериализатор для заметок с комментариями."""
 
     author_id = PrimaryKeyRelatedField(read_only=True, source="author")
@@ -704,3 +851,142 @@ class NoteDetailSerializer(ModelSerializer):
         )
         model = Note
         read_only_fields = ("candidate",)
+
+
+class AgendaParamsSerializer(Serializer):
+    """Параметры окна повестки [date_from, date_to)."""
+
+    date_from = DateField()
+    date_to = DateField()
+
+    def validate(self, data):
+        """Проверка, что окно не пустое и не длиннее AGENDA_MAX_DAYS."""
+        days = (data["date_to"] - data["date_from"]).days
+        if days <= 0:
+            raise ValidationError("date_to должна быть позже date_from.")
+        if days > AGENDA_MAX_DAYS:
+            raise ValidationError(
+                f"Окно повестки не может быть больше {AGENDA_MAX_DAYS} дней."
+            )
+        return data
+
+
+class AgendaCandidateSerializer(SparseFieldsMixin, ModelSerializer):
+    """Сериализатор краткой информации о кандидате в повестке."""
+
+    vacancy_title = ReadOnlyField(source="vacancy.vacancy_title")
+
+    class Meta:
+        model = Candidate
+        fields = (
+            "id",
+            "first_name",
+            "last_name",
+            "patronymic",
+            "cur_position",
+            "vacancy",
+            "vacancy_title",
+        )
+
+
+class AgendaEventSerializer(SparseFieldsMixin, ModelSerializer):
+    """Сериализатор событий повестки."""
+
+    candidate = AgendaCandidateSerializer(read_only=True)
+
+    class Meta:
+        model = Event
+        fields = (
+            "id",
+            "title",
+            "start_date",
+            "start_time",
+            "end_date",
+            "end_time",
+            "description",
+            "conference_link",
+            "candidate",
+        )
+
+
+class ExportParamsSerializer(Serializer):
+    """Параметры выгрузки списка."""
+
+    export_format = ChoiceField(choices=EXPORT_FORMATS, default="csv")
+
+
+class FunnelAnalyticsParamsSerializer(Serializer):
+    """
+    Параметры аналитики воронки.
+
+    scope -- итоги по вакансиям или по рекрутерам, vacancy и author --
+    отбор по вакансии и рекрутеру (другого рекрутера видит только персонал).
+    """
+
+    scope = ChoiceField(choices=FUNNEL_SCOPES, default="vacancy")
+    vacancy = IntegerField(required=False)
+    author = IntegerField(required=False)
+
+
+class FunnelSummarySerializer(SparseFieldsMixin, ModelSerializer):
+    """Сериализатор итогов этапа воронки с конверсией."""
+
+    in_progress = SerializerMethodField()
+    conversion = SerializerMethodField()
+
+    class Meta:
+        model = FunnelSummary
+        fields = (
+            "author",
+            "vacancy",
+            "stage",
+            "total",
+            "passed",
+            "failed",
+            "in_progress",
+            "conversion",
+            "median_days",
+            "updated_at",
+        )
+        sparse_sources = {
+            "in_progress": ("total", "passed", "failed"),
+            "conversion": ("total", "passed"),
+        }
+
+    def get_in_progress(self, obj):
+        """Количество кандидатов, еще не завершивших этап."""
+        return obj.total - obj.passed - obj.failed
+
+    def get_conversion(self, obj):
+        """Доля кандидатов, прошедших этап."""
+        return round(obj.passed / obj.total, 4) if obj.total else None
+
+
+class VacancySummarySerializer(SparseFieldsMixin, Serializer):
+    """
+    Сериализатор сводки по кандидатам вакансии.
+
+    Коды статусов заменяются названиями, как в списках кандидатов.
+    """
+
+    id = IntegerField()
+    vacancy_title = CharField()
+    vacancy_status = CharField()
+    candidates_count = IntegerField()
+    candidate_status = DictField(child=IntegerField())
+    interview_status = DictField(child=IntegerField())
+
+    def to_representation(self, instance):
+        """Названия статусов вместо кодов."""
+        return {
+            **instance,
+            "vacancy_status": VACANCY_STATUS_LABELS.get(instance["vacancy_status"]),
+            "candidate_status": {
+                CANDIDATE_STATUS_LABELS[code]: count
+                for code, count in instance["candidate_status"].items()
+            },
+            "interview_status": {
+                INTERVIEW_STATUS_LABELS[code]: count
+                for code, count in instance["interview_status"].items()
+            },
+        }
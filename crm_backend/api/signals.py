@@ -0,0 +1,26 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from recruitment.models import Candidate, Company, SkillStack, Vacancy
+
+from .cache import bump_model_version
+
+
+@receiver(post_save, sender=Candidate)
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=SkillStack)
+@receiver(post_save, sender=Vacancy)
+@receiver(post_delete, sender=Candidate)
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=SkillStack)
+@receiver(post_delete, sender=Vacancy)
+def invalidate_cached_responses(sender, **kwargs):
+    """Сброс кэшированных списков после фиксации изменений модели."""
+    transaction.on_commit(lambda: bump_model_version(sender))
+
+
+@receiver(m2m_changed, sender=Vacancy.skill_stack.through)
+def invalidate_cached_vacancies(sender, action, **kwargs):
+    """Сброс кэшированных списков вакансий после изменения их стека."""
+    if action.startswith("post_"):
+        transaction.on_commit(lambda: bump_model_version(Vacancy))
@@ -0,0 +1,74 @@
+import logging
+
+import requests
+import telebot
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from telebot import apihelper, types
+
+logger = logging.getLogger(__name__)
+
+# Адрес метода API Telegram: токен бота и имя метода.
+API_URL = "https://api.telegram.org/bot{0}/{1}"
+
+
+def create_session():
+    """
+    HTTP-сессия для API Telegram с пулом соединений keep-alive.
+
+    Сессия общая для всех потоков, отправляющих сообщения ботом, поэтому
+    соединение с api.telegram.org не устанавливается заново для каждого
+    сообщения.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=settings.TELEGRAM_POOL_SIZE))
+    return session
+
+
+class TelegramBot(telebot.TeleBot):
+    """
+    Клиент API Telegram.
+
+    Создается без пула потоков обработчиков (бот только отправляет
+    сообщения). Сообщения отправляются через собственную сессию из
+    create_session; глобальные настройки apihelper не меняются.
+    """
+
+    def __init__(self):
+        """Бот с токеном из настроек и собственной HTTP-сессией."""
+        super().__init__(settings.TELEGRAM_TOKEN, threaded=False)
+        self.session = create_session()
+
+    def send_message(self, chat_id, text, **kwargs):
+        """
+        Отправка сообщения через сессию бота.
+
+        Необязательные параметры sendMessage со значением None не
+        передаются. Ошибка API пробрасывается как ApiException.
+        """
+        params = {"chat_id": str(chat_id), "text": text}
+        params.update(
+            (key, value) for key, value in kwargs.items() if value is not None
+        )
+        response = self.session.post(
+            API_URL.format(self.token, "sendMessage"),
+            data=params,
+            timeout=(apihelper.CONNECT_TIMEOUT, apihelper.READ_TIMEOUT),
+        )
+        result = apihelper._check_result("sendMessage", response)
+        return types.Message.de_json(result["result"])
+
+
+class LoggingBot:
+    """Бот для разработки: сообщения записываются в лог, а не отправляются."""
+
+    def send_message(self, chat_id, text, **kwargs):
+        """Запись сообщения в лог."""
+        logger.info("Telegram %s: %s", chat_id, text)
+
+
+class NullBot:
+    """Бот, отбрасывающий сообщения."""
+
+    def send_message(self, chat_id, text, **kwargs):
+        """Сообщение никуда не отправляется."""
@@ -0,0 +1,107 @@
+import base64
+import binascii
+
+from django.conf import settings
+from django.core.exceptions import RequestDataTooBig
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from django.template.defaultfilters import filesizeformat
+from rest_framework.exceptions import ValidationError
+
+BASE64_HEADER = ";base64,"
+BASE64_CHUNK_SIZE = 64 * 1024
+
+
+class Base64UploadedFile(TemporaryUploadedFile):
+    """
+    Временный файл, декодированный из base64.
+
+    FileSystemStorage переносит временный файл в MEDIA_ROOT, поэтому файл
+    закрывается при удалении объекта через close(), которая не падает на
+    уже перенесенном файле. Файлы multipart закрывает сам Django в конце
+    запроса.
+    """
+
+    def __del__(self):
+        self.close()
+
+
+def size_error(max_size):
+    """Сообщение о превышении размера файла."""
+    return f"Размер файла не должен превышать {filesizeformat(max_size)}."
+
+
+def split_data_url(data):
+    """
+    Тип содержимого и позиция начала base64 в строке data URL.
+
+    Для строки без заголовка "data:<тип>;base64," тип -- None, позиция -- 0.
+    Строка не копируется: заголовок ищется только в ее начале.
+    """
+    index = data.find(BASE64_HEADER, 0, 256)
+    if index == -1:
+        return None, 0
+    return data[:index].removeprefix("data:") or None, index + len(BASE64_HEADER)
+
+
+def decode_base64_file(data, name, max_size, chunk_size=BASE64_CHUNK_SIZE):
+    """
+    Декодирование base64 (или data URL) во временный файл на диске.
+
+    Строка декодируется кусками по chunk_size символов, поэтому в памяти
+    кроме самой строки находится только один кусок, а не весь файл.
+    Размер проверяется по ходу декодирования: файл больше max_size
+    отклоняется, как только декодированных байтов становится больше
+    лимита. Возвращает TemporaryUploadedFile, который FileSystemStorage
+    сохраняет переносом файла, без повторного чтения в память.
+    """
+    content_type, start = split_data_url(data)
+    file = Base64UploadedFile(name, content_type, 0, None)
+    try:
+        tail = ""
+        for offset in range(start, len(data), chunk_size):
+            end = offset + chunk_size
+            chunk = tail + "".join(data[offset:end].split())
+            usable = len(chunk) - len(chunk) % 4
+            tail = chunk[usable:]
+            file.write(base64.b64decode(chunk[:usable], validate=True))
+            if file.tell() > max_size:
+                raise ValidationError(size_error(max_size))
+        if tail:
+            raise binascii.Error("Incomplete base64 data")
+    except (binascii.Error, ValueError):
+        file.close()
+        raise ValidationError("Файл в base64 поврежден.")
+    except ValidationError:
+        file.close()
+        raise
+    file.size = file.tell()
+    file.seek(0)
+    return file
+
+
+def check_file_size(file, max_size):
+    """Проверка размера загруженного файла."""
+    if file.size > max_size:
+        raise ValidationError(size_error(max_size))
+
+
+class MaxSizeUploadHandler(FileUploadHandler):
+    """
+    Ограничение размера файлов multipart по FILE_UPLOAD_MAX_SIZE.
+
+    Стоит первым в FILE_UPLOAD_HANDLERS: разбор запроса прерывается на
+    первом куске сверх лимита, до записи его во временный файл, поэтому
+    слишком большой файл не читается до конца. Обработчик действует для
+    всех запросов, включая админку, поэтому выбрасывает RequestDataTooBig:
+    на него и Django, и DRF отвечают 400, а не 500.
+    """
+
+    def receive_data_chunk(self, raw_data, start):
+        """Проверка размера файла перед передачей куска дальше."""
+        if start + len(raw_data) > settings.FILE_UPLOAD_MAX_SIZE:
+            raise RequestDataTooBig(size_error(settings.FILE_UPLOAD_MAX_SIZE))
+        return raw_data
+
+    def file_complete(self, file_size):
+        """Файл создают следующие обработчики."""
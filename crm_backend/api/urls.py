@@ -2,12 +2,14 @@ from django.urls import include, path, re_path
 from rest_framework.routers import DefaultRouter
 
 from .views import (
+    AgendaView,
     CandidateViewSet,
     ChangePasswordView,
     CommentViewSet,
     CompanyViewSet,
     EducationViewSet,
     EmailConfirmationView,
+    FunnelAnalyticsView,
     FunnelViewSet,
     LoginView,
     LogoutView,
@@ -49,6 +51,8 @@ urlpatterns = [
     path("login/", LoginView.as_view(), name="login"),
     path("logout/", LogoutView.as_view(), name="logout"),
     path("signup/", UserSignupView.as_view(), name="signup"),
+    path("agenda/", AgendaView.as_view(), name="agenda"),
+    path("analytics/funnel/", FunnelAnalyticsView.as_view(), name="funnel_analytics"),
     path("change-password/", ChangePasswordView.as_view(), name="change_password"),
     re_path(CONFIRM_URL, EmailConfirmationView.as_view(), name="email_confirm"),
     path("", include(router.urls)),
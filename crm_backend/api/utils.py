@@ -1,9 +1,49 @@
-import telebot
+from functools import lru_cache
+from types import MappingProxyType
+
 from django.conf import settings
-from django.core.mail import send_mail
+from django.utils.module_loading import import_string
+from notifications.services import enqueue_email, enqueue_telegram
+from recruitment.constants import (
+    CANDIDATE_STATUS,
+    EDUCATION,
+    EMPLOYMENT_TYPE,
+    EXPERIENCE,
+    FUNNEL_STATUS,
+    INTERVIEW_STATUS,
+    SCHEDULE_WORK,
+    VACANCY_STATUS,
+)
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+from .constants import SPARSE_FIELDS_PARAMS
+
+
+@lru_cache(maxsize=None)
+def get_bot():
+    """
+    Бот Telegram из настройки TELEGRAM_BOT.
+
+    Создается при первой отправке сообщения и переиспользуется процессом,
+    поэтому импорт api (миграции, команды, тесты) не создает сетевой клиент.
+    """
+    return import_string(settings.TELEGRAM_BOT)()
+
+
+def make_choice_labels(choices):
+    """Неизменяемая таблица "код -> название" для вариантов выбора."""
+    return MappingProxyType(dict(choices))
 
-bot = telebot.TeleBot(settings.TELEGRAM_TOKEN)
+
+CANDIDATE_STATUS_LABELS = make_choice_labels(CANDIDATE_STATUS)
+EDUCATION_LABELS = make_choice_labels(EDUCATION)
+EMPLOYMENT_TYPE_LABELS = make_choice_labels(EMPLOYMENT_TYPE)
+EXPERIENCE_LABELS = make_choice_labels(EXPERIENCE)
+FUNNEL_STATUS_LABELS = make_choice_labels(FUNNEL_STATUS)
+INTERVIEW_STATUS_LABELS = make_choice_labels(INTERVIEW_STATUS)
+SCHEDULE_WORK_LABELS = make_choice_labels(SCHEDULE_WORK)
+VACANCY_STATUS_LABELS = make_choice_labels(VACANCY_STATUS)
 
 
 class DateOnlyField(serializers.DateTimeField):
@@ -14,60 +54,137 @@ class DateOnlyField(serializers.DateTimeField):
         return value.strftime("%Y-%m-%d")
 
 
-def get_display_values(keys, choices):
-    """Функция преобразования вывода информации для поля с ключа на значение."""
+def get_display_values(keys, labels):
+    """
+    Функция преобразования вывода информации для поля с ключа на значение.
+
+    labels -- таблица названий вида EMPLOYMENT_TYPE_LABELS.
+    """
     if keys:
-        return [dict(choices).get(key) for key in keys]
+        return [labels.get(key) for key in keys]
     return [None]
 
 
-def get_salary_expectations(obj):
+def get_display_value(key, labels):
+    """Название варианта выбора по коду или None для пустого значения."""
+    return labels.get(key) if key else None
+
+
+def render_choice_labels(rows, choice_labels=None, multiple_choice_labels=None):
     """
-    Функция для изменения представления поля salary_expectations.
+    Заменяет коды вариантов выбора на названия в списке словарей.
 
-    Приведено к виду salary_expectations: {min: 50, max: 66}.
+    Коды обрабатываются по колонкам: для каждого поля таблица названий
+    выбирается один раз на весь список, а не для каждой строки.
+    choice_labels -- поля с одним кодом, multiple_choice_labels -- поля
+    со списком кодов. Поля, которых нет в строках (например, убранные
+    параметром fields), пропускаются. Возвращает тот же список rows.
+    """
+    columns = rows[0] if rows else {}
+    for field, labels in (choice_labels or {}).items():
+        if field not in columns:
+            continue
+        column = [get_display_value(row[field], labels) for row in rows]
+        for row, label in zip(rows, column):
+            row[field] = label
+    for field, labels in (multiple_choice_labels or {}).items():
+        if field not in columns:
+            continue
+        column = [get_display_values(row[field], labels) for row in rows]
+        for row, label in zip(rows, column):
+            row[field] = label
+    return rows
+
+
+def has_sparse_fields(request):
+    """Выбраны ли поля ответа параметрами fields или omit запроса на чтение."""
+    return request.method in SAFE_METHODS and any(
+        request.query_params.get(param) for param in SPARSE_FIELDS_PARAMS
+    )
+
+
+def get_sparse_fields(request, names):
+    """
+    Поля ответа, выбранные параметрами fields и omit.
+
+    names -- все поля сериализатора в порядке вывода. fields -- поля через
+    запятую, которые нужно оставить, omit -- которые нужно убрать.
+    Ответы на изменяющие запросы содержат все поля. Неизвестное поле --
+    ошибка валидации. Возвращает имена полей в порядке names.
+    """
+    names = list(names)
+    if not has_sparse_fields(request):
+        return names
+    selected = {}
+    for param in SPARSE_FIELDS_PARAMS:
+        value = request.query_params.get(param)
+        if not value:
+            continue
+        selected[param] = {name.strip() for name in value.split(",") if name.strip()}
+        unknown = selected[param].difference(names)
+        if unknown:
+            raise serializers.ValidationError(
+                {param: f"Неизвестные поля: {', '.join(sorted(unknown))}."}
+            )
+    keep = selected.get("fields", names)
+    omit = selected.get("omit", ())
+    return [name for name in names if name in keep and name not in omit]
+
+
+def get_candidates_count(obj):
+    """
+    Функция для получения количества кандидатов на вакансию.
+
+    Использует аннотацию candidates_count из queryset вьюсета, а для вакансий
+    без аннотации (например, только что созданных) выполняет подсчет в БД.
     """
-    if obj.salary_expectations:
+    candidates_count = getattr(obj, "candidates_count", None)
+    if candidates_count is None:
+        return obj.candidates.count()
+    return candidates_count
+
+
+def get_salary_dict(salary):
+    """Представление зарплаты [min, max] в виде {min: 50, max: 66}."""
+    if salary:
         return {
-            "min": obj.salary_expectations[0],
-            "max": obj.salary_expectations[1],
+            "min": salary[0],
+            "max": salary[1],
         }
     return None
 
 
+def get_salary_expectations(obj):
+    """
+    Функция для изменения представления поля salary_expectations.
+
+    Приведено к виду salary_expectations: {min: 50, max: 66}.
+    """
+    return get_salary_dict(obj.salary_expectations)
+
+
 def get_salary_range(obj):
     """
     Функция для изменения представления поля salary.
 
     Приведено к виду salary: {min: 50, max: 66}.
     """
-    if obj.salary:
-        return {
-            "min": obj.salary[0],
-            "max": obj.salary[1],
-        }
-    return None
+    return get_salary_dict(obj.salary)
 
 
 def send_mail_to_user(user_id, confirmation_code, email):
-    """Отправка кода подтверждения на почту."""
+    """
+    Постановка кода подтверждения в очередь уведомлений.
+
+    Письмо и сообщение в Telegram отправляет команда send_outbox, поэтому
+    запрос не ждет почтовый сервер и API Telegram.
+    """
     message = (
         "Подтвердить почту перейдя по ссылке: "
         f"https://{settings.DOMAIN_NAME}/api/confirm/{user_id}/{confirmation_code}"
     )
-    send_mail(
-        "Подтверждение регистрации в Meeting Room",
-        message,
-        settings.EMAIL_HOST_USER,
-        [email],
-        fail_silently=False,
-    )
-    send_to_telegram(settings.TELEGRAM_CHAT_ID, message, 12)
-
-
-def send_to_telegram(chat_id, message, thread_id=None):
-    """Отправка сообщения в телеграмм."""
-    try:
-        bot.send_message(chat_id, message, message_thread_id=thread_id)
-    except Exception as e:
-        print(e)
+    enqueue_email(email, "Подтверждение регистрации в Meeting Room", message)
+    if settings.TELEGRAM_CHAT_ID:
+        enqueue_telegram(
+            settings.TELEGRAM_CHAT_ID, message, settings.TELEGRAM_SIGNUP_THREAD_ID
+        )
@@ -2,6 +2,10 @@ from datetime import datetime
 
 from django.conf import settings
 from django.contrib.auth import authenticate, login, logout
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import Coalesce
+from django.db.models.lookups import GreaterThanOrEqual
 from django.http import HttpResponseRedirect
 from django.middleware import csrf
 from django.shortcuts import get_object_or_404
@@ -12,27 +16,69 @@ from drf_spectacular.utils import (  # OpenApiExample,; OpenApiParameter,
     inline_serializer,
 )
 from drf_standardized_errors.openapi import AutoSchema
+from recruitment.dashboard import get_vacancy_summary
 from recruitment.models import (
     ApplicantResume,
     Candidate,
     Company,
     Education,
+    Event,
     FunnelStage,
+    FunnelSummary,
     Note,
+    SkillStack,
     Vacancy,
 )
 from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.generics import ListAPIView
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework.serializers import BooleanField, CharField, EmailField, IntegerField
+from rest_framework.serializers import (
+    BooleanField,
+    CharField,
+    DictField,
+    EmailField,
+    FileField,
+    IntegerField,
+    ListField,
+)
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 from rest_framework_simplejwt.tokens import RefreshToken
 from users.models import User
 
-from .filters import CandidatesFilterSet, ResumeFilterSet, VacancyFilterSet
+from .fast_serializers import (
+    AgendaFastSerializer,
+    CandidateExportSerializer,
+    CandidatesFastSerializer,
+    CompanyShortFastSerializer,
+    ResumeExportSerializer,
+    ResumesFastSerializer,
+    VacanciesFastSerializer,
+    VacancyExportSerializer,
+)
+from .filters import (
+    CandidatesFilterSet,
+    FullTextSearchFilter,
+    ResumeFilterSet,
+    VacancyFilterSet,
+)
+from .imports import CandidateImport, iter_rows
+from .mixins import (
+    CachedListMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    FastListMixin,
+    QueryPlanMixin,
+)
+from .pagination import ListCursorPagination
 from .serializers import (
+    AgendaEventSerializer,
+    AgendaParamsSerializer,
     CandidateSerializer,
     CandidatesSerializer,
     ChangePasswordSerializer,
@@ -40,8 +86,10 @@ from .serializers import (
     CompanySerializer,
     CompanyShortSerializer,
     EducationSerializer,
+    FunnelAnalyticsParamsSerializer,
     FunnelDetailSerializer,
     FunnelSerializer,
+    FunnelSummarySerializer,
     NoteDetailSerializer,
     NoteSerializer,
     ResumeSerializer,
@@ -51,6 +99,7 @@ from .serializers import (
     UserSignupSerializer,
     VacanciesSerializer,
     VacancySerializer,
+    VacancySummarySerializer,
 )
 from .utils import send_mail_to_user
 
@@ -193,8 +242,9 @@ class UserSignupView(APIView):
         """
         serializer = UserSignupSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.save()
-        send_mail_to_user(user.id, user.confirmation_code, user.email)
+        with transaction.atomic():
+            user = serializer.save()
+            send_mail_to_user(user.id, user.confirmation_code, user.email)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
@@ -262,7 +312,7 @@ class EmailConfirmationView(APIView):
     summary="Получить список пользователей",
     description="Получает список пользователей, которые не являются персоналом.",
 )
-class UserViewSet(ModelViewSet):
+class UserViewSet(QueryPlanMixin, ModelViewSet):
     """Вьюсет для модели пользователей."""
 
     schema = AutoSchema()
@@ -338,34 +388,51 @@ class ChangePasswordView(APIView):
         description="Удаляет конкретную вакансию, созданную автором запроса.",
     ),
 )
-class VacancyViewSet(ModelViewSet):
+class VacancyViewSet(
+    CachedListMixin, ExportMixin, FastListMixin, QueryPlanMixin, ModelViewSet
+):
     """Вьюсет для модели вакансий."""
 
     schema = AutoSchema()
     permission_classes = (IsAuthenticated,)
+    pagination_class = ListCursorPagination
+    fast_list_serializer_class = VacanciesFastSerializer
+    export_serializer_class = VacancyExportSerializer
+    cache_models = (Vacancy, Company, SkillStack, Candidate)
     filter_backends = (
         DjangoFilterBackend,
-        SearchFilter,
         OrderingFilter,
+        FullTextSearchFilter,
     )
     filterset_class = VacancyFilterSet
-    search_fields = (
-        "vacancy_title",
-        "company__company_title",
-        "city",
-        "skill_stack",
-    )
     ordering_fields = (
         "vacancy_status",
         "deadline",
         "pub_date",
     )
     ordering = ("pub_date",)
+    query_plan = {
+        "list": {
+            "select_related": ("company",),
+            "prefetch_related": ("skill_stack__skill_stack",),
+        },
+        "default": {
+            "select_related": ("company", "author"),
+            "prefetch_related": ("skill_stack__skill_stack",),
+        },
+    }
 
     def get_queryset(self):
-        """Получаем вакансии автора запроса."""
+        """
+        Получаем вакансии автора запроса.
+
+        Количество кандидатов подсчитывается в том же запросе через аннотацию,
+        чтобы сериализаторы не выполняли COUNT для каждой вакансии.
+        """
         user = self.request.user
-        return Vacancy.objects.filter(author=user)
+        return Vacancy.objects.filter(author=user).annotate(
+            candidates_count=Count("candidates", distinct=True)
+        )
 
     def get_serializer_class(self):
         """Функция определяющая сериализатор в зависимости от действия."""
@@ -381,6 +448,23 @@ class VacancyViewSet(ModelViewSet):
         """Переопределение метода update для записи информация о пользователе."""
         serializer.save(author=self.request.user)
 
+    @extend_schema(
+        summary="Получить сводку по вакансиям",
+        description=(
+            "Возвращает количество кандидатов на каждую вакансию автора "
+            "запроса по статусам кандидата и прохождения. Количества "
+            "считаются одним запросом и, если настроен кэш ответов, "
+            "кэшируются по вакансиям до изменения их кандидатов."
+        ),
+        filters=False,
+        responses=VacancySummarySerializer(many=True),
+    )
+    @action(detail=False, methods=["get"], pagination_class=None, filter_backends=())
+    def summary(self, request):
+        """Сводка по кандидатам вакансий автора запроса."""
+        summary = get_vacancy_summary(request.user.id)
+        return Response(VacancySummarySerializer(summary, many=True).data)
+
 
 @extend_schema(tags=["Резюме"])
 @extend_schema_view(
@@ -409,7 +493,7 @@ class VacancyViewSet(ModelViewSet):
         description="Удаляет выбранную вакансию из базы данных.",
     ),
 )
-class ResumeViewSet(ModelViewSet):
+class ResumeViewSet(ExportMixin, FastListMixin, QueryPlanMixin, ModelViewSet):
     """
     Вьюсет для модели резюме.
 
@@ -419,18 +503,16 @@ class ResumeViewSet(ModelViewSet):
 
     schema = AutoSchema()
     permission_classes = (IsAuthenticated,)
+    pagination_class = ListCursorPagination
+    fast_list_serializer_class = ResumesFastSerializer
+    export_serializer_class = ResumeExportSerializer
     queryset = ApplicantResume.objects.all()
     filter_backends = (
         DjangoFilterBackend,
-        SearchFilter,
         OrderingFilter,
+        FullTextSearchFilter,
     )
     filterset_class = ResumeFilterSet
-    search_fields = (
-        "job_title",
-        "town",
-        "current_job",
-    )
     ordering_fields = (
         "applicant",
         "work_experiences",
@@ -439,6 +521,9 @@ class ResumeViewSet(ModelViewSet):
         "pub_date",
     )
     ordering = ("pub_date",)
+    query_plan = {
+        "default": {"prefetch_related": ("work_experiences",)},
+    }
 
     def get_serializer_class(self):
         """Функция определяющая сериализатор в зависимости от действия."""
@@ -474,7 +559,7 @@ class ResumeViewSet(ModelViewSet):
         description="Удаляет выбранную заметку из базы данных.",
     ),
 )
-class NoteViewSet(ModelViewSet):
+class NoteViewSet(ConditionalGetMixin, QueryPlanMixin, ModelViewSet):
     """
     Вьюсет для модели заметок.
 
@@ -485,6 +570,9 @@ class NoteViewSet(ModelViewSet):
     schema = AutoSchema()
     permission_classes = (IsAuthenticated,)
     ordering = ("pub_date",)
+    query_plan = {
+        "list": {"prefetch_related": ("comments",)},
+    }
 
     def get_serializer_class(self):
         """Функция определяющая сериализатор в зависимости от действия."""
@@ -535,7 +623,7 @@ class NoteViewSet(ModelViewSet):
         description="Удаляет выбранный комментарий из базы данных.",
     ),
 )
-class CommentViewSet(ModelViewSet):
+class CommentViewSet(ConditionalGetMixin, QueryPlanMixin, ModelViewSet):
     """
     Вьюсет для модели комментариев к заметкам.
 
@@ -591,7 +679,14 @@ class CommentViewSet(ModelViewSet):
         description="Удаляет выбранного кандидата из базы данных.",
     ),
 )
-class CandidateViewSet(ModelViewSet):
+class CandidateViewSet(
+    ConditionalGetMixin,
+    CachedListMixin,
+    ExportMixin,
+    FastListMixin,
+    QueryPlanMixin,
+    ModelViewSet,
+):
     """
     Вьюсет для модели Candidate.
 
@@ -601,27 +696,18 @@ class CandidateViewSet(ModelViewSet):
 
     schema = AutoSchema()
     permission_classes = (IsAuthenticated,)
+    pagination_class = ListCursorPagination
+    fast_list_serializer_class = CandidatesFastSerializer
+    export_serializer_class = CandidateExportSerializer
+    cache_models = (Candidate, Vacancy)
+    last_modified_fields = ("updated_at", "vacancy__updated_at")
+    depends_on_today = True
     filter_backends = (
         DjangoFilterBackend,
-        SearchFilter,
         OrderingFilter,
+        FullTextSearchFilter,
     )
     filterset_class = CandidatesFilterSet
-    search_fields = (
-        "first_name",
-        "last_name",
-        "city",
-        "candidate_status",
-        "last_job",
-        "cur_position",
-        "phone_number",
-        "email",
-        "telegram",
-        "employment_type",
-        "schedule_work",
-        "education",
-        "interview_status",
-    )
     ordering_fields = (
         "last_name",
         "city",
@@ -638,6 +724,10 @@ class CandidateViewSet(ModelViewSet):
         "pub_date",
     )
     ordering = ("pub_date",)
+    query_plan = {
+        "list": {},
+        "default": {"select_related": ("vacancy",)},
+    }
 
     def get_queryset(self):
         """Получаем кандидатов на вакансию."""
@@ -660,6 +750,41 @@ class CandidateViewSet(ModelViewSet):
         vacancy = get_object_or_404(Vacancy, pk=self.kwargs.get("vacancy_id"))
         serializer.save(vacancy=vacancy)
 
+    @extend_schema(
+        summary="Импортировать кандидатов",
+        description=(
+            "Создает кандидатов на вакансию из CSV или XLSX файла. Заголовки "
+            "столбцов -- имена полей кандидата, коды множественного выбора "
+            "перечисляются через запятую. Строки с ошибками пропускаются и "
+            "возвращаются с номером строки файла."
+        ),
+        request=inline_serializer(
+            name="CandidateImportRequest", fields={"file": FileField()}
+        ),
+        responses=inline_serializer(
+            name="CandidateImportReport",
+            fields={
+                "created": IntegerField(),
+                "error_count": IntegerField(),
+                "errors": ListField(child=DictField()),
+            },
+        ),
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=(MultiPartParser,),
+    )
+    def import_candidates(self, request, *args, **kwargs):
+        """Импорт кандидатов на вакансию из файла."""
+        vacancy = get_object_or_404(Vacancy, pk=self.kwargs.get("vacancy_id"))
+        file = request.FILES.get("file")
+        if file is None:
+            raise ValidationError({"file": ["Файл не передан."]})
+        candidate_import = CandidateImport(vacancy).run(iter_rows(file, file.name))
+        return Response(candidate_import.report)
+
 
 @extend_schema(tags=["Компании"])
 @extend_schema_view(
@@ -688,7 +813,7 @@ class CandidateViewSet(ModelViewSet):
         description="Удаляет выбранную компанию из базы данных.",
     ),
 )
-class CompanyViewSet(ModelViewSet):
+class CompanyViewSet(CachedListMixin, FastListMixin, QueryPlanMixin, ModelViewSet):
     """
     Вьюсет для модели Company.
 
@@ -698,6 +823,9 @@ class CompanyViewSet(ModelViewSet):
 
     schema = AutoSchema()
     permission_classes = (IsAuthenticated,)
+    pagination_class = ListCursorPagination
+    fast_list_serializer_class = CompanyShortFastSerializer
+    cache_models = (Company,)
     queryset = Company.objects.all()
     filter_backends = (
         DjangoFilterBackend,
@@ -749,7 +877,7 @@ class CompanyViewSet(ModelViewSet):
         description="Удаляет выбранный этап из воронки кандидата.",
     ),
 )
-class FunnelViewSet(ModelViewSet):
+class FunnelViewSet(ConditionalGetMixin, QueryPlanMixin, ModelViewSet):
     """
     Вьюсет для воронки кандидата Funnel.
 
@@ -759,6 +887,14 @@ class FunnelViewSet(ModelViewSet):
 
     schema = AutoSchema()
     permission_classes = (IsAuthenticated,)
+    last_modified_fields = ("updated_at", "candidate__updated_at")
+    query_plan = {
+        "list": {
+            "select_related": ("candidate",),
+            "prefetch_related": ("substage",),
+        },
+        "default": {"select_related": ("candidate",)},
+    }
 
     def get_serializer_class(self):
         """Функция определяющая сериализатор в зависимости от действия."""
@@ -809,7 +945,7 @@ class FunnelViewSet(ModelViewSet):
         description="Удаляет выбранный подэтап из воронки кандидата.",
     ),
 )
-class SubStageViewSet(ModelViewSet):
+class SubStageViewSet(QueryPlanMixin, ModelViewSet):
     """
     Вьюсет для подэтапов воронки кандидата SubStage.
 
@@ -864,7 +1000,7 @@ class SubStageViewSet(ModelViewSet):
         description="Удаляет выбранное образовательное учреждение из базы данных.",
     ),
 )
-class EducationViewSet(ModelViewSet):
+class EducationViewSet(QueryPlanMixin, ModelViewSet):
     """
     Вьюсет для модели Education.
 
@@ -875,6 +1011,7 @@ class EducationViewSet(ModelViewSet):
     schema = AutoSchema()
     serializer_class = EducationSerializer
     permission_classes = (IsAuthenticated,)
+    pagination_class = ListCursorPagination
     queryset = Education.objects.all()
     filter_backends = (
         DjangoFilterBackend,
@@ -897,3 +1034,99 @@ class EducationViewSet(ModelViewSet):
         "educational_institution",
     )
     ordering = ("specialization",)
+
+
+@extend_schema(
+    tags=["События"],
+    summary="Получить повестку",
+    description=(
+        "Возвращает события кандидатов на вакансии автора запроса, "
+        "пересекающиеся с окном [date_from, date_to): начавшиеся до date_to "
+        "и закончившиеся не раньше date_from. Событие без end_date длится "
+        "один день. События упорядочены по дате и времени начала."
+    ),
+    parameters=[AgendaParamsSerializer],
+)
+class AgendaView(FastListMixin, ListAPIView):
+    """
+    Повестка событий HR за неделю, месяц или другое окно дат.
+
+    События выбираются одним запросом вместе с кандидатом и вакансией.
+    Многодневные события, начавшиеся до окна, тоже попадают в повестку:
+    условие на начало обслуживается индексом event_start_idx
+    (start_date, start_time, id), а на окончание -- индексом event_end_idx
+    по COALESCE(end_date, start_date). Окно не длиннее
+    AGENDA_MAX_DAYS дней, поэтому ответ не пагинируется и выводится
+    быстрым сериализатором из строк .values().
+
+    Разрешения:
+    IsAuthenticated -- доступ разрешен только аутентифицированным пользователям.
+    """
+
+    schema = AutoSchema()
+    permission_classes = (IsAuthenticated,)
+    serializer_class = AgendaEventSerializer
+    fast_list_serializer_class = AgendaFastSerializer
+    pagination_class = None
+
+    def get_queryset(self):
+        """События, пересекающие окно повестки, по кандидатам пользователя."""
+        params = AgendaParamsSerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        return (
+            Event.objects.filter(
+                GreaterThanOrEqual(
+                    Coalesce("end_date", "start_date"),
+                    params.validated_data["date_from"],
+                ),
+                candidate__vacancy__author=self.request.user,
+                start_date__lt=params.validated_data["date_to"],
+            )
+            .select_related("candidate__vacancy")
+            .order_by("start_date", "start_time", "id")
+        )
+
+
+@extend_schema(
+    tags=["Аналитика"],
+    summary="Получить аналитику воронки",
+    description=(
+        "Возвращает итоги этапов воронки по вакансиям или по рекрутерам: "
+        "количество кандидатов на этапе, прошедших и проваливших его, "
+        "конверсию и медиану дней на этапе."
+    ),
+    parameters=[FunnelAnalyticsParamsSerializer],
+)
+class FunnelAnalyticsView(ListAPIView):
+    """
+    Аналитика воронки по заранее посчитанным итогам FunnelSummary.
+
+    Итоги пересчитываются после фиксации изменений этапов (см.
+    recruitment.funnel.mark_funnel_dirty) и командой
+    refresh_funnel_summaries, поэтому запрос только читает готовые строки.
+    Пользователь видит итоги своих вакансий, персонал -- всех рекрутеров.
+
+    Разрешения:
+    IsAuthenticated -- доступ разрешен только аутентифицированным пользователям.
+    """
+
+    schema = AutoSchema()
+    permission_classes = (IsAuthenticated,)
+    serializer_class = FunnelSummarySerializer
+    pagination_class = None
+
+    def get_queryset(self):
+        """Итоги воронки рекрутеров, доступных пользователю."""
+        params = FunnelAnalyticsParamsSerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        params = params.validated_data
+        queryset = FunnelSummary.objects.filter(
+            vacancy__isnull=params["scope"] == "recruiter"
+        )
+        if "author" in params:
+            queryset = queryset.filter(author=params["author"])
+        if not self.request.user.is_staff:
+            queryset = queryset.filter(author=self.request.user)
+        if "vacancy" in params:
+            queryset = queryset.filter(vacancy=params["vacancy"])
+        return queryset.order_by("author_id", "vacancy_id", "stage")
@@ -36,6 +36,7 @@ INSTALLED_APPS = [
     "corsheaders",
     "users",
     "api",
+    "notifications",
     "multiselectfield",
     "django_filters",
     "drf_spectacular",
@@ -88,6 +89,31 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND",
+            default="django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", default=""),
+    },
+    # Кэш ответов списков API и сводок. Версии данных меняет процесс,
+    # который записал изменения (воркер gunicorn, команда импорта), поэтому
+    # кэш должен быть общим для всех процессов: Redis, Memcached или
+    # DatabaseCache. По умолчанию кэширование выключено (DummyCache).
+    "responses": {
+        "BACKEND": os.getenv(
+            "RESPONSE_CACHE_BACKEND",
+            default="django.core.cache.backends.dummy.DummyCache",
+        ),
+        "LOCATION": os.getenv("RESPONSE_CACHE_LOCATION", default="responses"),
+    },
+}
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", default=5 * 60))
+VACANCY_SUMMARY_CACHE_TIMEOUT = int(
+    os.getenv("VACANCY_SUMMARY_CACHE_TIMEOUT", default=5 * 60)
+)
+
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -119,6 +145,23 @@ STATIC_ROOT = os.path.join(BASE_DIR, "static_backend")
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+FILE_UPLOAD_HANDLERS = [
+    "api.uploads.MaxSizeUploadHandler",
+    "django.core.files.uploadhandler.MemoryFileUploadHandler",
+    "django.core.files.uploadhandler.TemporaryFileUploadHandler",
+]
+FILE_UPLOAD_MAX_SIZE = int(os.getenv("FILE_UPLOAD_MAX_SIZE", default=100 * 1024**2))
+UPLOAD_PDF_MAX_SIZE = int(os.getenv("UPLOAD_PDF_MAX_SIZE", default=25 * 1024**2))
+UPLOAD_IMAGE_MAX_SIZE = int(os.getenv("UPLOAD_IMAGE_MAX_SIZE", default=10 * 1024**2))
+
+THUMBNAIL_SIZE = (128, 128)
+THUMBNAIL_FORMAT = os.getenv("THUMBNAIL_FORMAT", default="WEBP")
+THUMBNAIL_QUALITY = int(os.getenv("THUMBNAIL_QUALITY", default=80))
+THUMBNAIL_WORKERS = int(os.getenv("THUMBNAIL_WORKERS", default=2))
+
+RESUME_TEXT_WORKERS = int(os.getenv("RESUME_TEXT_WORKERS", default=2))
+RESUME_TEXT_MAX_LENGTH = int(os.getenv("RESUME_TEXT_MAX_LENGTH", default=100_000))
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
@@ -133,8 +176,12 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", default=50))
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", default=500))
+
 DRF_STANDARDIZED_ERRORS = {
-    "EXCEPTION_FORMATTER_CLASS": "api.exceptions.MyExceptionFormatter"
+    "EXCEPTION_HANDLER_CLASS": "api.exceptions.MyExceptionHandler",
+    "EXCEPTION_FORMATTER_CLASS": "api.exceptions.MyExceptionFormatter",
 }
 
 SPECTACULAR_SETTINGS = {
@@ -240,3 +287,31 @@ EMAIL_HOST_USER = "noreply@" + DOMAIN_NAME
 
 TELEGRAM_CHAT_ID = os.getenv("TG_CHAT_ID")
 TELEGRAM_TOKEN = os.getenv("TG_TOKEN")
+TELEGRAM_SIGNUP_THREAD_ID = 12
+TELEGRAM_BOT = os.getenv(
+    "TELEGRAM_BOT",
+    default="api.telegram.TelegramBot" if TELEGRAM_TOKEN else "api.telegram.LoggingBot",
+)
+TELEGRAM_POOL_SIZE = int(os.getenv("TELEGRAM_POOL_SIZE", default=4))
+
+GOOGLE_CALENDAR_CREDENTIALS_FILE = os.getenv("GOOGLE_CALENDAR_CREDENTIALS_FILE")
+GOOGLE_CALENDAR_ID = os.getenv("GOOGLE_CALENDAR_ID", default="primary")
+GOOGLE_CALENDAR_ROOT_URL = os.getenv("GOOGLE_CALENDAR_ROOT_URL")
+GOOGLE_CALENDAR_BACKEND = os.getenv(
+    "GOOGLE_CALENDAR_BACKEND",
+    default="services.g_calendar.GoogleCalendar"
+    if GOOGLE_CALENDAR_CREDENTIALS_FILE or GOOGLE_CALENDAR_ROOT_URL
+    else "services.g_calendar.StubCalendar",
+)
+GOOGLE_CALENDAR_TIMEOUT = int(os.getenv("GOOGLE_CALENDAR_TIMEOUT", default=30))
+GOOGLE_CALENDAR_BATCH_SIZE = int(os.getenv("GOOGLE_CALENDAR_BATCH_SIZE", default=50))
+
+NOTIFICATION_TRANSPORTS = {
+    "email": "notifications.transports.EmailTransport",
+    "telegram": "notifications.transports.TelegramTransport",
+}
+NOTIFICATION_MAX_ATTEMPTS = int(os.getenv("NOTIFICATION_MAX_ATTEMPTS", default=8))
+NOTIFICATION_RETRY_DELAY = int(os.getenv("NOTIFICATION_RETRY_DELAY", default=30))
+NOTIFICATION_RETRY_MAX_DELAY = int(
+    os.getenv("NOTIFICATION_RETRY_MAX_DELAY", default=3600)
+)
@@ -0,0 +1,22 @@
+from django.contrib import admin
+
+from .models import OutboxMessage
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    """Добавление модели OutboxMessage в админку."""
+
+    list_display = (
+        "channel",
+        "recipient",
+        "subject",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "sent_at",
+    )
+    list_filter = ("channel", "status")
+    search_fields = ("recipient", "subject")
+    readonly_fields = ("created_at", "sent_at", "last_error")
+    empty_value_display = "-пусто-"
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class NotificationsConfig(AppConfig):
+    """Настройка приложения Notifications."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "notifications"
@@ -0,0 +1,17 @@
+EMAIL = "email"
+TELEGRAM = "telegram"
+
+CHANNEL = (
+    (EMAIL, "Email"),
+    (TELEGRAM, "Telegram"),
+)
+
+PENDING = "P"
+SENT = "S"
+FAILED = "F"
+
+MESSAGE_STATUS = (
+    (PENDING, "Ожидает отправки"),
+    (SENT, "Отправлено"),
+    (FAILED, "Не доставлено"),
+)
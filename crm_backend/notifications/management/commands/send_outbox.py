@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+from notifications.services import deliver_pending
+
+
+class Command(BaseCommand):
+    """Фоновая доставка уведомлений из очереди."""
+
+    help = (
+        "Отправляет уведомления из очереди OutboxMessage с повторными "
+        "попытками. Без --once работает постоянно и опрашивает очередь "
+        "с интервалом --interval секунд."
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Обработать очередь один раз и завершиться.",
+        )
+        parser.add_argument("--interval", type=float, default=5)
+        parser.add_argument("--batch-size", type=int, default=100)
+
+    def handle(self, *args, **options):
+        """Цикл обработки очереди."""
+        while True:
+            processed, sent = deliver_pending(options["batch_size"])
+            if processed:
+                self.stdout.write(
+                    f"Обработано уведомлений: {processed}, отправлено: {sent}"
+                )
+            if options["once"]:
+                return
+            if processed < options["batch_size"]:
+                time.sleep(options["interval"])
@@ -0,0 +1,103 @@
+# Generated by Django 4.1 on 2026-10-18 01:37
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxMessage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "channel",
+                    models.CharField(
+                        choices=[("email", "Email"), ("telegram", "Telegram")],
+                        max_length=10,
+                        verbose_name="Канал доставки",
+                    ),
+                ),
+                (
+                    "recipient",
+                    models.CharField(max_length=254, verbose_name="Получатель"),
+                ),
+                (
+                    "subject",
+                    models.CharField(blank=True, max_length=255, verbose_name="Тема"),
+                ),
+                ("body", models.TextField(verbose_name="Текст сообщения")),
+                (
+                    "thread_id",
+                    models.IntegerField(
+                        blank=True, null=True, verbose_name="Тема чата Telegram"
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("P", "Ожидает отправки"),
+                            ("S", "Отправлено"),
+                            ("F", "Не доставлено"),
+                        ],
+                        default="P",
+                        max_length=1,
+                        verbose_name="Статус",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="Количество попыток"
+                    ),
+                ),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        verbose_name="Следующая попытка",
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, verbose_name="Последняя ошибка"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Создано"),
+                ),
+                (
+                    "sent_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Отправлено"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Исходящее уведомление",
+                "verbose_name_plural": "Исходящие уведомления",
+                "ordering": ("next_attempt_at", "id"),
+            },
+        ),
+        migrations.AddIndex(
+            model_name="outboxmessage",
+            index=models.Index(
+                condition=models.Q(("status", "P")),
+                fields=["next_attempt_at", "id"],
+                name="outbox_pending_idx",
+            ),
+        ),
+    ]
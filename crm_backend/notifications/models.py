@@ -0,0 +1,55 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+from .constants import CHANNEL, MESSAGE_STATUS, PENDING
+
+
+class OutboxMessage(models.Model):
+    """
+    Модель исходящего уведомления.
+
+    Запись создается в транзакции запроса, а доставкой занимается фоновый
+    обработчик (команда send_outbox), поэтому запрос не ждет почтовый сервер
+    и API Telegram.
+    """
+
+    channel = models.CharField(
+        max_length=10, choices=CHANNEL, verbose_name="Канал доставки"
+    )
+    recipient = models.CharField(max_length=254, verbose_name="Получатель")
+    subject = models.CharField(max_length=255, blank=True, verbose_name="Тема")
+    body = models.TextField(verbose_name="Текст сообщения")
+    thread_id = models.IntegerField(
+        null=True, blank=True, verbose_name="Тема чата Telegram"
+    )
+    status = models.CharField(
+        max_length=1,
+        choices=MESSAGE_STATUS,
+        default=PENDING,
+        verbose_name="Статус",
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name="Количество попыток"
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now, verbose_name="Следующая попытка"
+    )
+    last_error = models.TextField(blank=True, verbose_name="Последняя ошибка")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Создано")
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name="Отправлено")
+
+    class Meta:
+        ordering = ("next_attempt_at", "id")
+        verbose_name = "Исходящее уведомление"
+        verbose_name_plural = "Исходящие уведомления"
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at", "id"],
+                condition=Q(status=PENDING),
+                name="outbox_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_channel_display()}: {self.recipient}"
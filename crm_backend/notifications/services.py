@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .constants import EMAIL, FAILED, PENDING, SENT, TELEGRAM
+from .models import OutboxMessage
+from .transports import get_transport
+
+
+def enqueue_email(recipient, subject, body):
+    """Постановка письма в очередь отправки."""
+    return OutboxMessage.objects.create(
+        channel=EMAIL, recipient=recipient, subject=subject, body=body
+    )
+
+
+def enqueue_telegram(chat_id, body, thread_id=None):
+    """Постановка сообщения Telegram в очередь отправки."""
+    return OutboxMessage.objects.create(
+        channel=TELEGRAM, recipient=chat_id, body=body, thread_id=thread_id
+    )
+
+
+def get_retry_delay(attempts):
+    """
+    Задержка перед следующей попыткой после attempts неудачных.
+
+    Задержка удваивается с каждой попыткой, но не превышает
+    NOTIFICATION_RETRY_MAX_DELAY.
+    """
+    delay = settings.NOTIFICATION_RETRY_DELAY * 2 ** (attempts - 1)
+    return timedelta(seconds=min(delay, settings.NOTIFICATION_RETRY_MAX_DELAY))
+
+
+def deliver(message):
+    """
+    Доставка одного уведомления и запись результата.
+
+    При ошибке попытка откладывается с экспоненциальной задержкой, а после
+    NOTIFICATION_MAX_ATTEMPTS попыток уведомление помечается недоставленным.
+    Возвращает True, если уведомление отправлено.
+    """
+    message.attempts += 1
+    try:
+        get_transport(message.channel).send(message)
+    except Exception as error:
+        message.last_error = f"{type(error).__name__}: {error}"
+        if message.attempts >= settings.NOTIFICATION_MAX_ATTEMPTS:
+            message.status = FAILED
+        else:
+            message.next_attempt_at = timezone.now() + get_retry_delay(message.attempts)
+        message.save()
+        return False
+    message.status = SENT
+    message.sent_at = timezone.now()
+    message.save()
+    return True
+
+
+def deliver_pending(batch_size=100):
+    """
+    Доставка уведомлений, время отправки которых наступило.
+
+    Каждое уведомление блокируется в отдельной транзакции с SKIP LOCKED,
+    поэтому несколько обработчиков могут работать одновременно и не
+    отправят одно сообщение дважды. Возвращает количество обработанных и
+    отправленных уведомлений.
+    """
+    due = OutboxMessage.objects.filter(
+        status=PENDING, next_attempt_at__lte=timezone.now()
+    )
+    processed = sent = 0
+    for message_id in due.values_list("id", flat=True)[:batch_size]:
+        with transaction.atomic():
+            message = (
+                due.select_for_update(skip_locked=True).filter(id=message_id).first()
+            )
+            if message is None:
+                continue
+            processed += 1
+            sent += deliver(message)
+    return processed, sent
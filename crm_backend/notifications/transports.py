@@ -0,0 +1,58 @@
+from django.conf import settings
+from django.core.mail import send_mail
+from django.utils.module_loading import import_string
+
+
+class EmailTransport:
+    """Доставка уведомлений по почте через EMAIL_BACKEND."""
+
+    def send(self, message):
+        """Отправка письма; ошибка почтового сервера пробрасывается."""
+        send_mail(
+            message.subject,
+            message.body,
+            settings.EMAIL_HOST_USER,
+            [message.recipient],
+            fail_silently=False,
+        )
+
+
+class TelegramTransport:
+    """Доставка уведомлений в чат Telegram."""
+
+    def send(self, message):
+        """Отправка сообщения; ошибка API Telegram пробрасывается."""
+        from api.utils import get_bot
+
+        get_bot().send_message(
+            message.recipient, message.body, message_thread_id=message.thread_id
+        )
+
+
+class FakeTransport:
+    """
+    Локальный транспорт для тестов и разработки.
+
+    Сообщения не покидают процесс, а сохраняются в FakeTransport.sent.
+    Если задан FakeTransport.error, отправка завершается этим исключением.
+    """
+
+    sent = []
+    error = None
+
+    @classmethod
+    def reset(cls):
+        """Очистка отправленных сообщений и ошибки."""
+        cls.sent = []
+        cls.error = None
+
+    def send(self, message):
+        """Сохранение сообщения в списке отправленных."""
+        if self.error is not None:
+            raise self.error
+        self.sent.append(message)
+
+
+def get_transport(channel):
+    """Транспорт для канала из настройки NOTIFICATION_TRANSPORTS."""
+    return import_string(settings.NOTIFICATION_TRANSPORTS[channel])()
@@ -2,13 +2,16 @@ from django.contrib import admin
 
 from .models import (
     ApplicantResume,
+    CalendarSyncState,
     Candidate,
     Comment,
     Company,
     Education,
     Event,
     FunnelStage,
+    FunnelSummary,
     Note,
+    ResumeText,
     Skills,
     SkillStack,
     SubStage,
@@ -249,3 +252,38 @@ class NoteAdmin(admin.ModelAdmin):
     list_filter = ("candidate", "author", "pub_date")
     search_fields = ("candidate", "author", "pub_date")
     readonly_fields = ("pub_date",)
+
+
+@admin.register(CalendarSyncState)
+class CalendarSyncStateAdmin(admin.ModelAdmin):
+    """Добавление модели CalendarSyncState в админку."""
+
+    list_display = ("calendar_id", "pushed_at", "pulled_at")
+    readonly_fields = ("sync_token", "pushed_at", "pulled_at")
+
+
+@admin.register(ResumeText)
+class ResumeTextAdmin(admin.ModelAdmin):
+    """Добавление модели ResumeText в админку."""
+
+    list_display = ("candidate", "file_name", "extracted_at")
+    readonly_fields = ("candidate", "file_name", "file_hash", "extracted_at")
+    raw_id_fields = ("candidate",)
+
+
+@admin.register(FunnelSummary)
+class FunnelSummaryAdmin(admin.ModelAdmin):
+    """Добавление модели FunnelSummary в админку."""
+
+    list_display = ("stage", "author", "vacancy", "total", "passed", "failed")
+    list_filter = ("author",)
+    readonly_fields = (
+        "author",
+        "vacancy",
+        "stage",
+        "total",
+        "passed",
+        "failed",
+        "median_days",
+        "updated_at",
+    )
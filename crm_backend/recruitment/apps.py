@@ -6,3 +6,7 @@ class RecruitmentConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "recruitment"
+
+    def ready(self):
+        """Подключение сигналов и лукапов приложения."""
+        from . import lookups, signals  # noqa: F401
@@ -0,0 +1,107 @@
+from api.cache import get_response_cache, response_cache_enabled
+from django.conf import settings
+from django.db.models import Count, Q
+
+from .constants import CANDIDATE_STATUS, INTERVIEW_STATUS
+from .models import Vacancy
+
+STATUS_FIELDS = {
+    "candidate_status": CANDIDATE_STATUS,
+    "interview_status": INTERVIEW_STATUS,
+}
+# Поля сводки, которые зависят только от кандидатов вакансии и хранятся в кэше.
+COUNT_FIELDS = ("candidates_count", *STATUS_FIELDS)
+
+
+def vacancy_summary_cache_key(vacancy_id):
+    """Ключ кэша количества кандидатов вакансии по статусам."""
+    return f"vacancy-summary:{vacancy_id}"
+
+
+def status_counts():
+    """
+    Аннотации количества кандидатов по статусам.
+
+    Возвращает {имя аннотации: (поле статуса, код)}: каждый статус
+    считается условным Count с filter=, поэтому все статусы всех вакансий
+    подсчитываются одним сгруппированным запросом.
+    """
+    return {
+        f"{field}_{code}": (field, code)
+        for field, choices in STATUS_FIELDS.items()
+        for code, _ in choices
+    }
+
+
+def vacancy_summary(vacancies):
+    """
+    Количество кандидатов на вакансии vacancies по статусам.
+
+    Возвращает список {"id", "vacancy_title", "vacancy_status",
+    "candidates_count", "candidate_status": {код: количество},
+    "interview_status": {код: количество}}.
+    """
+    counts = status_counts()
+    rows = (
+        vacancies.order_by("pub_date", "id")
+        .values("id", "vacancy_title", "vacancy_status")
+        .annotate(
+            candidates_count=Count("candidates"),
+            **{
+                name: Count("candidates", filter=Q(**{f"candidates__{field}": code}))
+                for name, (field, code) in counts.items()
+            },
+        )
+    )
+    summary = []
+    for row in rows:
+        for field in STATUS_FIELDS:
+            row[field] = {}
+        for name, (field, code) in counts.items():
+            row[field][code] = row.pop(name)
+        summary.append(row)
+    return summary
+
+
+def get_vacancy_summary(author_id):
+    """
+    Сводка по вакансиям автора с количествами из кэша ответов.
+
+    Без настроенного кэша сводка считается одним запросом. Иначе список
+    вакансий автора читается из базы, а количества кандидатов берутся из
+    кэша по вакансиям и считаются одним запросом только для промахов;
+    изменения кандидатов удаляют количества своей вакансии из кэша раньше
+    VACANCY_SUMMARY_CACHE_TIMEOUT.
+    """
+    vacancies = Vacancy.objects.filter(author=author_id)
+    if not response_cache_enabled():
+        return vacancy_summary(vacancies)
+    cache = get_response_cache()
+    summary = list(
+        vacancies.order_by("pub_date", "id").values(
+            "id", "vacancy_title", "vacancy_status"
+        )
+    )
+    keys = {row["id"]: vacancy_summary_cache_key(row["id"]) for row in summary}
+    cached = cache.get_many(keys.values())
+    missing = [vacancy_id for vacancy_id, key in keys.items() if key not in cached]
+    if missing:
+        counts = {
+            keys[row["id"]]: {field: row[field] for field in COUNT_FIELDS}
+            for row in vacancy_summary(Vacancy.objects.filter(pk__in=missing))
+        }
+        cache.set_many(counts, settings.VACANCY_SUMMARY_CACHE_TIMEOUT)
+        cached.update(counts)
+    # Вакансии, удаленные между запросами, в сводку не попадают.
+    return [
+        {**row, **cached[keys[row["id"]]]}
+        for row in summary
+        if keys[row["id"]] in cached
+    ]
+
+
+def invalidate_vacancy_summary(*vacancy_ids):
+    """Удаление количеств кандидатов вакансий из кэша."""
+    get_response_cache().delete_many(
+        [vacancy_summary_cache_key(vacancy_id) for vacancy_id in vacancy_ids]
+    )
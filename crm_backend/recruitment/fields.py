@@ -0,0 +1,46 @@
+from django import forms
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+
+
+class ChoiceArrayField(ArrayField):
+    """
+    Множественный выбор, хранящийся как массив кодов вариантов.
+
+    Заменяет MultiSelectField: вместо строки "PO,CH" хранится массив
+    {PO,CH}, поэтому фильтры по вариантам выполняются операторами массивов
+    (@>, &&) с GIN-индексом, а не LIKE по подстроке. Значения сортируются в
+    порядке вариантов выбора, множества из MultipleChoiceField приводятся к
+    списку.
+    """
+
+    def __init__(self, choices, **kwargs):
+        """Массив значений из вариантов выбора choices."""
+        kwargs.setdefault("base_field", models.CharField(max_length=2, choices=choices))
+        super().__init__(**kwargs)
+
+    def deconstruct(self):
+        """Описание поля для миграций: варианты выбора вместо base_field."""
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["choices"] = self.base_field.choices
+        kwargs.pop("base_field")
+        return name, path, args, kwargs
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        """Значение для записи в БД: список кодов в порядке вариантов."""
+        if isinstance(value, (set, frozenset)):
+            order = [key for key, _ in self.base_field.flatchoices]
+            value = sorted(value, key=order.index)
+        return super().get_db_prep_value(value, connection, prepared)
+
+    def formfield(self, **kwargs):
+        """Поле формы с флажками для каждого варианта выбора."""
+        defaults = {
+            "choices": self.base_field.choices,
+            "required": not self.blank,
+            "label": self.verbose_name,
+            "help_text": self.help_text,
+            "widget": forms.CheckboxSelectMultiple,
+        }
+        defaults.update(kwargs)
+        return forms.TypedMultipleChoiceField(**defaults)
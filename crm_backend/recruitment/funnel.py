@@ -0,0 +1,150 @@
+from django.db import transaction
+from django.db.models import (
+    Aggregate,
+    Count,
+    F,
+    FloatField,
+    Func,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
+
+from .models import FunnelStage, FunnelSummary, SubStage, Vacancy
+
+STATUS_PASSED = "2"
+STATUS_FAILED = "3"
+
+
+class Median(Aggregate):
+    """Медиана значений (PERCENTILE_CONT(0.5) в PostgreSQL)."""
+
+    function = "PERCENTILE_CONT"
+    name = "Median"
+    template = "%(function)s(0.5) WITHIN GROUP (ORDER BY %(expressions)s)"
+    output_field = FloatField()
+
+
+class DateDiff(Func):
+    """Разница двух дат в днях."""
+
+    arg_joiner = " - "
+    template = "(%(expressions)s)"
+    output_field = IntegerField()
+
+
+def stage_end_date():
+    """
+    Дата завершения этапа воронки.
+
+    Этап длится до последнего подэтапа с датой, а если таких нет -- до
+    начала следующего по дате этапа кандидата.
+    """
+    last_substage = (
+        SubStage.objects.filter(stage=OuterRef("pk"), date__isnull=False)
+        .order_by("-date")
+        .values("date")[:1]
+    )
+    next_stage = (
+        FunnelStage.objects.filter(
+            candidate=OuterRef("candidate"), date__gt=OuterRef("date")
+        )
+        .order_by("date")
+        .values("date")[:1]
+    )
+    return Coalesce(Subquery(last_substage), Subquery(next_stage))
+
+
+def stage_totals(stages, *group):
+    """Итоги этапов stages, сгруппированные по колонкам group и названию."""
+    return (
+        stages.annotate(end_date=stage_end_date())
+        .order_by()
+        .values(*group, "name")
+        .annotate(
+            total=Count("id"),
+            passed=Count("id", filter=Q(status=STATUS_PASSED)),
+            failed=Count("id", filter=Q(status=STATUS_FAILED)),
+            median_days=Median(
+                DateDiff("end_date", "date"), filter=Q(end_date__gte=F("date"))
+            ),
+        )
+    )
+
+
+def summary_rows(stages, **fields):
+    """
+    Строки FunnelSummary из итогов этапов.
+
+    fields -- поля строки и колонки группировки, из которых они берутся.
+    """
+    return [
+        FunnelSummary(
+            stage=row["name"],
+            total=row["total"],
+            passed=row["passed"],
+            failed=row["failed"],
+            median_days=row["median_days"],
+            **{name: row[source] for name, source in fields.items()},
+        )
+        for row in stage_totals(stages, *fields.values())
+    ]
+
+
+def mark_funnel_dirty(vacancies):
+    """
+    Отметка вакансий, итоги воронки которых нужно пересчитать.
+
+    Если отмечена хотя бы одна вакансия, итоги пересчитываются после
+    фиксации транзакции. Вакансии, оставшиеся отмеченными (например, после
+    ошибки пересчета), пересчитывает команда refresh_funnel_summaries.
+    """
+    if vacancies.filter(funnel_dirty=False).update(funnel_dirty=True):
+        transaction.on_commit(refresh_funnel_summaries)
+
+
+def refresh_funnel_summaries(authors=None):
+    """
+    Пересчет итогов воронки для вакансий с funnel_dirty.
+
+    authors ограничивает пересчет вакансиями этих рекрутеров. Пересчитываются
+    строки отмеченных вакансий и итоги их рекрутеров, остальные строки не
+    затрагиваются. Вакансии рекрутеров блокируются до конца транзакции,
+    поэтому пересчеты одного рекрутера не выполняются одновременно, а этап,
+    сохраненный во время пересчета, снова отметит вакансию и попадет в
+    следующий пересчет. Возвращает количество пересчитанных вакансий.
+    """
+    dirty = Vacancy.objects.filter(funnel_dirty=True).order_by()
+    if authors is not None:
+        dirty = dirty.filter(author__in=authors)
+    authors = set(dirty.values_list("author_id", flat=True))
+    if not authors:
+        return 0
+    with transaction.atomic():
+        list(
+            Vacancy.objects.filter(author__in=authors)
+            .select_for_update()
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        vacancies = list(dirty.filter(author__in=authors).values_list("pk", flat=True))
+        if not vacancies:
+            return 0
+        Vacancy.objects.filter(pk__in=vacancies).update(funnel_dirty=False)
+        FunnelSummary.objects.filter(
+            Q(vacancy__in=vacancies) | Q(vacancy__isnull=True, author__in=authors)
+        ).delete()
+        FunnelSummary.objects.bulk_create(
+            summary_rows(
+                FunnelStage.objects.filter(candidate__vacancy__in=vacancies),
+                vacancy_id="candidate__vacancy",
+                author_id="candidate__vacancy__author",
+            )
+            + summary_rows(
+                FunnelStage.objects.filter(candidate__vacancy__author__in=authors),
+                author_id="candidate__vacancy__author",
+            )
+        )
+    return len(vacancies)
@@ -0,0 +1,22 @@
+from django.db.models import CharField
+from django.db.models.lookups import PatternLookup
+
+
+@CharField.register_lookup
+class TrigramIContains(PatternLookup):
+    """
+    Поиск подстроки без учета регистра через ILIKE.
+
+    В отличие от icontains, который в PostgreSQL строится как
+    UPPER(field::text) LIKE UPPER(...), условие field ILIKE '%...%'
+    обслуживается GIN-индексом с классом операторов gin_trgm_ops.
+    """
+
+    lookup_name = "trgm_icontains"
+
+    def get_rhs_op(self, connection, rhs):
+        """Оператор ILIKE для значения или выражения."""
+        if hasattr(self.rhs, "as_sql") or self.bilateral_transforms:
+            pattern = "ILIKE '%%' || {} || '%%'".format(connection.pattern_esc)
+            return pattern.format(rhs)
+        return f"ILIKE {rhs}"
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from recruitment.resume_text import RESUME_TEXT_CHUNK_SIZE, ResumeTextExtraction
+
+
+class Command(BaseCommand):
+    """Извлечение текста резюме кандидатов для поиска."""
+
+    help = (
+        "Извлекает текст из PDF-резюме кандидатов в пуле из RESUME_TEXT_WORKERS "
+        "процессов. Разбираются только новые и изменившиеся файлы: изменения "
+        "определяются по SHA-256 файла."
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument(
+            "--rehash",
+            action="store_true",
+            help="Пересчитать SHA-256 всех файлов, а не только новых.",
+        )
+        parser.add_argument("--workers", type=int)
+        parser.add_argument("--chunk-size", type=int, default=RESUME_TEXT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        """Извлечение текста резюме."""
+        extraction = ResumeTextExtraction(
+            workers=options["workers"], chunk_size=options["chunk_size"]
+        ).run(rehash=options["rehash"])
+        self.stdout.write(
+            f"Проверено файлов: {extraction.checked}, "
+            f"разобрано: {extraction.extracted}, "
+            f"без повторного разбора: {extraction.reused}, "
+            f"удалено текстов: {extraction.removed}"
+        )
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from recruitment.funnel import refresh_funnel_summaries
+
+
+class Command(BaseCommand):
+    """Пересчет итогов воронки."""
+
+    help = (
+        "Пересчитывает итоги воронки для вакансий, этапы которых изменились "
+        "с прошлого пересчета. Запускается по расписанию, чтобы аналитика "
+        "воронки не пересчитывала итоги при чтении."
+    )
+
+    def handle(self, *args, **options):
+        """Пересчет итогов воронки."""
+        self.stdout.write(f"Пересчитано вакансий: {refresh_funnel_summaries()}")
@@ -0,0 +1,91 @@
+from collections import defaultdict
+from datetime import date, time, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from recruitment.models import Event
+from services.calendar_sync import CalendarSync
+from services.fake_calendar import FakeCalendarServer
+from services.g_calendar import GoogleCalendar, StubCalendar, get_calendar
+
+
+class Command(BaseCommand):
+    """Синхронизация событий с Google Calendar."""
+
+    help = (
+        "Получает изменения календаря по токену синхронизации и отправляет "
+        "созданные, измененные и удаленные события batch-запросами. Для "
+        "каждого пакета выводит размер, время и скорость. С --fake-server "
+        "синхронизирует с локальным сервером Calendar API, с --benchmark N "
+        "создает N событий во временной транзакции и синхронизирует их с "
+        "локальным сервером. Без этих параметров и без настроенного Google "
+        "Calendar команда завершается с ошибкой: синхронизация с "
+        "StubCalendar отметила бы события отправленными, не отправив их."
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument("--batch-size", type=int)
+        parser.add_argument(
+            "--fake-server",
+            action="store_true",
+            help="Синхронизировать с локальным сервером Calendar API.",
+        )
+        parser.add_argument("--benchmark", type=int, metavar="N")
+
+    def handle(self, *args, **options):
+        """Запуск синхронизации."""
+        if not (options["fake_server"] or options["benchmark"]):
+            calendar = get_calendar()
+            if isinstance(calendar, StubCalendar):
+                raise CommandError(
+                    "Google Calendar не настроен: задайте "
+                    "GOOGLE_CALENDAR_CREDENTIALS_FILE или "
+                    "GOOGLE_CALENDAR_ROOT_URL, либо используйте --fake-server."
+                )
+            self.sync(calendar, options["batch_size"])
+            return
+        server = FakeCalendarServer().start()
+        try:
+            calendar = GoogleCalendar(root_url=server.url)
+            if options["benchmark"]:
+                self.benchmark(calendar, options["benchmark"], options["batch_size"])
+            else:
+                self.sync(calendar, options["batch_size"])
+            self.stdout.write(f"HTTP-запросов к календарю: {server.requests}")
+        finally:
+            server.stop()
+
+    def sync(self, calendar, batch_size):
+        """Синхронизация с выводом метрик по пакетам и итога."""
+        totals = defaultdict(lambda: [0, 0.0])
+        for stats in CalendarSync(calendar, batch_size).run():
+            self.stdout.write(str(stats))
+            totals[stats.operation][0] += stats.size
+            totals[stats.operation][1] += stats.seconds
+        for operation, (size, seconds) in totals.items():
+            rate = size / seconds if seconds else 0
+            self.stdout.write(
+                f"{operation}: всего {size} событий за {seconds:.2f} с, "
+                f"{rate:.0f} событий/с"
+            )
+
+    def benchmark(self, calendar, count, batch_size):
+        """Создание, изменение и удаление событий в откатываемой транзакции."""
+        with transaction.atomic():
+            Event.objects.bulk_create(
+                Event(
+                    title=f"Интервью {number}",
+                    start_date=date.today() + timedelta(days=number % 30),
+                    start_time=time(10 + number % 8),
+                    end_time=time(11 + number % 8),
+                )
+                for number in range(count)
+            )
+            self.sync(calendar, batch_size)
+            events = Event.objects.order_by("id")
+            changed = events.filter(id__in=events.values("id")[: count // 2])
+            changed.update(title="Интервью перенесено", calendar_dirty=True)
+            events.filter(id__in=events.reverse().values("id")[: count // 4]).delete()
+            self.sync(calendar, batch_size)
+            transaction.set_rollback(True)
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from recruitment.models import ApplicantResume, Candidate, Vacancy
+from recruitment.search import update_search_vectors
+
+
+class Command(BaseCommand):
+    """Пересчет поисковых векторов кандидатов, резюме и вакансий."""
+
+    help = "Пересчитывает поисковые векторы для полнотекстового поиска."
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument(
+            "--only-missing",
+            action="store_true",
+            help="Пересчитать только объекты без поискового вектора.",
+        )
+
+    def handle(self, *args, **options):
+        """Пересчет поисковых векторов."""
+        for model in (Candidate, ApplicantResume, Vacancy):
+            queryset = model.objects.all()
+            if options["only_missing"]:
+                queryset = queryset.filter(search_vector__isnull=True)
+            updated = update_search_vectors(queryset)
+            self.stdout.write(f"{model._meta.verbose_name_plural}: {updated}")
@@ -0,0 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from recruitment.thumbnails import THUMBNAIL_FIELDS, run_thumbnail_task
+
+
+class Command(BaseCommand):
+    """Создание миниатюр фотографий и логотипов."""
+
+    help = (
+        "Создает миниатюры фотографий кандидатов и пользователей и логотипов "
+        "компаний в пуле из THUMBNAIL_WORKERS потоков."
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument(
+            "--only-missing",
+            action="store_true",
+            help="Создать только отсутствующие миниатюры.",
+        )
+
+    def handle(self, *args, **options):
+        """Создание миниатюр."""
+        workers = max(settings.THUMBNAIL_WORKERS, 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for model, (field, thumbnail_field) in THUMBNAIL_FIELDS.items():
+                queryset = model.objects.exclude(**{f"{field}__isnull": True}).exclude(
+                    **{field: ""}
+                )
+                if options["only_missing"]:
+                    queryset = queryset.filter(**{f"{thumbnail_field}__isnull": True})
+                pks = list(queryset.values_list("pk", flat=True))
+                created = sum(
+                    thumbnail is not None
+                    for thumbnail in executor.map(
+                        run_thumbnail_task, repeat(model), pks
+                    )
+                )
+                self.stdout.write(
+                    f"{model._meta.verbose_name_plural}: {created} из {len(pks)}"
+                )
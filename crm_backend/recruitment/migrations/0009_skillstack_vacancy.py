@@ -0,0 +1,56 @@
+# Generated by Django 4.1 on 2026-10-18 10:00
+
+import logging
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+logger = logging.getLogger(__name__)
+
+
+def fill_skillstack_vacancy(apps, schema_editor):
+    """
+    Перенос связей вакансий со стеком навыков во внешний ключ.
+
+    Стек, общий для нескольких вакансий, остается у первой из них, а для
+    остальных создаются копии. Стеки без вакансий не удаляются.
+
+    Индекс и ограничение внешнего ключа создаются в конце миграции, а
+    PostgreSQL не меняет таблицу с отложенными проверками ограничений,
+    поэтому проверки выполняются сразу после переноса.
+    """
+    SkillStack = apps.get_model('recruitment', 'SkillStack')
+    Vacancy = apps.get_model('recruitment', 'Vacancy')
+    through = Vacancy.skill_stack.through
+    for link in through.objects.order_by('id'):
+        stack = SkillStack.objects.get(id=link.skillstack_id)
+        if stack.vacancy_id is None:
+            stack.vacancy_id = link.vacancy_id
+            stack.save(update_fields=['vacancy'])
+        elif stack.vacancy_id != link.vacancy_id:
+            copy = SkillStack.objects.create(
+                skill_stack_id=stack.skill_stack_id,
+                skill_stack_time=stack.skill_stack_time,
+                vacancy_id=link.vacancy_id,
+            )
+            through.objects.filter(id=link.id).update(skillstack_id=copy.id)
+    orphans = SkillStack.objects.filter(vacancy__isnull=True).count()
+    if orphans:
+        logger.warning('SkillStack без вакансии оставлены с vacancy=NULL: %s', orphans)
+    schema_editor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0008_skills_remove_vacancy_technology_stack_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skillstack',
+            name='vacancy',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='skill_stacks', to='recruitment.vacancy'),
+        ),
+        migrations.RunPython(fill_skillstack_vacancy, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.1 on 2026-10-18 10:00
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+from recruitment.search import update_search_vectors
+
+
+def fill_search_vectors(apps, schema_editor):
+    """Заполнение поисковых векторов существующих объектов."""
+    for model_name in ('Candidate', 'ApplicantResume', 'Vacancy'):
+        update_search_vectors(apps.get_model('recruitment', model_name).objects.all())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0009_skillstack_vacancy'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicantresume',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='candidate',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='applicantresume',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='resume_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidate',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='candidate_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='vacancy_search_vector_idx'),
+        ),
+        migrations.RunPython(fill_search_vectors, migrations.RunPython.noop),
+    ]
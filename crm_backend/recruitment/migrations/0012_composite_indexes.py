@@ -0,0 +1,33 @@
+# Generated by Django 4.1 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0011_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['author', 'pub_date', 'id'], name='vacancy_author_pub_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidate',
+            index=models.Index(fields=['vacancy', 'pub_date', 'id'], name='candidate_vacancy_pub_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='funnelstage',
+            index=models.Index(fields=['candidate', '-date'], name='funnel_candidate_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['candidate', '-pub_date'], name='note_candidate_pub_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['note', '-pub_date'], name='comment_note_pub_date_idx'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 4.1 on 2026-10-18 10:00
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+SALARY_BAND_SQL = """
+UPDATE {table}
+SET salary_band = CASE
+    WHEN cardinality({field}) > 0 THEN int4range(
+        LEAST({field}[1], {field}[2]), GREATEST({field}[1], {field}[2]), '[]'
+    )
+END
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0012_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicantresume',
+            name='salary_band',
+            field=django.contrib.postgres.fields.ranges.IntegerRangeField(blank=True, editable=False, null=True, verbose_name='Диапазон желаемой зарплаты'),
+        ),
+        migrations.AddField(
+            model_name='candidate',
+            name='salary_band',
+            field=django.contrib.postgres.fields.ranges.IntegerRangeField(blank=True, editable=False, null=True, verbose_name='Диапазон желаемой зарплаты'),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='salary_band',
+            field=django.contrib.postgres.fields.ranges.IntegerRangeField(blank=True, editable=False, null=True, verbose_name='Диапазон оплаты труда'),
+        ),
+        migrations.RunSQL(
+            SALARY_BAND_SQL.format(
+                table='recruitment_applicantresume', field='salary_expectations'
+            ),
+            migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            SALARY_BAND_SQL.format(
+                table='recruitment_candidate', field='salary_expectations'
+            ),
+            migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            SALARY_BAND_SQL.format(table='recruitment_vacancy', field='salary'),
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='applicantresume',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['salary_band'], name='resume_salary_band_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidate',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['salary_band'], name='candidate_salary_band_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['salary_band'], name='vacancy_salary_band_idx'),
+        ),
+    ]
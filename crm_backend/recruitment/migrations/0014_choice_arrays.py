@@ -0,0 +1,110 @@
+# Generated by Django 4.1 on 2026-10-18 10:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+import recruitment.fields
+
+TO_ARRAY_SQL = """
+ALTER TABLE {table} ALTER COLUMN {field} TYPE varchar(2)[]
+USING string_to_array(NULLIF({field}, ''), ',')
+"""
+
+TO_STRING_SQL = """
+ALTER TABLE {table} ALTER COLUMN {field} TYPE varchar({max_length})
+USING array_to_string({field}, ',')
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0013_salary_band'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    TO_ARRAY_SQL.format(table='recruitment_applicantresume', field='employment_type'),
+                    TO_STRING_SQL.format(table='recruitment_applicantresume', field='employment_type', max_length=11),
+                ),
+                migrations.RunSQL(
+                    TO_ARRAY_SQL.format(table='recruitment_applicantresume', field='schedule_work'),
+                    TO_STRING_SQL.format(table='recruitment_applicantresume', field='schedule_work', max_length=7),
+                ),
+                migrations.RunSQL(
+                    TO_ARRAY_SQL.format(table='recruitment_candidate', field='employment_type'),
+                    TO_STRING_SQL.format(table='recruitment_candidate', field='employment_type', max_length=11),
+                ),
+                migrations.RunSQL(
+                    TO_ARRAY_SQL.format(table='recruitment_candidate', field='schedule_work'),
+                    TO_STRING_SQL.format(table='recruitment_candidate', field='schedule_work', max_length=7),
+                ),
+                migrations.RunSQL(
+                    TO_ARRAY_SQL.format(table='recruitment_vacancy', field='employment_type'),
+                    TO_STRING_SQL.format(table='recruitment_vacancy', field='employment_type', max_length=11),
+                ),
+                migrations.RunSQL(
+                    TO_ARRAY_SQL.format(table='recruitment_vacancy', field='schedule_work'),
+                    TO_STRING_SQL.format(table='recruitment_vacancy', field='schedule_work', max_length=7),
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='applicantresume',
+                    name='employment_type',
+                    field=recruitment.fields.ChoiceArrayField(blank=True, choices=(('PO', 'Полная'), ('CH', 'Частичная'), ('PR', 'Проектная'), ('ST', 'Стажировка')), null=True, size=None, verbose_name='Тип занятости'),
+                ),
+                migrations.AlterField(
+                    model_name='applicantresume',
+                    name='schedule_work',
+                    field=recruitment.fields.ChoiceArrayField(blank=True, choices=(('P', 'Офис'), ('G', 'Гибрид'), ('U', 'Удаленный'), ('W', 'Вахтовый')), null=True, size=None, verbose_name='Расписание работы'),
+                ),
+                migrations.AlterField(
+                    model_name='candidate',
+                    name='employment_type',
+                    field=recruitment.fields.ChoiceArrayField(blank=True, choices=(('PO', 'Полная'), ('CH', 'Частичная'), ('PR', 'Проектная'), ('ST', 'Стажировка')), null=True, size=None, verbose_name='Тип занятости'),
+                ),
+                migrations.AlterField(
+                    model_name='candidate',
+                    name='schedule_work',
+                    field=recruitment.fields.ChoiceArrayField(blank=True, choices=(('P', 'Офис'), ('G', 'Гибрид'), ('U', 'Удаленный'), ('W', 'Вахтовый')), null=True, size=None, verbose_name='Расписание работы'),
+                ),
+                migrations.AlterField(
+                    model_name='vacancy',
+                    name='employment_type',
+                    field=recruitment.fields.ChoiceArrayField(blank=True, choices=(('PO', 'Полная'), ('CH', 'Частичная'), ('PR', 'Проектная'), ('ST', 'Стажировка')), null=True, size=None, verbose_name='Тип занятости'),
+                ),
+                migrations.AlterField(
+                    model_name='vacancy',
+                    name='schedule_work',
+                    field=recruitment.fields.ChoiceArrayField(blank=True, choices=(('P', 'Офис'), ('G', 'Гибрид'), ('U', 'Удаленный'), ('W', 'Вахтовый')), null=True, size=None, verbose_name='Расписание работы'),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='applicantresume',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['employment_type'], name='resume_employment_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='applicantresume',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['schedule_work'], name='resume_schedule_work_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidate',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['employment_type'], name='candidate_employment_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidate',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['schedule_work'], name='candidate_schedule_work_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['employment_type'], name='vacancy_employment_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['schedule_work'], name='vacancy_schedule_work_idx'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.1 on 2026-10-18 10:00
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0014_choice_arrays'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendarSyncState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('calendar_id', models.CharField(max_length=255, unique=True, verbose_name='ID календаря')),
+                ('sync_token', models.CharField(blank=True, max_length=1024, null=True, verbose_name='Токен синхронизации')),
+                ('pushed_at', models.DateTimeField(blank=True, null=True, verbose_name='Последняя отправка')),
+                ('pulled_at', models.DateTimeField(blank=True, null=True, verbose_name='Последнее получение')),
+            ],
+            options={
+                'verbose_name': 'Синхронизация календаря',
+                'verbose_name_plural': 'Синхронизация календарей',
+            },
+        ),
+        migrations.CreateModel(
+            name='CalendarTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('calendar_id', models.CharField(max_length=255, verbose_name='ID календаря')),
+                ('calendar_event_id', models.CharField(max_length=1024, verbose_name='ID события в календаре')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата удаления')),
+            ],
+            options={
+                'verbose_name': 'Удаленное событие календаря',
+                'verbose_name_plural': 'Удаленные события календаря',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='calendar_event_id',
+            field=models.CharField(blank=True, editable=False, max_length=1024, null=True, verbose_name='ID события в календаре'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='calendar_dirty',
+            field=models.BooleanField(default=True, editable=False, verbose_name='Требует отправки в календарь'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Дата изменения'),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('calendar_dirty', True)), fields=['id'], name='event_calendar_dirty_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['calendar_event_id'], name='event_calendar_id_idx'),
+        ),
+    ]
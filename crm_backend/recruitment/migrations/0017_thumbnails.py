@@ -0,0 +1,23 @@
+# Generated by Django 4.1 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0016_event_start_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidate',
+            name='photo_thumbnail',
+            field=models.ImageField(blank=True, editable=False, max_length=255, null=True, upload_to='', verbose_name='Миниатюра фотографии'),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='logo_thumbnail',
+            field=models.ImageField(blank=True, editable=False, max_length=255, null=True, upload_to='', verbose_name='Миниатюра логотипа'),
+        ),
+    ]
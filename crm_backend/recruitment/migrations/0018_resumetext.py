@@ -0,0 +1,32 @@
+# Generated by Django 4.1 on 2026-10-18 12:00
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0017_thumbnails'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeText',
+            fields=[
+                ('candidate', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='resume_text', serialize=False, to='recruitment.candidate', verbose_name='Кандидат')),
+                ('file_name', models.CharField(max_length=255, verbose_name='Файл резюме')),
+                ('file_hash', models.CharField(max_length=64, verbose_name='SHA-256 файла')),
+                ('text', models.TextField(blank=True, verbose_name='Текст резюме')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('extracted_at', models.DateTimeField(auto_now=True, verbose_name='Дата извлечения')),
+            ],
+            options={
+                'verbose_name': 'Текст резюме',
+                'verbose_name_plural': 'Тексты резюме',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='resume_text_search_vector_idx'), models.Index(fields=['file_hash'], name='resume_text_file_hash_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.1 on 2026-10-18 14:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('recruitment', '0018_resumetext'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacancy',
+            name='funnel_dirty',
+            field=models.BooleanField(default=True, editable=False, verbose_name='Требует пересчета итогов воронки'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('funnel_dirty', True)), fields=['author'], name='vacancy_funnel_dirty_idx'),
+        ),
+        migrations.CreateModel(
+            name='FunnelSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stage', models.CharField(max_length=100, verbose_name='Этап')),
+                ('total', models.PositiveIntegerField(verbose_name='Кандидатов на этапе')),
+                ('passed', models.PositiveIntegerField(verbose_name='Прошли этап')),
+                ('failed', models.PositiveIntegerField(verbose_name='Провалили этап')),
+                ('median_days', models.FloatField(blank=True, null=True, verbose_name='Медиана дней на этапе')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата пересчета')),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='funnel_summaries', to=settings.AUTH_USER_MODEL, verbose_name='Рекрутер')),
+                ('vacancy', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='funnel_summaries', to='recruitment.vacancy', verbose_name='Вакансия')),
+            ],
+            options={
+                'verbose_name': 'Итоги этапа воронки',
+                'verbose_name_plural': 'Итоги этапов воронок',
+                'ordering': ['stage'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='funnelsummary',
+            constraint=models.UniqueConstraint(fields=('vacancy', 'stage'), name='funnel_summary_vacancy_stage_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='funnelsummary',
+            constraint=models.UniqueConstraint(condition=models.Q(('vacancy__isnull', True)), fields=('author', 'stage'), name='funnel_summary_author_stage_unique'),
+        ),
+    ]
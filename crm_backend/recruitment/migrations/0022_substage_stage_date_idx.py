@@ -0,0 +1,17 @@
+# Generated by Django 4.1 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0020_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='substage',
+            index=models.Index(fields=['stage', '-date'], name='substage_stage_date_idx'),
+        ),
+    ]
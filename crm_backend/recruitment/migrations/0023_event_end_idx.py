@@ -0,0 +1,18 @@
+# Generated by Django 4.1 on 2026-10-19 13:00
+
+from django.db import migrations, models
+import django.db.models.functions.comparison
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0022_substage_stage_date_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(django.db.models.functions.comparison.Coalesce('end_date', 'start_date'), name='event_end_idx'),
+        ),
+    ]
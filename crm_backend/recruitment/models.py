@@ -2,11 +2,13 @@ from datetime import date
 from typing import Literal
 
 from django.conf import settings
-from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.fields import ArrayField, IntegerRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.validators import MinLengthValidator, validate_email
 from django.db import models
-from multiselectfield import MultiSelectField
+from django.db.models.functions import Coalesce
 from multiselectfield.utils import get_max_length
 from recruitment.constants import (
     CANDIDATE_STATUS,
@@ -24,6 +26,7 @@ from recruitment.constants import (
 from users.models import User
 from users.validators import custom_validate_email
 
+from .fields import ChoiceArrayField
 from .utils import generate_logo_path, upload_to_candidates
 
 
@@ -46,8 +49,16 @@ class SkillStack(models.Model):
 
     skill_stack = models.ForeignKey(Skills, on_delete=models.CASCADE)
     skill_stack_time = models.IntegerField(null=True, blank=True)
+    # vacancy может быть пустым: VacancySerializer.update создает стеки
+    # через update_or_create без вакансии и связывает их с ней через
+    # Vacancy.skill_stack, а миграция 0009_skillstack_vacancy не удаляет
+    # стеки, не связанные ни с одной вакансией, -- это необратимо.
     vacancy = models.ForeignKey(
-        "Vacancy", on_delete=models.CASCADE, related_name="skill_stacks"
+        "Vacancy",
+        on_delete=models.CASCADE,
+        related_name="skill_stacks",
+        null=True,
+        blank=True,
     )
 
     class Meta:
@@ -108,19 +119,17 @@ class ApplicantResume(models.Model):
         max_length=100,
         verbose_name="Должность",
     )
-    employment_type = MultiSelectField(
+    employment_type = ChoiceArrayField(
         choices=EMPLOYMENT_TYPE,
         verbose_name="Тип занятости",
         null=True,
         blank=True,
-        max_length=get_max_length(EMPLOYMENT_TYPE, None),
     )
-    schedule_work = MultiSelectField(
+    schedule_work = ChoiceArrayField(
         choices=SCHEDULE_WORK,
         verbose_name="Расписание работы",
         null=True,
         blank=True,
-        max_length=get_max_length(SCHEDULE_WORK, None),
     )
     salary_expectations = ArrayField(
         models.IntegerField(),
@@ -129,6 +138,12 @@ class ApplicantResume(models.Model):
         blank=True,
         verbose_name="Желаемая зарплата",
     )
+    salary_band = IntegerRangeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Диапазон желаемой зарплаты",
+    )
     working_trip = models.BooleanField(
         null=True,
         blank=True,
@@ -189,11 +204,26 @@ class ApplicantResume(models.Model):
         "Дата публикации резюме",
         auto_now_add=True,
     )
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         ordering = ["job_title"]
         verbose_name = "Резюме"
         verbose_name_plural = "Резюме"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="resume_search_vector_idx"),
+            GistIndex(fields=["salary_band"], name="resume_salary_band_idx"),
+            GinIndex(fields=["employment_type"], name="resume_employment_type_idx"),
+            GinIndex(fields=["schedule_work"], name="resume_schedule_work_idx"),
+            GinIndex(
+                fields=["town"], name="resume_town_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+            GinIndex(
+                fields=["job_title"],
+                name="resume_job_title_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
     def __str__(self):
         return f"{self.applicant} - {self.job_title}"
@@ -295,6 +325,13 @@ class Company(models.Model):
         null=True,
         blank=True,
     )
+    logo_thumbnail = models.ImageField(
+        verbose_name="Миниатюра логотипа",
+        max_length=255,
+        null=True,
+        blank=True,
+        editable=False,
+    )
 
     class Meta:
         ordering = ["company_title"]
@@ -334,19 +371,17 @@ class Vacancy(models.Model):
         null=True,
         blank=True,
     )
-    employment_type = MultiSelectField(
+    employment_type = ChoiceArrayField(
         choices=EMPLOYMENT_TYPE,
         verbose_name="Тип занятости",
         null=True,
         blank=True,
-        max_length=get_max_length(EMPLOYMENT_TYPE, None),
     )
-    schedule_work = MultiSelectField(
+    schedule_work = ChoiceArrayField(
         choices=SCHEDULE_WORK,
         verbose_name="Расписание работы",
         null=True,
         blank=True,
-        max_length=get_max_length(SCHEDULE_WORK, None),
     )
     salary = ArrayField(
         models.IntegerField(),
@@ -355,6 +390,12 @@ class Vacancy(models.Model):
         blank=True,
         verbose_name="Оплата труда",
     )
+    salary_band = IntegerRangeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Диапазон оплаты труда",
+    )
     city = models.CharField(
         max_length=40,
         verbose_name="Город",
@@ -370,6 +411,7 @@ class Vacancy(models.Model):
         "Дата публикации вакансии",
         auto_now_add=True,
     )
+    updated_at = models.DateTimeField("Дата изменения", auto_now=True)
     job_conditions = models.TextField(
         verbose_name="Условия работы",
         help_text="Введите условия работы",
@@ -397,11 +439,34 @@ class Vacancy(models.Model):
         blank=False,
     )
     deadline = models.DateField(default=DEADLINE, verbose_name="Срок закрытия вакансии")
+    search_vector = SearchVectorField(null=True, editable=False)
+    funnel_dirty = models.BooleanField(
+        "Требует пересчета итогов воронки", default=True, editable=False
+    )
 
     class Meta:
         ordering = ["pub_date"]
         verbose_name = "Вакансия"
         verbose_name_plural = "Вакансии"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="vacancy_search_vector_idx"),
+            GistIndex(fields=["salary_band"], name="vacancy_salary_band_idx"),
+            GinIndex(fields=["employment_type"], name="vacancy_employment_type_idx"),
+            GinIndex(fields=["schedule_work"], name="vacancy_schedule_work_idx"),
+            GinIndex(
+                fields=["city"],
+                name="vacancy_city_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            models.Index(
+                fields=["author", "pub_date", "id"], name="vacancy_author_pub_date_idx"
+            ),
+            models.Index(
+                fields=["author"],
+                name="vacancy_funnel_dirty_idx",
+                condition=models.Q(funnel_dirty=True),
+            ),
+        ]
 
     def __str__(self):
         return self.vacancy_title
@@ -458,6 +523,12 @@ class Candidate(models.Model):
         blank=True,
         verbose_name="Желаемая зарплата",
     )
+    salary_band = IntegerRangeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Диапазон желаемой зарплаты",
+    )
     vacancy = models.ForeignKey(
         Vacancy,
         on_delete=models.CASCADE,
@@ -501,19 +572,24 @@ class Candidate(models.Model):
         null=True,
         blank=True,
     )
-    employment_type = MultiSelectField(
+    photo_thumbnail = models.ImageField(
+        verbose_name="Миниатюра фотографии",
+        max_length=255,
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    employment_type = ChoiceArrayField(
         choices=EMPLOYMENT_TYPE,
         verbose_name="Тип занятости",
         null=True,
         blank=True,
-        max_length=get_max_length(EMPLOYMENT_TYPE, None),
     )
-    schedule_work = MultiSelectField(
+    schedule_work = ChoiceArrayField(
         choices=SCHEDULE_WORK,
         verbose_name="Расписание работы",
         null=True,
         blank=True,
-        max_length=get_max_length(SCHEDULE_WORK, None),
     )
     work_experiences = models.CharField(
         max_length=1,
@@ -552,16 +628,81 @@ class Candidate(models.Model):
         "Дата добавления кандидата резюме",
         auto_now_add=True,
     )
+    updated_at = models.DateTimeField("Дата изменения", auto_now=True)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         ordering = ["pub_date"]
         verbose_name = "Кандидат"
         verbose_name_plural = "Кандидаты"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="candidate_search_vector_idx"),
+            GistIndex(fields=["salary_band"], name="candidate_salary_band_idx"),
+            GinIndex(fields=["employment_type"], name="candidate_employment_type_idx"),
+            GinIndex(fields=["schedule_work"], name="candidate_schedule_work_idx"),
+            GinIndex(
+                fields=["first_name"],
+                name="candidate_first_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["last_name"],
+                name="candidate_last_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["city"],
+                name="candidate_city_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["last_job"],
+                name="candidate_last_job_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            models.Index(
+                fields=["vacancy", "pub_date", "id"],
+                name="candidate_vacancy_pub_date_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.last_name
 
 
+class ResumeText(models.Model):
+    """
+    Текст резюме кандидата, извлеченный из PDF.
+
+    file_name -- файл резюме, из которого извлечен текст, file_hash -- его
+    SHA-256: текст извлекается заново, только если файл изменился.
+    """
+
+    candidate = models.OneToOneField(
+        Candidate,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="resume_text",
+        verbose_name="Кандидат",
+    )
+    file_name = models.CharField("Файл резюме", max_length=255)
+    file_hash = models.CharField("SHA-256 файла", max_length=64)
+    text = models.TextField("Текст резюме", blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+    extracted_at = models.DateTimeField("Дата извлечения", auto_now=True)
+
+    class Meta:
+        verbose_name = "Текст резюме"
+        verbose_name_plural = "Тексты резюме"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="resume_text_search_vector_idx"),
+            models.Index(fields=["file_hash"], name="resume_text_file_hash_idx"),
+        ]
+
+    def __str__(self):
+        return self.file_name
+
+
 class Event(models.Model):
     """Модель создания событий в календаре."""
 
@@ -592,16 +733,79 @@ class Event(models.Model):
         blank=True,
         null=True,
     )
+    calendar_event_id = models.CharField(
+        "ID события в календаре",
+        max_length=1024,
+        blank=True,
+        null=True,
+        editable=False,
+    )
+    calendar_dirty = models.BooleanField(
+        "Требует отправки в календарь", default=True, editable=False
+    )
+    updated_at = models.DateTimeField("Дата изменения", auto_now=True)
 
     class Meta:
         ordering = ["start_date"]
         verbose_name = "Событие"
         verbose_name_plural = "События"
+        indexes = [
+            models.Index(
+                fields=["id"],
+                name="event_calendar_dirty_idx",
+                condition=models.Q(calendar_dirty=True),
+            ),
+            models.Index(fields=["calendar_event_id"], name="event_calendar_id_idx"),
+            models.Index(
+                fields=["start_date", "start_time", "id"], name="event_start_idx"
+            ),
+            # Дата окончания для поиска многодневных событий, пересекающих окно.
+            models.Index(Coalesce("end_date", "start_date"), name="event_end_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
 
+class CalendarSyncState(models.Model):
+    """
+    Состояние синхронизации событий с календарем.
+
+    sync_token -- токен последнего получения изменений из календаря,
+    pushed_at и pulled_at -- время последней отправки и получения.
+    """
+
+    calendar_id = models.CharField("ID календаря", max_length=255, unique=True)
+    sync_token = models.CharField(
+        "Токен синхронизации", max_length=1024, blank=True, null=True
+    )
+    pushed_at = models.DateTimeField("Последняя отправка", blank=True, null=True)
+    pulled_at = models.DateTimeField("Последнее получение", blank=True, null=True)
+
+    class Meta:
+        verbose_name = "Синхронизация календаря"
+        verbose_name_plural = "Синхронизация календарей"
+
+    def __str__(self):
+        return self.calendar_id
+
+
+class CalendarTombstone(models.Model):
+    """Удаленное событие, которое нужно удалить из календаря."""
+
+    calendar_id = models.CharField("ID календаря", max_length=255)
+    calendar_event_id = models.CharField("ID события в календаре", max_length=1024)
+    created_at = models.DateTimeField("Дата удаления", auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+        verbose_name = "Удаленное событие календаря"
+        verbose_name_plural = "Удаленные события календаря"
+
+    def __str__(self):
+        return self.calendar_event_id
+
+
 class FunnelStage(models.Model):
     """Этапы воронки."""
 
@@ -624,11 +828,17 @@ class FunnelStage(models.Model):
         verbose_name="Кандидат",
         related_name="funnel",
     )
+    updated_at = models.DateTimeField("Дата изменения", auto_now=True)
 
     class Meta:
         ordering = ["-date"]
         verbose_name = "Воронка кандидата"
         verbose_name_plural = "Воронки кандидатов"
+        indexes = [
+            models.Index(
+                fields=["candidate", "-date"], name="funnel_candidate_date_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -657,11 +867,65 @@ class SubStage(models.Model):
         ordering = ["-date"]
         verbose_name = "Подэтап воронки"
         verbose_name_plural = "Подэтапы воронок"
+        indexes = [
+            models.Index(fields=["stage", "-date"], name="substage_stage_date_idx"),
+        ]
 
     def __str__(self):
         return self.name
 
 
+class FunnelSummary(models.Model):
+    """
+    Итоги этапа воронки по вакансии или по рекрутеру.
+
+    Строки с vacancy -- итоги этапа по кандидатам вакансии, строки без
+    vacancy -- по всем вакансиям рекрутера author. Строки пересчитываются
+    для вакансий с funnel_dirty, поэтому аналитика читает готовые числа,
+    а не все этапы воронок. median_days -- медиана дней на этапе.
+    """
+
+    author = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="funnel_summaries",
+        verbose_name="Рекрутер",
+    )
+    vacancy = models.ForeignKey(
+        Vacancy,
+        on_delete=models.CASCADE,
+        related_name="funnel_summaries",
+        verbose_name="Вакансия",
+        null=True,
+        blank=True,
+    )
+    stage = models.CharField("Этап", max_length=100)
+    total = models.PositiveIntegerField("Кандидатов на этапе")
+    passed = models.PositiveIntegerField("Прошли этап")
+    failed = models.PositiveIntegerField("Провалили этап")
+    median_days = models.FloatField("Медиана дней на этапе", null=True, blank=True)
+    updated_at = models.DateTimeField("Дата пересчета", auto_now=True)
+
+    class Meta:
+        ordering = ["stage"]
+        verbose_name = "Итоги этапа воронки"
+        verbose_name_plural = "Итоги этапов воронок"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["vacancy", "stage"],
+                name="funnel_summary_vacancy_stage_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["author", "stage"],
+                name="funnel_summary_author_stage_unique",
+                condition=models.Q(vacancy__isnull=True),
+            ),
+        ]
+
+    def __str__(self):
+        return self.stage
+
+
 class Note(models.Model):
     """Модель Заметок."""
 
@@ -680,11 +944,17 @@ class Note(models.Model):
         User, on_delete=models.CASCADE, related_name="user_notes", verbose_name="Автор"
     )
     pub_date = models.DateTimeField(verbose_name="Дата публикации", auto_now_add=True)
+    updated_at = models.DateTimeField("Дата изменения", auto_now=True)
 
     class Meta:
         ordering: tuple[Literal["-pub_date"]] = ("-pub_date",)
         verbose_name = "Заметка"
         verbose_name_plural = "Заметки"
+        indexes = [
+            models.Index(
+                fields=["candidate", "-pub_date"], name="note_candidate_pub_date_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.text
@@ -709,11 +979,17 @@ class Comment(models.Model):
         verbose_name="Автор",
     )
     pub_date = models.DateTimeField(verbose_name="Дата публикации", auto_now_add=True)
+    updated_at = models.DateTimeField("Дата изменения", auto_now=True)
 
     class Meta:
         verbose_name = "Комментарий"
         verbose_name_plural = "Комментарии"
         ordering = ("-pub_date",)
+        indexes = [
+            models.Index(
+                fields=["note", "-pub_date"], name="comment_note_pub_date_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.text
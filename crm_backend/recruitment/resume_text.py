@@ -0,0 +1,199 @@
+import hashlib
+import io
+import logging
+import re
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import transaction
+from django.db.models import F, Q
+from pypdf import PdfReader
+
+from .models import Candidate, ResumeText
+from .search import SEARCH_CONFIG
+
+logger = logging.getLogger(__name__)
+
+RESUME_TEXT_CHUNK_SIZE = 200
+HASH_CHUNK_SIZE = 1024 * 1024
+HYPHENATION = re.compile(r"(\w)-\s*\n\s*(\w)")
+WHITESPACE = re.compile(r"\s+")
+
+
+def file_hash(file):
+    """SHA-256 файла; файл читается кусками по HASH_CHUNK_SIZE."""
+    digest = hashlib.sha256()
+    while chunk := file.read(HASH_CHUNK_SIZE):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def normalize_text(text):
+    """
+    Нормализованный текст резюме для полнотекстового индекса.
+
+    Символы приводятся к NFKC, переносы слов по слогам склеиваются, пробелы
+    и переводы строк сворачиваются в один пробел, а нулевые символы, которые
+    не принимает PostgreSQL, удаляются. Текст обрезается до
+    RESUME_TEXT_MAX_LENGTH символов.
+    """
+    text = unicodedata.normalize("NFKC", text).replace("\x00", "")
+    text = HYPHENATION.sub(r"\1\2", text.replace("\xad", ""))
+    return WHITESPACE.sub(" ", text).strip()[: settings.RESUME_TEXT_MAX_LENGTH]
+
+
+def extract_text(name, source):
+    """
+    Текст PDF-файла name; source -- путь к файлу или его содержимое.
+
+    Выполняется в процессах пула, поэтому не обращается к базе данных.
+    Для поврежденного файла возвращает пустую строку, чтобы файл не
+    обрабатывался повторно, пока не изменится.
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    try:
+        reader = PdfReader(source)
+        pages = (page.extract_text() or "" for page in reader.pages)
+        return normalize_text("\n".join(pages))
+    except Exception:
+        logger.exception("Не удалось извлечь текст резюме %s", name)
+        return ""
+
+
+def pending_candidates(rehash=False):
+    """
+    Кандидаты, текст резюме которых нужно проверить.
+
+    По умолчанию -- кандидаты, файл резюме которых не совпадает с файлом
+    извлеченного текста; при rehash=True -- все кандидаты с резюме.
+    """
+    queryset = Candidate.objects.exclude(resume="").exclude(resume__isnull=True)
+    if not rehash:
+        queryset = queryset.filter(
+            Q(resume_text__isnull=True) | ~Q(resume_text__file_name=F("resume"))
+        )
+    return queryset.order_by("pk")
+
+
+class ResumeTextExtraction:
+    """
+    Извлечение текста резюме кандидатов в пуле процессов.
+
+    Кандидаты обрабатываются пачками по chunk_size. Для каждого файла
+    считается SHA-256: если он совпадает с сохраненным, текст не
+    извлекается заново; если такой же файл уже разобран у другого
+    кандидата, текст копируется, а одинаковые файлы пачки разбираются один
+    раз. Остальные файлы разбираются в пуле из workers процессов (при
+    workers = 0 -- в текущем процессе), после чего пачка сохраняется одним
+    запросом и для нее пересчитываются поисковые векторы. Тексты
+    кандидатов, у которых больше нет резюме, удаляются.
+
+    После run() доступны checked -- число проверенных файлов, extracted --
+    число разобранных, reused -- число файлов, текст которых не пришлось
+    извлекать, и removed -- число удаленных текстов.
+    """
+
+    def __init__(self, workers=None, chunk_size=RESUME_TEXT_CHUNK_SIZE):
+        """Извлечение в workers процессов пачками по chunk_size кандидатов."""
+        self.workers = settings.RESUME_TEXT_WORKERS if workers is None else workers
+        self.chunk_size = chunk_size
+        self.storage = Candidate._meta.get_field("resume").storage
+        self.checked = 0
+        self.extracted = 0
+        self.reused = 0
+        self.removed = 0
+
+    def run(self, rehash=False):
+        """Извлечение текста; возвращает self для чтения итогов."""
+        self.removed, _ = ResumeText.objects.filter(
+            Q(candidate__resume="") | Q(candidate__resume__isnull=True)
+        ).delete()
+        rows = pending_candidates(rehash).values_list("pk", "resume").iterator()
+        with (
+            ProcessPoolExecutor(max_workers=self.workers)
+            if self.workers
+            else nullcontext()
+        ) as executor:
+            map_function = executor.map if executor else map
+            while chunk := list(islice(rows, self.chunk_size)):
+                self.process_chunk(chunk, map_function)
+        return self
+
+    def read_source(self, name):
+        """Путь к файлу для процесса пула или его содержимое."""
+        try:
+            return self.storage.path(name)
+        except NotImplementedError:
+            with self.storage.open(name) as file:
+                return file.read()
+
+    def hash_chunk(self, chunk):
+        """SHA-256 файлов пачки: {id кандидата: (файл, хеш)}."""
+        hashes = {}
+        for pk, name in chunk:
+            try:
+                with self.storage.open(name) as file:
+                    hashes[pk] = (name, file_hash(file))
+            except OSError:
+                logger.warning("Файл резюме %s кандидата %s не найден", name, pk)
+        return hashes
+
+    def process_chunk(self, chunk, map_function):
+        """Проверка и сохранение текстов одной пачки кандидатов."""
+        hashes = self.hash_chunk(chunk)
+        current = dict(
+            ResumeText.objects.filter(candidate_id__in=hashes).values_list(
+                "candidate_id", "file_hash"
+            )
+        )
+        known = dict(
+            ResumeText.objects.filter(
+                file_hash__in={digest for _, digest in hashes.values()}
+            ).values_list("file_hash", "text")
+        )
+        unchanged, to_extract = [], {}
+        for pk, (name, digest) in hashes.items():
+            if current.get(pk) == digest:
+                unchanged.append(ResumeText(candidate_id=pk, file_name=name))
+            elif digest not in known:
+                to_extract.setdefault(digest, name)
+        names = list(to_extract.values())
+        sources = [self.read_source(name) for name in names]
+        known.update(zip(to_extract, map_function(extract_text, names, sources)))
+        texts = {
+            pk: known[digest]
+            for pk, (_, digest) in hashes.items()
+            if current.get(pk) != digest
+        }
+        self.checked += len(hashes)
+        self.extracted += len(to_extract)
+        self.reused += len(hashes) - len(to_extract)
+        self.save_chunk(hashes, texts, unchanged)
+
+    def save_chunk(self, hashes, texts, unchanged):
+        """Сохранение текстов пачки и пересчет их поисковых векторов."""
+        resume_texts = [
+            ResumeText(
+                candidate_id=pk,
+                file_name=hashes[pk][0],
+                file_hash=hashes[pk][1],
+                text=text,
+            )
+            for pk, text in texts.items()
+        ]
+        with transaction.atomic():
+            ResumeText.objects.bulk_update(unchanged, ["file_name"])
+            ResumeText.objects.bulk_create(
+                resume_texts,
+                update_conflicts=True,
+                unique_fields=["candidate_id"],
+                update_fields=["file_name", "file_hash", "text", "extracted_at"],
+            )
+            ResumeText.objects.filter(candidate_id__in=texts).update(
+                search_vector=SearchVector("text", config=SEARCH_CONFIG)
+            )
@@ -0,0 +1,57 @@
+from django.contrib.postgres.fields import IntegerRangeField
+from django.db.models import Case, F, Func, Value, When
+from django.db.models.functions import Greatest, Least
+from psycopg2.extras import NumericRange
+
+SALARY_FIELDS = {
+    "applicantresume": "salary_expectations",
+    "candidate": "salary_expectations",
+    "vacancy": "salary",
+}
+
+
+def get_salary_field(model):
+    """Имя поля-массива [min, max], из которого строится salary_band."""
+    return SALARY_FIELDS[model._meta.model_name]
+
+
+def salary_to_range(salary):
+    """
+    Диапазон зарплаты для значения поля-массива.
+
+    Границы включаются в диапазон; для пустого значения возвращается None.
+    """
+    if not salary:
+        return None
+    return NumericRange(min(salary), max(salary), "[]")
+
+
+def salary_range_expression(field_name):
+    """Выражение для расчета диапазона зарплаты в запросе."""
+    lower = Least(F(f"{field_name}__0"), F(f"{field_name}__1"))
+    upper = Greatest(F(f"{field_name}__0"), F(f"{field_name}__1"))
+    return Case(
+        When(
+            **{f"{field_name}__len__gt": 0},
+            then=Func(
+                lower,
+                upper,
+                Value("[]"),
+                function="int4range",
+                output_field=IntegerRangeField(),
+            ),
+        ),
+        default=None,
+        output_field=IntegerRangeField(),
+    )
+
+
+def update_salary_bands(queryset):
+    """
+    Пересчитывает диапазоны зарплат объектов queryset одним UPDATE.
+
+    Нужен после bulk_create и update, которые не вызывают сигналы.
+    Возвращает количество обновленных строк.
+    """
+    field_name = get_salary_field(queryset.model)
+    return queryset.update(salary_band=salary_range_expression(field_name))
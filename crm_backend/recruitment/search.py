@@ -0,0 +1,75 @@
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector
+from django.db.models import OuterRef, Subquery
+
+SEARCH_CONFIG = "russian"
+
+
+def candidate_search_vector(model):
+    """Поисковый вектор кандидата: ФИО, опыт работы и контакты."""
+    return (
+        SearchVector(
+            "last_name", "first_name", "patronymic", weight="A", config=SEARCH_CONFIG
+        )
+        + SearchVector("cur_position", "last_job", weight="B", config=SEARCH_CONFIG)
+        + SearchVector(
+            "city",
+            "email",
+            "telegram",
+            "phone_number",
+            weight="C",
+            config=SEARCH_CONFIG,
+        )
+    )
+
+
+def resume_search_vector(model):
+    """Поисковый вектор резюме: должность и город."""
+    return SearchVector("job_title", weight="A", config=SEARCH_CONFIG) + SearchVector(
+        "current_job", "town", weight="B", config=SEARCH_CONFIG
+    )
+
+
+def vacancy_search_vector(model):
+    """Поисковый вектор вакансии: название, компания, город и навыки."""
+    company_model = model._meta.apps.get_model("recruitment", "Company")
+    skills_model = model._meta.apps.get_model("recruitment", "Skills")
+    company_title = Subquery(
+        company_model.objects.filter(pk=OuterRef("company_id")).values("company_title")
+    )
+    skills = Subquery(
+        skills_model.objects.filter(skillstack__vacancies=OuterRef("pk"))
+        .order_by()
+        .values("skillstack__vacancies")
+        .annotate(names=StringAgg("name", " "))
+        .values("names")
+    )
+    return (
+        SearchVector("vacancy_title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector(company_title, skills, weight="B", config=SEARCH_CONFIG)
+        + SearchVector("city", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def get_search_vector(model):
+    """
+    Возвращает выражение поискового вектора для модели.
+
+    Модель определяется по имени, а связанные модели берутся из ее реестра,
+    поэтому выражение строится и для исторических моделей миграций.
+    """
+    search_vectors = {
+        "recruitment.applicantresume": resume_search_vector,
+        "recruitment.candidate": candidate_search_vector,
+        "recruitment.vacancy": vacancy_search_vector,
+    }
+    return search_vectors[model._meta.label_lower](model)
+
+
+def update_search_vectors(queryset):
+    """
+    Пересчитывает поисковые векторы объектов queryset одним UPDATE.
+
+    Возвращает количество обновленных строк.
+    """
+    return queryset.update(search_vector=get_search_vector(queryset.model))
@@ -0,0 +1,206 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import DEFERRED
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_init,
+    post_save,
+    pre_save,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+from users.models import User
+
+from .dashboard import invalidate_vacancy_summary
+from .funnel import mark_funnel_dirty
+from .models import (
+    ApplicantResume,
+    CalendarTombstone,
+    Candidate,
+    Comment,
+    Company,
+    Event,
+    FunnelStage,
+    FunnelSummary,
+    Note,
+    SubStage,
+    Vacancy,
+)
+from .salary import get_salary_field, salary_to_range
+from .search import update_search_vectors
+from .thumbnails import needs_thumbnail, schedule_thumbnail
+
+# Внешние ключи, при изменении которых пересчитываются итоги воронки и
+# сводки и для прежнего, и для нового владельца объекта.
+OWNER_FIELDS = {Candidate: "vacancy_id", Vacancy: "author_id"}
+
+
+@receiver(pre_save, sender=ApplicantResume)
+@receiver(pre_save, sender=Candidate)
+@receiver(pre_save, sender=Vacancy)
+def set_salary_band(sender, instance, **kwargs):
+    """Заполнение диапазона зарплаты из поля-массива перед сохранением."""
+    instance.salary_band = salary_to_range(getattr(instance, get_salary_field(sender)))
+
+
+@receiver(post_save, sender=ApplicantResume)
+@receiver(post_save, sender=Candidate)
+@receiver(post_save, sender=Vacancy)
+def update_search_vector(sender, instance, **kwargs):
+    """Пересчет поискового вектора после сохранения объекта."""
+    update_search_vectors(sender.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Company)
+def update_company_vacancies_search_vector(sender, instance, **kwargs):
+    """Пересчет поисковых векторов вакансий после изменения компании."""
+    update_search_vectors(instance.vacancies.all())
+
+
+@receiver(post_save, sender=Candidate)
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=User)
+def update_thumbnail(sender, instance, raw=False, **kwargs):
+    """Постановка создания миниатюры после загрузки изображения."""
+    if not raw and needs_thumbnail(instance):
+        schedule_thumbnail(instance)
+
+
+@receiver(m2m_changed, sender=Vacancy.skill_stack.through)
+def update_vacancy_skills_search_vector(sender, instance, action, **kwargs):
+    """Пересчет поискового вектора вакансии после изменения навыков."""
+    if action in ("post_add", "post_remove", "post_clear"):
+        update_search_vectors(Vacancy.objects.filter(pk=instance.pk))
+
+
+@receiver(pre_save, sender=Event)
+def mark_event_dirty(sender, instance, **kwargs):
+    """Постановка события в очередь отправки в календарь."""
+    instance.calendar_dirty = True
+
+
+@receiver(post_delete, sender=Event)
+def add_calendar_tombstone(sender, instance, **kwargs):
+    """Постановка удаления события из календаря в очередь."""
+    if instance.calendar_event_id:
+        CalendarTombstone.objects.create(
+            calendar_id=settings.GOOGLE_CALENDAR_ID,
+            calendar_event_id=instance.calendar_event_id,
+        )
+
+
+@receiver(post_save, sender=FunnelStage)
+@receiver(post_delete, sender=FunnelStage)
+def mark_stage_vacancy_funnel_dirty(sender, instance, **kwargs):
+    """Отметка вакансии для пересчета итогов воронки после изменения этапа."""
+    mark_funnel_dirty(Vacancy.objects.filter(candidates=instance.candidate_id))
+
+
+@receiver(post_save, sender=SubStage)
+@receiver(post_delete, sender=SubStage)
+def mark_substage_vacancy_funnel_dirty(sender, instance, **kwargs):
+    """Отметка вакансии для пересчета итогов воронки после изменения подэтапа."""
+    mark_funnel_dirty(Vacancy.objects.filter(candidates__funnel=instance.stage_id))
+
+
+@receiver(post_save, sender=SubStage)
+@receiver(post_delete, sender=SubStage)
+def touch_stage(sender, instance, **kwargs):
+    """Обновление даты изменения этапа, в ответах которого есть подэтапы."""
+    FunnelStage.objects.filter(pk=instance.stage_id).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def touch_note(sender, instance, **kwargs):
+    """Обновление даты изменения заметки, в ответах которой есть комментарии."""
+    Note.objects.filter(pk=instance.note_id).update(updated_at=timezone.now())
+
+
+@receiver(post_init, sender=Candidate)
+@receiver(post_init, sender=Vacancy)
+def remember_owner(sender, instance, **kwargs):
+    """
+    Запоминание загруженного владельца объекта (OWNER_FIELDS).
+
+    Сохраненное значение сравнивается с новым после сохранения, чтобы
+    пересчитать данные и старого, и нового владельца.
+    """
+    instance._saved_owner_id = instance.__dict__.get(OWNER_FIELDS[sender], DEFERRED)
+
+
+@receiver(pre_save, sender=Candidate)
+@receiver(pre_save, sender=Vacancy)
+def load_deferred_owner(sender, instance, **kwargs):
+    """Чтение сохраненного владельца, если поле не было загружено."""
+    if instance._saved_owner_id is DEFERRED and not instance._state.adding:
+        instance._saved_owner_id = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list(OWNER_FIELDS[sender], flat=True)
+            .first()
+        )
+
+
+def get_previous_owner(instance, created):
+    """Прежний владелец объекта или None, если он не изменился."""
+    previous = instance._saved_owner_id
+    current = getattr(instance, OWNER_FIELDS[type(instance)])
+    if created or previous in (DEFERRED, current):
+        return None
+    return previous
+
+
+def reset_author_funnel(author_id):
+    """Удаление итогов рекрутера и отметка его вакансий для пересчета."""
+    FunnelSummary.objects.filter(author=author_id, vacancy__isnull=True).delete()
+    mark_funnel_dirty(Vacancy.objects.filter(author=author_id))
+
+
+@receiver(post_delete, sender=Vacancy)
+def mark_author_funnel_dirty(sender, instance, **kwargs):
+    """Пересчет итогов рекрутера после удаления его вакансии."""
+    reset_author_funnel(instance.author_id)
+
+
+@receiver(post_save, sender=Vacancy)
+def mark_reassigned_vacancy_funnel_dirty(sender, instance, created, **kwargs):
+    """Пересчет итогов вакансии и обоих рекрутеров после смены автора."""
+    author_id = get_previous_owner(instance, created)
+    if author_id is not None:
+        reset_author_funnel(author_id)
+        mark_funnel_dirty(Vacancy.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Candidate)
+def mark_moved_candidate_funnel_dirty(sender, instance, created, **kwargs):
+    """Пересчет итогов старой и новой вакансии после переноса кандидата."""
+    vacancy_id = get_previous_owner(instance, created)
+    if vacancy_id is not None:
+        mark_funnel_dirty(
+            Vacancy.objects.filter(pk__in=[vacancy_id, instance.vacancy_id])
+        )
+
+
+@receiver(post_save, sender=Candidate)
+@receiver(post_delete, sender=Candidate)
+def invalidate_candidate_vacancy_summary(sender, instance, created=False, **kwargs):
+    """
+    Сброс количеств кандидатов вакансии после изменения кандидата.
+
+    Сбрасываются количества и прежней вакансии перенесенного кандидата.
+    """
+    vacancy_ids = {instance.vacancy_id, get_previous_owner(instance, created)} - {None}
+    transaction.on_commit(lambda: invalidate_vacancy_summary(*vacancy_ids))
+
+
+@receiver(post_save, sender=Candidate)
+@receiver(post_save, sender=Vacancy)
+def forget_previous_owner(sender, instance, **kwargs):
+    """
+    Запоминание нового владельца после сохранения объекта.
+
+    Подключается последним, чтобы обработчики выше видели прежнего
+    владельца.
+    """
+    instance._saved_owner_id = getattr(instance, OWNER_FIELDS[sender])
@@ -0,0 +1,180 @@
+import io
+import logging
+import posixpath
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import PurePosixPath
+
+from api.cache import bump_model_version
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+from users.models import User
+
+from .models import Candidate, Company
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_FIELDS = {
+    Candidate: ("photo", "photo_thumbnail"),
+    Company: ("logo", "logo_thumbnail"),
+    User: ("photo", "photo_thumbnail"),
+}
+EXTENSIONS = {"WEBP": "webp", "JPEG": "jpg"}
+ALPHA_MODES = ("RGBA", "LA", "P")
+
+
+@lru_cache(maxsize=None)
+def get_executor():
+    """
+    Пул потоков для создания миниатюр.
+
+    Создается при первой загрузке изображения и переиспользуется процессом.
+    """
+    return ThreadPoolExecutor(
+        max_workers=settings.THUMBNAIL_WORKERS, thread_name_prefix="thumbnails"
+    )
+
+
+def thumbnail_name(name):
+    """
+    Путь миниатюры изображения: каталог thumbnails рядом с оригиналом.
+
+    Имя оригинала сохраняется целиком (a.png -> thumbnails/a.png.webp),
+    чтобы миниатюры a.png и a.jpg не совпадали.
+    """
+    path = PurePosixPath(name)
+    extension = EXTENSIONS[settings.THUMBNAIL_FORMAT]
+    return str(path.parent / "thumbnails" / f"{path.name}.{extension}")
+
+
+def is_thumbnail_of(thumbnail, name):
+    """
+    Миниатюра создана для изображения name.
+
+    Хранилище добавляет к занятому имени суффикс _XXXXXXX, поэтому
+    подходит и имя thumbnail_name(name) с таким суффиксом.
+    """
+    root, extension = posixpath.splitext(thumbnail_name(name))
+    pattern = rf"{re.escape(root)}(_[a-zA-Z0-9]{{7}})?{re.escape(extension)}"
+    return bool(thumbnail) and re.fullmatch(pattern, thumbnail) is not None
+
+
+def render_thumbnail(file):
+    """
+    Миниатюра изображения в формате THUMBNAIL_FORMAT.
+
+    Изображение поворачивается по EXIF и обрезается по центру до
+    THUMBNAIL_SIZE. Прозрачность сохраняется только в WebP.
+    """
+    with Image.open(file) as image:
+        image.draft("RGB", settings.THUMBNAIL_SIZE)
+        image = ImageOps.exif_transpose(image)
+        keep_alpha = settings.THUMBNAIL_FORMAT == "WEBP" and image.mode in ALPHA_MODES
+        image = ImageOps.fit(
+            image.convert("RGBA" if keep_alpha else "RGB"),
+            settings.THUMBNAIL_SIZE,
+            Image.LANCZOS,
+        )
+    output = io.BytesIO()
+    image.save(output, settings.THUMBNAIL_FORMAT, quality=settings.THUMBNAIL_QUALITY)
+    return output.getvalue()
+
+
+def needs_thumbnail(instance):
+    """Миниатюра отсутствует или создана не для текущего изображения."""
+    field, thumbnail_field = THUMBNAIL_FIELDS[type(instance)]
+    name = getattr(instance, field).name
+    thumbnail = getattr(instance, thumbnail_field).name
+    if not name:
+        return bool(thumbnail)
+    return not is_thumbnail_of(thumbnail, name)
+
+
+def thumbnail_changes(model, thumbnail):
+    """
+    Поля для записи миниатюры через update().
+
+    update() не заполняет поля auto_now, поэтому дата изменения объекта,
+    по которой строятся ETag ответов API, обновляется явно.
+    """
+    changes = {THUMBNAIL_FIELDS[model][1]: thumbnail}
+    if any(field.name == "updated_at" for field in model._meta.concrete_fields):
+        changes["updated_at"] = timezone.now()
+    return changes
+
+
+def delete_unused_thumbnail(model, thumbnail):
+    """Удаление файла миниатюры, если на него не ссылается ни один объект."""
+    thumbnail_field = THUMBNAIL_FIELDS[model][1]
+    if thumbnail and not model.objects.filter(**{thumbnail_field: thumbnail}).exists():
+        model._meta.get_field(thumbnail_field).storage.delete(thumbnail)
+
+
+def generate_thumbnail(model, pk):
+    """
+    Создание миниатюры изображения объекта.
+
+    Миниатюра записывается в объект, только если изображение не изменилось,
+    пока она создавалась; у объекта без изображения миниатюра очищается.
+    Хранилище выбирает свободное имя файла, поэтому файлы миниатюр других
+    объектов не перезаписываются; прежняя миниатюра удаляется, только если
+    на нее больше никто не ссылается. update() не отправляет сигналов,
+    поэтому версия кэшированных списков модели меняется явно. Возвращает
+    путь миниатюры или None.
+    """
+    field, thumbnail_field = THUMBNAIL_FIELDS[model]
+    queryset = model.objects.filter(pk=pk)
+    row = queryset.values_list(field, thumbnail_field).first()
+    name, previous = row or (None, None)
+    if not name:
+        queryset.update(**thumbnail_changes(model, None))
+        transaction.on_commit(lambda: bump_model_version(model))
+        delete_unused_thumbnail(model, previous)
+        return None
+    storage = model._meta.get_field(field).storage
+    with storage.open(name) as file:
+        content = render_thumbnail(file)
+    thumbnail = storage.save(thumbnail_name(name), ContentFile(content))
+    if not queryset.filter(**{field: name}).update(
+        **thumbnail_changes(model, thumbnail)
+    ):
+        storage.delete(thumbnail)
+        return None
+    transaction.on_commit(lambda: bump_model_version(model))
+    delete_unused_thumbnail(model, previous)
+    return thumbnail
+
+
+def run_thumbnail_task(model, pk):
+    """
+    Задача пула: создание миниатюры в потоке пула.
+
+    Ошибки записываются в журнал, соединение потока с БД закрывается.
+    Возвращает путь миниатюры или None.
+    """
+    try:
+        return generate_thumbnail(model, pk)
+    except Exception:
+        logger.exception("Не удалось создать миниатюру %s %s", model.__name__, pk)
+        return None
+    finally:
+        connection.close()
+
+
+def schedule_thumbnail(instance):
+    """
+    Создание миниатюры после фиксации транзакции.
+
+    При THUMBNAIL_WORKERS = 0 миниатюра создается сразу в текущем потоке.
+    """
+    model, pk = type(instance), instance.pk
+    if settings.THUMBNAIL_WORKERS:
+        transaction.on_commit(
+            lambda: get_executor().submit(run_thumbnail_task, model, pk)
+        )
+    else:
+        transaction.on_commit(lambda: generate_thumbnail(model, pk))
@@ -0,0 +1,205 @@
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from recruitment.models import CalendarSyncState, CalendarTombstone, Event
+
+from .g_calendar import SyncTokenExpiredError, body_to_fields, event_to_body
+
+GONE_STATUSES = (404, 410)
+EVENT_FIELDS = (
+    "title",
+    "description",
+    "conference_link",
+    "start_date",
+    "start_time",
+    "end_date",
+    "end_time",
+)
+
+
+class BatchStats:
+    """Метрики одного пакета синхронизации."""
+
+    def __init__(self, operation, size, seconds, errors=0):
+        """Пакет операции operation из size событий за seconds секунд."""
+        self.operation = operation
+        self.size = size
+        self.seconds = seconds
+        self.errors = errors
+
+    @property
+    def rate(self):
+        """Событий в секунду."""
+        return self.size / self.seconds if self.seconds else 0
+
+    def __str__(self):
+        return (
+            f"{self.operation:6} {self.size:5} событий, ошибок {self.errors:3}, "
+            f"{self.seconds * 1000:8.1f} мс, {self.rate:8.0f} событий/с"
+        )
+
+
+class CalendarSync:
+    """
+    Синхронизация событий recruitment.Event с календарем.
+
+    push отправляет измененные (calendar_dirty) и удаленные (CalendarTombstone)
+    события пакетами по batch_size операций в одном batch-запросе. pull
+    получает изменения календаря по токену синхронизации из
+    CalendarSyncState, без полного списка событий. Если событие изменено и
+    локально, и в календаре, побеждает локальное: push перезапишет его.
+    Методы возвращают генераторы BatchStats по одному на пакет.
+    """
+
+    def __init__(self, calendar, batch_size=None):
+        """Синхронизация с calendar пакетами по batch_size событий."""
+        self.calendar = calendar
+        self.batch_size = batch_size or settings.GOOGLE_CALENDAR_BATCH_SIZE
+        self.state, _ = CalendarSyncState.objects.get_or_create(
+            calendar_id=calendar.calendar_id
+        )
+
+    def run(self):
+        """Получение изменений календаря, затем отправка локальных."""
+        yield from self.pull()
+        yield from self.push()
+
+    def push(self):
+        """Отправка удалений и изменений событий."""
+        yield from self.push_deletions()
+        yield from self.push_events()
+        self.state.pushed_at = timezone.now()
+        self.state.save(update_fields=["pushed_at"])
+
+    def push_deletions(self):
+        """Удаление из календаря событий, удаленных локально."""
+        tombstones = CalendarTombstone.objects.filter(
+            calendar_id=self.calendar.calendar_id
+        )
+        last_id = 0
+        while batch := list(tombstones.filter(id__gt=last_id)[: self.batch_size]):
+            last_id = batch[-1].id
+            started = time.perf_counter()
+            results = self.calendar.execute_batch(
+                [
+                    (tombstone.id, "delete", tombstone.calendar_event_id, None)
+                    for tombstone in batch
+                ]
+            )
+            deleted = [
+                key
+                for key, (_, status) in results.items()
+                if status < 300 or status in GONE_STATUSES
+            ]
+            CalendarTombstone.objects.filter(id__in=deleted).delete()
+            yield BatchStats(
+                "delete",
+                len(batch),
+                time.perf_counter() - started,
+                len(batch) - len(deleted),
+            )
+
+    def push_events(self):
+        """
+        Создание и изменение событий в календаре.
+
+        Флаг calendar_dirty снимается, только если событие не изменилось во
+        время отправки (по updated_at). Если событие удалено в календаре,
+        ссылка на него сбрасывается и при следующей отправке оно создается
+        заново.
+        """
+        events = Event.objects.filter(calendar_dirty=True).order_by("id")
+        last_id = 0
+        while batch := list(events.filter(id__gt=last_id)[: self.batch_size]):
+            last_id = batch[-1].id
+            started = time.perf_counter()
+            results = self.calendar.execute_batch(
+                [
+                    (
+                        event.id,
+                        "patch" if event.calendar_event_id else "insert",
+                        event.calendar_event_id,
+                        event_to_body(event),
+                    )
+                    for event in batch
+                ]
+            )
+            linked = []
+            synced = Q(pk__in=[])
+            errors = 0
+            for event in batch:
+                response, status = results[event.id]
+                if status < 300:
+                    if not event.calendar_event_id:
+                        event.calendar_event_id = response["id"]
+                        linked.append(event)
+                    synced |= Q(id=event.id, updated_at=event.updated_at)
+                    continue
+                errors += 1
+                if event.calendar_event_id and status in GONE_STATUSES:
+                    event.calendar_event_id = None
+                    linked.append(event)
+            with transaction.atomic():
+                Event.objects.bulk_update(linked, ["calendar_event_id"])
+                Event.objects.filter(synced).update(calendar_dirty=False)
+            yield BatchStats("push", len(batch), time.perf_counter() - started, errors)
+
+    def pull(self):
+        """
+        Получение изменений календаря по токену синхронизации.
+
+        Без токена или с устаревшим токеном выполняется полная
+        синхронизация, после которой сохраняется новый токен.
+        """
+        sync_token = self.state.sync_token
+        page_token = None
+        while True:
+            started = time.perf_counter()
+            try:
+                response = self.calendar.list_events(sync_token, page_token)
+            except SyncTokenExpiredError:
+                sync_token = page_token = None
+                continue
+            items = response.get("items", [])
+            self.apply_changes(items)
+            yield BatchStats("pull", len(items), time.perf_counter() - started)
+            page_token = response.get("nextPageToken")
+            if page_token is None:
+                break
+        self.state.sync_token = response["nextSyncToken"]
+        self.state.pulled_at = timezone.now()
+        self.state.save(update_fields=["sync_token", "pulled_at"])
+
+    def apply_changes(self, items):
+        """
+        Применение изменений календаря к связанным событиям.
+
+        События календаря без локального события пропускаются.
+        """
+        items = {item["id"]: item for item in items}
+        changed = []
+        cancelled = []
+        for event in Event.objects.filter(calendar_event_id__in=items):
+            item = items[event.calendar_event_id]
+            if item.get("status") == "cancelled":
+                cancelled.append(event.calendar_event_id)
+                continue
+            if event.calendar_dirty:
+                continue
+            fields = body_to_fields(item)
+            if fields != body_to_fields(event_to_body(event)):
+                for name, value in fields.items():
+                    setattr(event, name, value)
+                event.updated_at = timezone.now()
+                changed.append(event)
+        with transaction.atomic():
+            Event.objects.bulk_update(changed, [*EVENT_FIELDS, "updated_at"])
+            if cancelled:
+                Event.objects.filter(calendar_event_id__in=cancelled).delete()
+                CalendarTombstone.objects.filter(
+                    calendar_id=self.calendar.calendar_id,
+                    calendar_event_id__in=cancelled,
+                ).delete()
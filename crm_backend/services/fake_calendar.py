@@ -0,0 +1,158 @@
+import json
+import re
+import threading
+from email.parser import BytesParser, Parser
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+from uuid import uuid4
+
+from .g_calendar import CalendarError, StubCalendar
+
+EVENTS_PATH = re.compile(
+    r"^/calendar/v3/calendars/[^/]+/events(?:/(?P<event_id>[^/]+))?$"
+)
+CALENDAR_LIST_PATH = "/calendar/v3/users/me/calendarList"
+
+
+class FakeCalendarHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов к локальному Calendar API."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        """Список календарей и событий."""
+        self.handle_api()
+
+    def do_POST(self):  # noqa: N802
+        """Создание события и batch-запросы."""
+        self.handle_api()
+
+    def do_PATCH(self):  # noqa: N802
+        """Изменение события."""
+        self.handle_api()
+
+    def do_DELETE(self):  # noqa: N802
+        """Удаление события."""
+        self.handle_api()
+
+    def handle_api(self):
+        """Выполнение запроса и отправка ответа с keep-alive."""
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.server.lock:
+            self.server.requests += 1
+        if self.path.startswith("/batch/"):
+            content_type, content = self.server.dispatch_batch(
+                self.headers["Content-Type"], body
+            )
+            status = 200
+        else:
+            status, data = self.server.dispatch(self.command, self.path, body)
+            content_type = "application/json"
+            content = b"" if data is None else json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        """Запросы не выводятся в stderr."""
+
+
+class FakeCalendarServer(ThreadingHTTPServer):
+    """
+    Локальный HTTP-сервер с подмножеством Google Calendar API.
+
+    Поддерживает список календарей, создание, изменение, удаление и список
+    событий с syncToken, а также batch-запросы multipart/mixed, поэтому
+    GoogleCalendar(root_url=server.url) работает с ним как с Google.
+    События хранятся в StubCalendar сервера, requests -- число
+    полученных HTTP-запросов.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0)):
+        """Сервер на address со своим StubCalendar."""
+        super().__init__(address, FakeCalendarHandler)
+        self.calendar = StubCalendar()
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    @property
+    def url(self):
+        """Адрес сервера для GoogleCalendar(root_url=...)."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        """Запуск сервера в фоновом потоке."""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        """Остановка сервера и закрытие сокета."""
+        self.shutdown()
+        self.server_close()
+
+    def dispatch(self, method, target, body):
+        """Выполнение одного запроса API; возвращает (статус, JSON)."""
+        with self.lock:
+            try:
+                return self.call(method, target, body)
+            except CalendarError as error:
+                return error.status, {
+                    "error": {"code": error.status, "message": str(error)}
+                }
+
+    def call(self, method, target, body):
+        """Вызов метода StubCalendar по HTTP-методу и пути."""
+        url = urlsplit(target)
+        if url.path == CALENDAR_LIST_PATH and method == "GET":
+            return 200, {"items": self.calendar.list_calendars()}
+        match = EVENTS_PATH.match(url.path)
+        if match is None:
+            raise CalendarError(404, f"Неизвестный путь {url.path}")
+        event_id = match["event_id"] and unquote(match["event_id"])
+        if event_id is None and method == "GET":
+            sync_token = parse_qs(url.query).get("syncToken", [None])[0]
+            return 200, self.calendar.list_events(sync_token)
+        if event_id is None and method == "POST":
+            return 200, self.calendar.insert_event(json.loads(body))
+        if event_id is not None and method == "PATCH":
+            return 200, self.calendar.update_event(event_id, json.loads(body))
+        if event_id is not None and method == "DELETE":
+            self.calendar.delete_event(event_id)
+            return 204, None
+        raise CalendarError(405, f"Метод {method} не поддерживается")
+
+    def dispatch_batch(self, content_type, body):
+        """
+        Выполнение batch-запроса.
+
+        Каждая часть multipart/mixed содержит HTTP-запрос; ответы
+        возвращаются частями с Content-ID "response-<id запроса>".
+        """
+        message = BytesParser().parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + body
+        )
+        boundary = f"batch_{uuid4().hex}"
+        parts = []
+        for part in message.get_payload():
+            request_line, request = part.get_payload().split("\n", 1)
+            method, target, _ = request_line.split(" ", 2)
+            status, data = self.dispatch(
+                method, target, Parser().parsestr(request).get_payload()
+            )
+            content = "" if data is None else json.dumps(data)
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{part['Content-ID'][1:-1]}>\r\n\r\n"
+                f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                "Content-Type: application/json\r\n\r\n"
+                f"{content}\r\n"
+            )
+        content = "".join(parts) + f"--{boundary}--\r\n"
+        return f"multipart/mixed; boundary={boundary}", content.encode()
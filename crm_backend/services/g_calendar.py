@@ -1,22 +1,308 @@
-from google.oauth2.service_account import Credentials
-from googleapiclient import discovery
+import json
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import count
+from uuid import uuid4
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.module_loading import import_string
+
+
+@lru_cache(maxsize=None)
+def get_discovery_document():
+    """
+    Описание Calendar API v3 из пакета google-api-python-client.
+
+    Документ читается и разбирается один раз на процесс, без запроса к
+    discovery-сервису Google.
+    """
+    from googleapiclient import discovery_cache
+
+    return json.loads(discovery_cache.get_static_doc("calendar", "v3"))
+
+
+class SyncTokenExpiredError(Exception):
+    """Токен синхронизации устарел, нужна полная синхронизация."""
 
 
 class GoogleCalendar:
-    """Настройка ."""
+    """
+    Клиент Google Calendar API через сервисный аккаунт.
+
+    Ключ сервисного аккаунта читается из GOOGLE_CALENDAR_CREDENTIALS_FILE,
+    события записываются в календарь GOOGLE_CALENDAR_ID. Если задан
+    root_url (или GOOGLE_CALENDAR_ROOT_URL), запросы отправляются на этот
+    адрес, например на локальный services.fake_calendar. Клиент держит
+    одно соединение httplib2 с keep-alive и не потокобезопасен, поэтому
+    переиспользуется через get_calendar в пределах процесса.
+    """
 
     SCOPES = ["https://www.googleapis.com/auth/calendar"]
-    CRED_FILE = "recruitment-process-395710-2cefd3ed6bc8.json"
 
-    def __init__(self):
-        """."""
+    def __init__(self, http=None, root_url=None):
+        """Клиент Calendar API с HTTP-клиентом http и адресом root_url."""
+        from googleapiclient import discovery
+
+        self.calendar_id = settings.GOOGLE_CALENDAR_ID
+        document = get_discovery_document()
+        root_url = root_url or settings.GOOGLE_CALENDAR_ROOT_URL
+        if root_url:
+            document = {**document, "rootUrl": root_url.rstrip("/") + "/"}
+        self.service = discovery.build_from_document(
+            document, http=http or self.get_http()
+        )
+        # Ресурс events() строится из описания API при каждом вызове.
+        self.events = self.service.events()
+
+    def get_http(self):
+        """
+        HTTP-клиент, подписывающий запросы ключом сервисного аккаунта.
+
+        Без GOOGLE_CALENDAR_CREDENTIALS_FILE запросы не подписываются.
+        """
+        import httplib2
+
+        http = httplib2.Http(timeout=settings.GOOGLE_CALENDAR_TIMEOUT)
+        if not settings.GOOGLE_CALENDAR_CREDENTIALS_FILE:
+            return http
+        from google.oauth2.service_account import Credentials
+        from google_auth_httplib2 import AuthorizedHttp
+
         credentials = Credentials.from_service_account_file(
-            filename=self.CRED_FILE, scopes=self.SCOPES
+            filename=settings.GOOGLE_CALENDAR_CREDENTIALS_FILE, scopes=self.SCOPES
         )
-        self.service = discovery.build("calendar", "v3", credentials=credentials)
-        # return service, credentials
+        return AuthorizedHttp(credentials, http=http)
+
+    def build_request(self, method, event_id=None, body=None):
+        """Запрос events().<method> к календарю GOOGLE_CALENDAR_ID."""
+        params = {"calendarId": self.calendar_id}
+        if event_id is not None:
+            params["eventId"] = event_id
+        if body is not None:
+            params["body"] = body
+        return getattr(self.events, method)(**params)
+
+    def list_calendars(self):
+        """Календари, доступные сервисному аккаунту."""
+        return self.service.calendarList().list().execute().get("items", [])
+
+    def insert_event(self, body):
+        """Создание события; возвращает событие с id календаря."""
+        return self.build_request("insert", body=body).execute()
+
+    def update_event(self, event_id, body):
+        """Изменение полей события."""
+        return self.build_request("patch", event_id, body).execute()
+
+    def delete_event(self, event_id):
+        """Удаление события."""
+        self.build_request("delete", event_id).execute()
+
+    def execute_batch(self, operations):
+        """
+        Выполнение операций одним batch-запросом.
+
+        operations -- кортежи (ключ, метод, id события, тело). Возвращает
+        словарь "ключ -> (ответ, HTTP-статус)"; ошибка отдельной операции
+        не прерывает остальные.
+        """
+        keys = {}
+        responses = {}
+
+        def callback(request_id, response, exception):
+            status = exception.resp.status if exception else 200
+            responses[request_id] = (response, status)
+
+        batch = self.service.new_batch_http_request(callback=callback)
+        for key, method, event_id, body in operations:
+            request_id = str(len(keys))
+            keys[request_id] = key
+            batch.add(self.build_request(method, event_id, body), request_id=request_id)
+        batch.execute()
+        return {keys[request_id]: result for request_id, result in responses.items()}
+
+    def list_events(self, sync_token=None, page_token=None):
+        """
+        Страница событий календаря.
+
+        С sync_token возвращаются только события, измененные после
+        получения токена, включая удаленные (status "cancelled"). Если
+        токен устарел, выбрасывается SyncTokenExpiredError.
+        """
+        from googleapiclient.errors import HttpError
+
+        request = self.events.list(
+            calendarId=self.calendar_id,
+            syncToken=sync_token,
+            pageToken=page_token,
+            showDeleted=sync_token is not None,
+        )
+        try:
+            return request.execute()
+        except HttpError as error:
+            if error.resp.status == 410:
+                raise SyncTokenExpiredError from error
+            raise
+
+
+class CalendarError(Exception):
+    """Ошибка локального календаря с HTTP-статусом, как у Calendar API."""
+
+    def __init__(self, status, message):
+        """Ошибка со статусом status и сообщением message."""
+        super().__init__(message)
+        self.status = status
+
+
+class StubCalendar:
+    """
+    Локальный календарь для тестов и разработки.
+
+    События хранятся в памяти (StubCalendar.events) и не отправляются в
+    Google. Токен синхронизации -- номер последнего изменения, поэтому
+    list_events(sync_token) возвращает только более поздние изменения, как
+    Calendar API.
+    """
+
+    def __init__(self):
+        """Пустой календарь с идентификатором из настроек."""
+        self.calendar_id = settings.GOOGLE_CALENDAR_ID
+        self.events = {}
+        self.changes = count(1)
+
+    def save(self, event):
+        """Сохранение события с номером изменения."""
+        event["updated"] = next(self.changes)
+        self.events[event["id"]] = event
+        return event
+
+    def get_event(self, event_id):
+        """Существующее событие или CalendarError 404/410."""
+        event = self.events.get(event_id)
+        if event is None:
+            raise CalendarError(404, f"Событие {event_id} не найдено")
+        if event["status"] == "cancelled":
+            raise CalendarError(410, f"Событие {event_id} удалено")
+        return event
+
+    def list_calendars(self):
+        """Единственный календарь GOOGLE_CALENDAR_ID."""
+        return [{"id": self.calendar_id}]
+
+    def insert_event(self, body):
+        """Создание события с новым id."""
+        return self.save({**body, "id": uuid4().hex, "status": "confirmed"})
+
+    def update_event(self, event_id, body):
+        """Изменение полей события."""
+        return self.save({**self.get_event(event_id), **body})
+
+    def delete_event(self, event_id):
+        """Пометка события удаленным."""
+        self.save({**self.get_event(event_id), "status": "cancelled"})
+
+    def execute_batch(self, operations):
+        """Последовательное выполнение операций, как GoogleCalendar."""
+        methods = {
+            "insert": lambda event_id, body: self.insert_event(body),
+            "patch": self.update_event,
+            "delete": lambda event_id, body: self.delete_event(event_id),
+        }
+        results = {}
+        for key, method, event_id, body in operations:
+            try:
+                results[key] = (methods[method](event_id, body), 200)
+            except CalendarError as error:
+                results[key] = (None, error.status)
+        return results
+
+    def list_events(self, sync_token=None, page_token=None):
+        """События, измененные после sync_token, и новый токен."""
+        since = int(sync_token or 0)
+        items = [
+            event
+            for event in self.events.values()
+            if event["updated"] > since
+            and (sync_token or event["status"] != "cancelled")
+        ]
+        last_change = max(
+            (event["updated"] for event in self.events.values()), default=0
+        )
+        return {"items": items, "nextSyncToken": str(max(last_change, since))}
+
+
+@lru_cache(maxsize=None)
+def get_calendar():
+    """
+    Клиент календаря из настройки GOOGLE_CALENDAR_BACKEND.
+
+    Создается при первом обращении, поэтому импорт модуля не читает ключ
+    сервисного аккаунта и не обращается к сети.
+    """
+    return import_string(settings.GOOGLE_CALENDAR_BACKEND)()
+
+
+def event_to_body(event):
+    """
+    Событие recruitment.Event в формате Calendar API.
+
+    Без времени начала событие считается событием на весь день; дата
+    окончания таких событий в Calendar API не входит в событие.
+    """
+    end_date = event.end_date or event.start_date
+    if event.start_time is None:
+        start = {"date": event.start_date.isoformat()}
+        end = {"date": (end_date + timedelta(days=1)).isoformat()}
+    else:
+        end_time = event.end_time or event.start_time
+        start = {
+            "dateTime": datetime.combine(
+                event.start_date, event.start_time
+            ).isoformat(),
+            "timeZone": settings.TIME_ZONE,
+        }
+        end = {
+            "dateTime": datetime.combine(end_date, end_time).isoformat(),
+            "timeZone": settings.TIME_ZONE,
+        }
+    return {
+        "summary": event.title,
+        "description": event.description or "",
+        "location": event.conference_link or "",
+        "start": start,
+        "end": end,
+    }
+
+
+def parse_event_time(value):
+    """Дата и время начала или окончания события Calendar API."""
+    if "date" in value:
+        return date.fromisoformat(value["date"]), None
+    moment = parse_datetime(value["dateTime"])
+    if timezone.is_aware(moment):
+        moment = timezone.localtime(moment)
+    return moment.date(), moment.time()
 
 
-obj = GoogleCalendar()
+def body_to_fields(body):
+    """
+    Поля recruitment.Event из события Calendar API.
 
-cal_list = calendar_list = obj.service.calendarList().list().execute()
+    Обратное преобразование к event_to_body: время переводится в
+    TIME_ZONE, дата окончания события на весь день -- в последний день.
+    """
+    start_date, start_time = parse_event_time(body["start"])
+    end_date, end_time = parse_event_time(body["end"])
+    if start_time is None:
+        end_date -= timedelta(days=1)
+    return {
+        "title": body.get("summary", ""),
+        "description": body.get("description") or None,
+        "conference_link": body.get("location") or None,
+        "start_date": start_date,
+        "start_time": start_time,
+        "end_date": end_date,
+        "end_time": end_time,
+    }
@@ -0,0 +1,116 @@
+from datetime import date, time
+from unittest.mock import patch
+
+from api.views import AgendaView
+from django.test import TestCase
+from django.urls import reverse
+from recruitment.models import Candidate, Company, Event, Vacancy
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class AgendaTest(TestCase):
+    """Тестирование повестки событий."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """События кандидатов двух HR в разные дни."""
+        cls.user = User.objects.create_user("hr@example.com", "password")
+        other = User.objects.create_user("other@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        for author in (cls.user, other):
+            vacancy = Vacancy.objects.create(
+                company=company,
+                author=author,
+                vacancy_title=f"Разработчик {author.id}",
+                city="Москва",
+            )
+            candidate = Candidate.objects.create(
+                first_name="Иван",
+                last_name="Петров",
+                bday=date(1990, 1, 1),
+                city="Москва",
+                email=f"candidate{author.id}@example.com",
+                vacancy=vacancy,
+            )
+            for day, start_time in ((4, time(15)), (4, time(10)), (10, None)):
+                Event.objects.create(
+                    title=f"Интервью {day} {start_time}",
+                    start_date=date(2023, 9, day),
+                    start_time=start_time,
+                    candidate=candidate,
+                )
+        cls.candidate = cls.user.vacancies.get().candidates.get()
+
+    def setUp(self):
+        """Авторизация клиента."""
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("agenda")
+
+    def test_week(self):
+        """События недели [date_from, date_to) кандидатов пользователя."""
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.url, {"date_from": "2023-09-04", "date_to": "2023-09-10"}
+            )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(
+            [(event["start_date"], event["start_time"]) for event in data],
+            [("2023-09-04", "10:00:00"), ("2023-09-04", "15:00:00")],
+        )
+        self.assertEqual(
+            data[0]["candidate"],
+            {
+                "id": self.candidate.id,
+                "first_name": "Иван",
+                "last_name": "Петров",
+                "patronymic": None,
+                "cur_position": None,
+                "vacancy": self.candidate.vacancy_id,
+                "vacancy_title": self.candidate.vacancy.vacancy_title,
+            },
+        )
+
+    def test_multi_day(self):
+        """Многодневные события, пересекающие окно, попадают в повестку."""
+        for title, start_day, end_day in (
+            ("Конференция", 1, 5),
+            ("Отпуск", 1, 3),
+            ("Стажировка", 8, 20),
+        ):
+            Event.objects.create(
+                title=title,
+                start_date=date(2023, 9, start_day),
+                end_date=date(2023, 9, end_day),
+                candidate=self.candidate,
+            )
+        response = self.client.get(
+            self.url, {"date_from": "2023-09-04", "date_to": "2023-09-10"}
+        )
+        self.assertEqual(
+            [event["title"] for event in response.json()],
+            ["Конференция", "Интервью 4 10:00:00", "Интервью 4 15:00:00", "Стажировка"],
+        )
+
+    def test_same_content(self):
+        """Быстрый сериализатор совпадает с AgendaEventSerializer."""
+        params = {"date_from": "2023-09-01", "date_to": "2023-10-01"}
+        fast = self.client.get(self.url, params)
+        with patch.object(AgendaView, "fast_list_serializer_class", None):
+            expected = self.client.get(self.url, params)
+        self.assertEqual(len(fast.json()), 3)
+        self.assertEqual(fast.content, expected.content)
+
+    def test_invalid_window(self):
+        """Окно без дат, пустое или слишком длинное отклоняется."""
+        for params in (
+            {},
+            {"date_from": "2023-09-04", "date_to": "2023-09-04"},
+            {"date_from": "2023-01-01", "date_to": "2023-12-31"},
+        ):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(self.url, params).status_code, 400)
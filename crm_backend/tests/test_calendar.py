@@ -0,0 +1,170 @@
+import json
+from datetime import date, time
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from googleapiclient.http import HttpMockSequence
+from recruitment.models import CalendarSyncState, CalendarTombstone, Event
+from services.calendar_sync import CalendarSync
+from services.fake_calendar import FakeCalendarServer
+from services.g_calendar import (
+    GoogleCalendar,
+    body_to_fields,
+    event_to_body,
+    get_calendar,
+    get_discovery_document,
+)
+
+
+@override_settings(GOOGLE_CALENDAR_BACKEND="services.g_calendar.StubCalendar")
+class CalendarClientTest(TestCase):
+    """Тестирование клиента календаря без обращения к сети."""
+
+    def setUp(self):
+        """Сброс созданного клиента календаря."""
+        get_calendar.cache_clear()
+        self.addCleanup(get_calendar.cache_clear)
+
+    def test_event_to_body(self):
+        """Событие со временем и событие на весь день."""
+        event = Event(
+            title="Интервью",
+            start_date=date(2023, 9, 1),
+            start_time=time(10, 30),
+            end_time=time(11),
+            conference_link="https://meet.google.com/abc",
+        )
+        body = event_to_body(event)
+        self.assertEqual(
+            body["start"],
+            {"dateTime": "2023-09-01T10:30:00", "timeZone": "Europe/Volgograd"},
+        )
+        self.assertEqual(body["end"]["dateTime"], "2023-09-01T11:00:00")
+        self.assertEqual(body["location"], "https://meet.google.com/abc")
+
+        self.assertEqual(
+            body_to_fields(
+                {**body, "start": {"dateTime": "2023-09-01T09:30:00+02:00"}}
+            )["start_time"],
+            time(10, 30),
+        )
+
+        event.start_time = None
+        body = event_to_body(event)
+        self.assertEqual(body["start"], {"date": "2023-09-01"})
+        self.assertEqual(body["end"], {"date": "2023-09-02"})
+        self.assertEqual(body_to_fields(body)["end_date"], date(2023, 9, 1))
+
+    def test_stub_sync_token(self):
+        """Токен синхронизации возвращает только последующие изменения."""
+        calendar = get_calendar()
+        self.assertIs(calendar, get_calendar())
+        first = calendar.insert_event({"summary": "Первое"})
+        second = calendar.insert_event({"summary": "Второе"})
+        response = calendar.list_events()
+        self.assertEqual(len(response["items"]), 2)
+
+        calendar.update_event(first["id"], {"summary": "Измененное"})
+        calendar.delete_event(second["id"])
+        changes = calendar.list_events(sync_token=response["nextSyncToken"])
+        self.assertEqual(
+            {(item["summary"], item["status"]) for item in changes["items"]},
+            {("Измененное", "confirmed"), ("Второе", "cancelled")},
+        )
+        self.assertEqual(
+            calendar.list_events(sync_token=changes["nextSyncToken"])["items"], []
+        )
+
+    def test_google_calendar_offline(self):
+        """Клиент Google строится из сохраненного описания API."""
+        get_discovery_document.cache_clear()
+        http = HttpMockSequence(
+            [({"status": "200"}, json.dumps({"id": "remote", "status": "confirmed"}))]
+        )
+        calendar = GoogleCalendar(http=http)
+        GoogleCalendar(http=http)
+        self.assertEqual(get_discovery_document.cache_info().misses, 1)
+        self.assertEqual(calendar.insert_event({"summary": "Интервью"})["id"], "remote")
+
+
+class CalendarSyncTest(TestCase):
+    """Тестирование синхронизации событий с локальным сервером Calendar API."""
+
+    def setUp(self):
+        """Запуск локального сервера и события для синхронизации."""
+        self.server = FakeCalendarServer().start()
+        self.addCleanup(self.server.stop)
+        self.remote = self.server.calendar
+        self.sync = CalendarSync(GoogleCalendar(root_url=self.server.url), 2)
+        self.events = [
+            Event.objects.create(
+                title=f"Интервью {number}", start_date=date(2023, 9, 1)
+            )
+            for number in range(3)
+        ]
+
+    def run_sync(self, method):
+        """Запуск синхронизации; возвращает размеры пакетов."""
+        return [stats.size for stats in getattr(self.sync, method)()]
+
+    def test_push(self):
+        """Создание, изменение и удаление событий пакетами."""
+        self.assertEqual(self.run_sync("push"), [2, 1])
+        self.assertEqual(self.server.requests, 2)
+        self.assertFalse(Event.objects.filter(calendar_dirty=True).exists())
+        event_ids = set(Event.objects.values_list("calendar_event_id", flat=True))
+        self.assertEqual(event_ids, set(self.remote.events))
+
+        first, second, _ = Event.objects.order_by("id")
+        first.title = "Интервью перенесено"
+        first.save()
+        second.delete()
+        self.assertEqual(self.run_sync("push"), [1, 1])
+        self.assertEqual(
+            self.remote.events[first.calendar_event_id]["summary"], first.title
+        )
+        self.assertEqual(
+            self.remote.events[second.calendar_event_id]["status"], "cancelled"
+        )
+        self.assertFalse(CalendarTombstone.objects.exists())
+        self.assertEqual(self.run_sync("push"), [])
+
+    def test_pull(self):
+        """Изменения календаря применяются по токену синхронизации."""
+        list(self.sync.run())
+        first, second, third = Event.objects.order_by("id")
+        self.remote.update_event(first.calendar_event_id, {"summary": "Из календаря"})
+        self.remote.delete_event(second.calendar_event_id)
+        third.title = "Локальное изменение"
+        third.save()
+        self.remote.update_event(third.calendar_event_id, {"summary": "Конфликт"})
+        self.remote.insert_event({"summary": "Чужое событие"})
+
+        self.assertEqual(self.run_sync("pull"), [4])
+        self.assertEqual(
+            list(Event.objects.order_by("id").values_list("title", flat=True)),
+            ["Из календаря", "Локальное изменение"],
+        )
+        self.assertFalse(CalendarTombstone.objects.exists())
+        self.assertEqual(self.run_sync("pull"), [0])
+        state = CalendarSyncState.objects.get(calendar_id="primary")
+        self.assertIsNotNone(state.pulled_at)
+
+    def test_command(self):
+        """Команда синхронизирует события с локальным сервером."""
+        out = StringIO()
+        call_command("sync_calendar", "--fake-server", stdout=out)
+        self.assertIn("push: всего 3 событий", out.getvalue())
+        self.assertFalse(Event.objects.filter(calendar_dirty=True).exists())
+
+    @override_settings(GOOGLE_CALENDAR_BACKEND="services.g_calendar.StubCalendar")
+    def test_command_without_calendar(self):
+        """Без настроенного календаря команда не меняет события."""
+        get_calendar.cache_clear()
+        self.addCleanup(get_calendar.cache_clear)
+        events = list(Event.objects.values())
+        with self.assertRaises(CommandError):
+            call_command("sync_calendar", stdout=StringIO())
+        self.assertEqual(list(Event.objects.values()), events)
+        self.assertEqual(self.server.requests, 0)
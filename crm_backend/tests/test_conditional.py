@@ -0,0 +1,124 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from recruitment.models import (
+    Candidate,
+    Comment,
+    Company,
+    FunnelStage,
+    Note,
+    SubStage,
+    Vacancy,
+)
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class ConditionalGetTest(TestCase):
+    """Тестирование условных GET-запросов."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Кандидат с этапом воронки и заметкой с комментарием."""
+        cls.user = User.objects.create_user("hr@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        cls.vacancy = Vacancy.objects.create(
+            company=company,
+            author=cls.user,
+            vacancy_title="Backend",
+            city="Москва",
+        )
+        cls.candidate = Candidate.objects.create(
+            first_name="Иван",
+            last_name="Петров",
+            bday=date(1990, 1, 1),
+            city="Москва",
+            email="candidate@example.com",
+            vacancy=cls.vacancy,
+        )
+        cls.stage = FunnelStage.objects.create(
+            candidate=cls.candidate, name="Скрининг", date=date(2023, 9, 1)
+        )
+        cls.note = Note.objects.create(
+            candidate=cls.candidate, author=cls.user, text="Заметка"
+        )
+        cls.comment = Comment.objects.create(
+            note=cls.note, author=cls.user, text="Комментарий"
+        )
+
+    def setUp(self):
+        """Авторизация клиента."""
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assert_not_modified(self, url, **headers):
+        """Повторный запрос с валидатором первого ответа возвращает 304."""
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        return response["ETag"]
+
+    def assert_modified(self, url, etag):
+        """Запрос с устаревшим ETag возвращает новый ответ."""
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_detail(self):
+        """Карточка кандидата меняется вместе с кандидатом и вакансией."""
+        url = reverse(
+            "candidates-detail",
+            kwargs={"vacancy_id": self.vacancy.id, "pk": self.candidate.id},
+        )
+        etag = self.assert_not_modified(url)
+        response = self.client.get(url)
+        self.assertEqual(
+            self.client.get(
+                url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+            ).status_code,
+            304,
+        )
+        self.vacancy.vacancy_title = "Python"
+        self.vacancy.save()
+        self.assert_modified(url, etag)
+        etag = self.assert_not_modified(url)
+        self.candidate.city = "Казань"
+        self.candidate.save()
+        self.assert_modified(url, etag)
+
+    def test_list(self):
+        """Заголовок ETag списка строится по странице, без агрегатов по всему списку."""
+        url = reverse("funnel-list", kwargs={"candidate_id": self.candidate.id})
+        response = self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+        for query in queries:
+            self.assertNotIn("COUNT(", query["sql"])
+            self.assertNotIn("MAX(", query["sql"])
+        self.assertNotIn("Last-Modified", response)
+        self.assertNotEqual(
+            self.client.get(url, {"ordering": "date"})["ETag"], response["ETag"]
+        )
+
+    def test_nested(self):
+        """Изменение вложенных объектов меняет ETag списка родителей."""
+        url = reverse("funnel-list", kwargs={"candidate_id": self.candidate.id})
+        etag = self.assert_not_modified(url)
+        SubStage.objects.create(stage=self.stage, name="Звонок")
+        self.assert_modified(url, etag)
+
+        url = reverse("notes-list", kwargs={"candidate_id": self.candidate.id})
+        etag = self.assert_not_modified(url)
+        self.comment.delete()
+        self.assert_modified(url, etag)
+        etag = self.assert_not_modified(url)
+        Note.objects.create(candidate=self.candidate, author=self.user, text="Еще")
+        self.assert_modified(url, etag)
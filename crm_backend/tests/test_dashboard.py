@@ -0,0 +1,132 @@
+from datetime import date
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from recruitment.models import Candidate, Company, Vacancy
+from rest_framework.test import APIClient
+from users.models import User
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "responses": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "test-dashboard",
+    },
+}
+
+
+@override_settings(CACHES=CACHES)
+class VacancySummaryTest(TestCase):
+    """Тестирование сводки по вакансиям."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Вакансии HR с кандидатами в разных статусах."""
+        cls.user = User.objects.create_user("hr@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        cls.backend, cls.empty = (
+            Vacancy.objects.create(
+                company=company,
+                author=cls.user,
+                vacancy_title=title,
+                city="Москва",
+                vacancy_status="A",
+            )
+            for title in ("Backend", "Frontend")
+        )
+        for number, (candidate_status, interview_status) in enumerate(
+            (("A", "PS"), ("A", "IHR"), ("R", "PS"))
+        ):
+            Candidate.objects.create(
+                first_name="Иван",
+                last_name="Петров",
+                bday=date(1990, 1, 1),
+                city="Москва",
+                email=f"candidate{number}@example.com",
+                vacancy=cls.backend,
+                candidate_status=candidate_status,
+                interview_status=interview_status,
+            )
+
+    def setUp(self):
+        """Авторизация клиента и пустой кэш."""
+        caches["responses"].clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("vacancies-summary")
+
+    def test_summary(self):
+        """Количество кандидатов по статусам считается одним запросом."""
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        backend, empty = response.json()
+        self.assertEqual(
+            (backend["id"], backend["candidates_count"], empty["candidates_count"]),
+            (self.backend.id, 3, 0),
+        )
+        self.assertEqual(backend["candidate_status"]["activeCandidates"], 2)
+        self.assertEqual(backend["candidate_status"]["rejectedCandidates"], 1)
+        self.assertEqual(backend["interview_status"]["Первичный скрининг"], 2)
+        self.assertEqual(backend["interview_status"]["Оффер"], 0)
+
+    @override_settings(
+        CACHES={
+            **CACHES,
+            "responses": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+        }
+    )
+    def test_without_cache(self):
+        """Без кэша ответов сводка считается одним запросом при каждом вызове."""
+        for _ in range(2):
+            with self.assertNumQueries(1):
+                response = self.client.get(self.url)
+        self.assertEqual(response.json()[0]["candidates_count"], 3)
+
+    def test_cache(self):
+        """Количества берутся из кэша до изменения кандидатов вакансии."""
+        self.client.get(self.url)
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            Candidate.objects.filter(candidate_status="R").get().delete()
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(response.json()[0]["candidates_count"], 2)
+
+    def test_vacancy_changes(self):
+        """Название и автор вакансии читаются из базы, а не из кэша."""
+        self.client.get(self.url)
+        Vacancy.objects.filter(pk=self.backend.pk).update(vacancy_title="Python")
+        Vacancy.objects.filter(pk=self.empty.pk).update(
+            author=User.objects.create_user("other@example.com", "password")
+        )
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        (backend,) = response.json()
+        self.assertEqual(
+            (backend["vacancy_title"], backend["candidates_count"]), ("Python", 3)
+        )
+
+    def test_move_candidate(self):
+        """Перенос кандидата сбрасывает количества обеих вакансий без запросов."""
+        self.client.get(self.url)
+        candidate = Candidate.objects.filter(candidate_status="R").get()
+        candidate.vacancy = self.empty
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                candidate.save()
+        self.assertFalse(
+            [
+                query
+                for query in queries.captured_queries
+                if query["sql"].startswith('SELECT "recruitment_vacancy"')
+            ]
+        )
+        response = self.client.get(self.url)
+        self.assertEqual([row["candidates_count"] for row in response.json()], [2, 1])
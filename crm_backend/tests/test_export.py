@@ -0,0 +1,137 @@
+import csv
+import io
+import json
+from datetime import date
+from unittest.mock import patch
+
+from api import exports
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from recruitment.models import (
+    ApplicantResume,
+    Candidate,
+    Company,
+    Skills,
+    SkillStack,
+    Vacancy,
+    WorkExperience,
+)
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class ExportTest(TestCase):
+    """Тестирование выгрузки списков в CSV и JSONL."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Вакансии с кандидатами, навыками и резюме."""
+        cls.user = User.objects.create_user("hr@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        skill = Skills.objects.create(name="Python")
+        for number, vacancy_status in enumerate(("A", "A", "Z")):
+            vacancy = Vacancy.objects.create(
+                company=company,
+                author=cls.user,
+                vacancy_title=f"Разработчик {number}",
+                city="Москва",
+                vacancy_status=vacancy_status,
+                employment_type=["PO", "CH"],
+                salary=[100, 200],
+            )
+            vacancy.skill_stack.add(
+                SkillStack.objects.create(
+                    skill_stack=skill, skill_stack_time=2, vacancy=vacancy
+                )
+            )
+        cls.vacancy = Vacancy.objects.get(vacancy_title="Разработчик 0")
+        for number in range(3):
+            Candidate.objects.create(
+                first_name="Иван",
+                last_name=f"Петров {number}",
+                bday=date(1990, 1, 1),
+                city="Москва",
+                email=f"candidate{number}@example.com",
+                vacancy=cls.vacancy,
+                education="SR",
+            )
+        resume = ApplicantResume.objects.create(
+            applicant=cls.user,
+            job_title="Разработчик",
+            phone_number="89501002030",
+            bday=date(1990, 1, 1),
+        )
+        resume.work_experiences.add(
+            WorkExperience.objects.create(
+                start_date=date(2020, 1, 1),
+                position="Разработчик",
+                organization="Яндекс",
+            )
+        )
+
+    def setUp(self):
+        """Авторизация клиента."""
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def export(self, url, **params):
+        """Содержимое потоковой выгрузки и число запросов к БД."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.streaming)
+            content = b"".join(response.streaming_content).decode()
+        return content, len(queries)
+
+    def test_csv(self):
+        """CSV с заголовками полей, названиями вариантов и фильтрами списка."""
+        content, _ = self.export(reverse("vacancies-export"), vacancy_status="A")
+        self.assertTrue(content.startswith("\ufeff"))
+        rows = list(csv.DictReader(io.StringIO(content[1:])))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["vacancy_title"], "Разработчик 0")
+        self.assertEqual(rows[0]["company"], "Яндекс")
+        self.assertEqual(rows[0]["employment_type"], "Полная, Частичная")
+        self.assertEqual(rows[0]["skill_stack"], "Python - 2 года")
+        self.assertEqual(json.loads(rows[0]["salary_range"]), {"min": 100, "max": 200})
+
+    def test_jsonl(self):
+        """JSON Lines: по объекту на строку."""
+        content, _ = self.export(
+            reverse("candidates-export", kwargs={"vacancy_id": self.vacancy.id}),
+            export_format="jsonl",
+            ordering="-last_name",
+        )
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(
+            [row["last_name"] for row in rows], ["Петров 2", "Петров 1", "Петров 0"]
+        )
+        self.assertEqual(rows[0]["education"], "Среднее")
+        self.assertEqual(rows[0]["bday"], "1990-01-01")
+
+    def test_related_lists(self):
+        """Связанные списки загружаются одним запросом на пачку."""
+        content, _ = self.export(reverse("resumes-export"), export_format="jsonl")
+        self.assertEqual(
+            json.loads(content)["work_experiences"], ["Яндекс, Разработчик"]
+        )
+
+    def test_queries_per_chunk(self):
+        """Число запросов зависит от числа пачек, а не строк."""
+        url = reverse("vacancies-export")
+        with patch.object(exports, "EXPORT_CHUNK_SIZE", 1):
+            _, queries_for_chunks = self.export(url)
+        _, queries = self.export(url)
+        self.assertGreater(queries_for_chunks, queries)
+        self.assertLessEqual(queries, 3)
+
+    def test_invalid_format(self):
+        """Неизвестный формат отклоняется."""
+        response = self.client.get(
+            reverse("vacancies-export"), {"export_format": "xml"}
+        )
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,176 @@
+from datetime import date
+
+from django.test import TestCase
+from django.urls import reverse
+from recruitment.funnel import refresh_funnel_summaries
+from recruitment.models import (
+    Candidate,
+    Company,
+    FunnelStage,
+    FunnelSummary,
+    SubStage,
+    Vacancy,
+)
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class FunnelAnalyticsTest(TestCase):
+    """Тестирование итогов воронки."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Две вакансии HR и вакансия другого HR с этапами воронки."""
+        cls.user = User.objects.create_user("hr@example.com", "password")
+        cls.other = User.objects.create_user("other@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        cls.backend, cls.frontend, cls.foreign = (
+            Vacancy.objects.create(
+                company=company,
+                author=author,
+                vacancy_title=title,
+                city="Москва",
+            )
+            for author, title in (
+                (cls.user, "Backend"),
+                (cls.user, "Frontend"),
+                (cls.other, "QA"),
+            )
+        )
+        # (вакансия, этапы кандидата: (название, дата, статус))
+        funnels = (
+            (cls.backend, (("Скрининг", 1, "2"), ("Интервью", 3, "2"))),
+            (cls.backend, (("Скрининг", 1, "2"), ("Интервью", 6, "3"))),
+            (cls.backend, (("Скрининг", 2, "3"),)),
+            (cls.frontend, (("Скрининг", 1, "2"), ("Интервью", 11, "1"))),
+            (cls.foreign, (("Скрининг", 1, "1"),)),
+        )
+        for number, (vacancy, stages) in enumerate(funnels):
+            candidate = Candidate.objects.create(
+                first_name="Иван",
+                last_name="Петров",
+                bday=date(1990, 1, 1),
+                city="Москва",
+                email=f"candidate{number}@example.com",
+                vacancy=vacancy,
+            )
+            for name, day, status in stages:
+                FunnelStage.objects.create(
+                    candidate=candidate,
+                    name=name,
+                    date=date(2023, 9, day),
+                    status=status,
+                )
+        refresh_funnel_summaries()
+        cls.interview = FunnelStage.objects.get(
+            name="Интервью", candidate__email="candidate0@example.com"
+        )
+
+    def setUp(self):
+        """Авторизация клиента."""
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("funnel_analytics")
+
+    def get(self, **params):
+        """Итоги воронки в виде {(vacancy, stage): строка}."""
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return {(row["vacancy"], row["stage"]): row for row in response.json()}
+
+    def test_vacancy_scope(self):
+        """Конверсия и медиана дней на этапе по вакансиям пользователя."""
+        rows = self.get()
+        self.assertEqual(
+            set(rows),
+            {
+                (self.backend.id, "Скрининг"),
+                (self.backend.id, "Интервью"),
+                (self.frontend.id, "Скрининг"),
+                (self.frontend.id, "Интервью"),
+            },
+        )
+        screening = rows[(self.backend.id, "Скрининг")]
+        self.assertEqual(
+            (screening["total"], screening["passed"], screening["failed"]), (3, 2, 1)
+        )
+        self.assertEqual(screening["conversion"], 0.6667)
+        # Скрининг длится до следующего этапа: 2 и 5 дней.
+        self.assertEqual(screening["median_days"], 3.5)
+        interview = rows[(self.frontend.id, "Интервью")]
+        self.assertEqual(
+            (interview["in_progress"], interview["median_days"]), (1, None)
+        )
+
+    def test_recruiter_scope(self):
+        """Итоги рекрутера собираются по всем его вакансиям."""
+        rows = self.get(scope="recruiter")
+        self.assertEqual(set(rows), {(None, "Скрининг"), (None, "Интервью")})
+        screening = rows[(None, "Скрининг")]
+        self.assertEqual((screening["author"], screening["total"]), (self.user.id, 4))
+        self.assertEqual(screening["median_days"], 5)
+
+    def test_incremental_refresh(self):
+        """После фиксации пересчитываются только вакансии с измененными этапами."""
+        self.assertEqual(refresh_funnel_summaries(), 0)
+        before = self.get(vacancy=self.backend.id)
+        with self.captureOnCommitCallbacks() as callbacks:
+            SubStage.objects.create(
+                stage=self.interview, name="Техническое", date=date(2023, 9, 13)
+            )
+        self.assertQuerysetEqual(
+            Vacancy.objects.filter(funnel_dirty=True), [self.backend]
+        )
+        self.assertEqual(self.get(vacancy=self.backend.id), before)
+        for callback in callbacks:
+            callback()
+        self.assertFalse(Vacancy.objects.filter(funnel_dirty=True).exists())
+        # Интервью длится до последнего подэтапа: 10 дней.
+        rows = self.get(vacancy=self.backend.id)
+        self.assertEqual(rows[(self.backend.id, "Интервью")]["median_days"], 10)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.interview.candidate.delete()
+        rows = self.get(vacancy=self.backend.id)
+        self.assertEqual(rows[(self.backend.id, "Скрининг")]["total"], 2)
+        self.assertEqual(rows[(self.backend.id, "Интервью")]["median_days"], None)
+
+    def test_move_candidate(self):
+        """Перенос кандидата пересчитывает итоги обеих вакансий."""
+        candidate = self.interview.candidate
+        with self.captureOnCommitCallbacks(execute=True):
+            candidate.vacancy = self.frontend
+            candidate.save()
+        rows = self.get()
+        self.assertEqual(rows[(self.backend.id, "Скрининг")]["total"], 2)
+        self.assertEqual(rows[(self.frontend.id, "Скрининг")]["total"], 2)
+        self.assertEqual(rows[(self.frontend.id, "Интервью")]["total"], 2)
+
+    def test_reassign_vacancy(self):
+        """Смена автора вакансии пересчитывает итоги обоих рекрутеров."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.frontend.author = self.other
+            self.frontend.save()
+        screening = self.get(scope="recruiter")[(None, "Скрининг")]
+        self.assertEqual(screening["total"], 3)
+        self.client.force_authenticate(self.other)
+        rows = self.get(scope="recruiter")
+        self.assertEqual(rows[(None, "Скрининг")]["total"], 2)
+        self.assertIn((self.frontend.id, "Интервью"), self.get())
+
+    def test_read_precomputed(self):
+        """Аналитика только читает готовые итоги."""
+        Vacancy.objects.update(funnel_dirty=True)
+        with self.assertNumQueries(1):
+            self.get(scope="recruiter")
+        self.assertEqual(Vacancy.objects.filter(funnel_dirty=True).count(), 3)
+
+    def test_staff(self):
+        """Персонал видит итоги всех рекрутеров, остальные -- только свои."""
+        self.assertEqual(self.get(scope="recruiter", author=self.other.id), {})
+        self.user.is_staff = True
+        self.user.save()
+        rows = self.get(scope="recruiter", author=self.other.id)
+        self.assertEqual(rows[(None, "Скрининг")]["author"], self.other.id)
+        self.assertEqual(FunnelSummary.objects.filter(author=self.other).count(), 2)
@@ -0,0 +1,138 @@
+import io
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from api.imports import CandidateImport, iter_rows
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from openpyxl import Workbook
+from recruitment.models import Candidate, Company, Vacancy
+from rest_framework.test import APIClient
+from users.models import User
+
+CSV_HEADER = (
+    "first_name,last_name,bday,city,email,"
+    "employment_type,schedule_work,work_experiences,education,candidate_status\n"
+)
+CHOICES = '"PO,CH",U,2,SR,A'
+
+
+def candidate_csv(count, start=0):
+    """CSV с count корректными кандидатами."""
+    rows = (
+        f"Иван,Петров{number},1990-01-01,Москва,"
+        f"candidate{number}@example.com,{CHOICES}\n"
+        for number in range(start, start + count)
+    )
+    return (CSV_HEADER + "".join(rows)).encode()
+
+
+class CandidateImportTest(TestCase):
+    """Тестирование импорта кандидатов."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Вакансия и существующий кандидат."""
+        cls.user = User.objects.create_user("hr@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        cls.vacancy = Vacancy.objects.create(
+            company=company,
+            author=cls.user,
+            vacancy_title="Разработчик",
+            city="Москва",
+        )
+        Candidate.objects.create(
+            first_name="Анна",
+            last_name="Сидорова",
+            bday=date(1991, 1, 1),
+            city="Москва",
+            email="taken@example.com",
+            vacancy=cls.vacancy,
+        )
+
+    def setUp(self):
+        """Авторизация клиента."""
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse(
+            "candidates-import-candidates", kwargs={"vacancy_id": self.vacancy.id}
+        )
+
+    def test_csv(self):
+        """Корректные строки создаются, ошибочные возвращаются с номером."""
+        content = (
+            CSV_HEADER
+            + f"Иван,Петров,1990-01-01,Москва,new@example.com,{CHOICES}\n"
+            + f"Петр,,1990-01-01,Москва,empty@example.com,{CHOICES}\n"
+            + f"Анна,Сидорова,1991-01-01,Москва,taken@example.com,{CHOICES}\n"
+            + f"Олег,Иванов,1992-01-01,Казань,new@example.com,{CHOICES}\n"
+        ).encode()
+        response = self.client.post(
+            self.url,
+            {"file": SimpleUploadedFile("candidates.csv", content)},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 200)
+        report = response.json()
+        self.assertEqual(report["created"], 1)
+        self.assertEqual(report["error_count"], 3)
+        self.assertEqual([error["row"] for error in report["errors"]], [3, 4, 5])
+        self.assertIn("last_name", report["errors"][0]["errors"])
+        candidate = Candidate.objects.get(email="new@example.com")
+        self.assertEqual(candidate.vacancy, self.vacancy)
+        self.assertEqual(sorted(candidate.employment_type), ["CH", "PO"])
+
+    def test_xlsx(self):
+        """Строки первого листа XLSX с датами в ячейках."""
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(CSV_HEADER.strip().split(","))
+        sheet.append(
+            ["Иван", "Петров", date(1990, 1, 1), "Москва", "x@example.com"]
+            + ["PO", "U,G", 2, "SR", "A"]
+        )
+        file = io.BytesIO()
+        workbook.save(file)
+        response = self.client.post(
+            self.url,
+            {"file": SimpleUploadedFile("candidates.xlsx", file.getvalue())},
+            format="multipart",
+        )
+        self.assertEqual(response.json()["created"], 1)
+        self.assertEqual(
+            Candidate.objects.get(email="x@example.com").bday, date(1990, 1, 1)
+        )
+
+    def test_unsupported_file(self):
+        """Файл неизвестного формата отклоняется."""
+        response = self.client.post(
+            self.url,
+            {"file": SimpleUploadedFile("candidates.txt", b"")},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_queries_per_chunk(self):
+        """Число запросов зависит от числа пачек, а не строк."""
+        candidate_import = CandidateImport(self.vacancy, chunk_size=5)
+        with CaptureQueriesContext(connection) as queries:
+            candidate_import.run(iter_rows(io.BytesIO(candidate_csv(20)), "a.csv"))
+        self.assertEqual(candidate_import.created, 20)
+        self.assertLessEqual(len(queries), 4 * 6)
+
+    def test_command(self):
+        """Команда импортирует файл с диска."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "candidates.csv"
+            path.write_bytes(candidate_csv(3))
+            out = io.StringIO()
+            call_command("import_candidates", self.vacancy.id, path, stdout=out)
+        self.assertIn("Создано кандидатов: 3", out.getvalue())
+        self.assertEqual(self.vacancy.candidates.count(), 4)
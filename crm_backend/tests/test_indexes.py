@@ -0,0 +1,278 @@
+from datetime import date
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from psycopg2.extras import NumericRange
+from recruitment.models import (
+    ApplicantResume,
+    Candidate,
+    Company,
+    FunnelStage,
+    Note,
+    SubStage,
+    Vacancy,
+)
+from recruitment.salary import update_salary_bands
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class IndexTestCase(TestCase):
+    """Базовый класс для проверки планов запросов."""
+
+    def setUp(self):
+        """Запрет последовательного сканирования до конца транзакции теста."""
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assert_uses_index(self, queryset, index_name):
+        """Проверка, что в плане запроса используется индекс."""
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, plan)
+
+
+class TrigramIndexTest(IndexTestCase):
+    """Тестирование фильтров по подстроке с триграммными индексами."""
+
+    def test_trigram_filters_use_indexes(self):
+        """Фильтры trgm_icontains обслуживаются GIN-индексами."""
+        cases = (
+            (Candidate, "first_name", "candidate_first_name_trgm_idx"),
+            (Candidate, "last_name", "candidate_last_name_trgm_idx"),
+            (Candidate, "city", "candidate_city_trgm_idx"),
+            (Candidate, "last_job", "candidate_last_job_trgm_idx"),
+            (ApplicantResume, "town", "resume_town_trgm_idx"),
+            (ApplicantResume, "job_title", "resume_job_title_trgm_idx"),
+            (Vacancy, "city", "vacancy_city_trgm_idx"),
+        )
+        for model, field, index_name in cases:
+            with self.subTest(model=model.__name__, field=field):
+                self.assert_uses_index(
+                    model.objects.filter(**{f"{field}__trgm_icontains": "моск"}),
+                    index_name,
+                )
+
+    def test_trigram_filter_ignores_case(self):
+        """Фильтр кандидатов по подстроке не учитывает регистр."""
+        user = User.objects.create_user("hr@example.com", "password")
+        vacancy = Vacancy.objects.create(
+            company=Company.objects.create(
+                company_title="Яндекс", website="https://yandex.ru"
+            ),
+            author=user,
+            vacancy_title="Разработчик",
+            city="Москва",
+            vacancy_status="A",
+        )
+        for number, last_name in enumerate(("Петров", "Сидоров")):
+            Candidate.objects.create(
+                first_name="Иван",
+                last_name=last_name,
+                bday=date(1990, 1, 1),
+                city="Москва",
+                email=f"candidate{number}@example.com",
+                vacancy=vacancy,
+            )
+        client = APIClient()
+        client.force_authenticate(user)
+        response = client.get(
+            reverse("candidates-list", args=[vacancy.id]), {"last_name": "пЕТР"}
+        )
+        self.assertEqual(
+            [candidate["last_name"] for candidate in response.json()["results"]],
+            ["Петров"],
+        )
+
+
+class CompositeIndexTest(IndexTestCase):
+    """Тестирование составных индексов для списков пользователя."""
+
+    def setUp(self):
+        """Запрет bitmap-сканирования: сортировка должна идти по индексу."""
+        super().setUp()
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_bitmapscan = off")
+
+    def test_lists_use_composite_indexes(self):
+        """Фильтр по владельцу и сортировка списка обслуживаются индексом."""
+        user = User.objects.create_user("hr@example.com", "password")
+        cases = (
+            (
+                Vacancy.objects.filter(author=user).order_by("pub_date", "id"),
+                "vacancy_author_pub_date_idx",
+            ),
+            (
+                Candidate.objects.filter(vacancy_id=1).order_by("pub_date", "id"),
+                "candidate_vacancy_pub_date_idx",
+            ),
+            (Note.objects.filter(candidate_id=1), "note_candidate_pub_date_idx"),
+            (FunnelStage.objects.filter(candidate_id=1), "funnel_candidate_date_idx"),
+            (SubStage.objects.filter(stage_id=1), "substage_stage_date_idx"),
+        )
+        for queryset, index_name in cases:
+            with self.subTest(index=index_name):
+                self.assert_uses_index(queryset, index_name)
+                self.assertNotIn("Sort", queryset.explain())
+
+    def test_report_missing_indexes(self):
+        """Команда не находит недостающих индексов для вьюсетов API."""
+        out = StringIO()
+        call_command("report_missing_indexes", "--fail", stdout=out)
+        self.assertIn("vacancy_author_pub_date_idx", out.getvalue())
+        self.assertIn("substage_stage_date_idx", out.getvalue())
+        self.assertNotIn("MISSING", out.getvalue())
+
+    def test_report_unknown_url_kwarg(self):
+        """Параметр URL без внешнего ключа не пропускается молча."""
+        out = StringIO()
+        with mock.patch.dict(
+            "api.management.commands.report_missing_indexes.URL_KWARG_FIELDS",
+            clear=True,
+        ), self.assertRaises(CommandError):
+            call_command("report_missing_indexes", "--fail", stdout=out)
+        self.assertIn("UNKNOWN  substage", out.getvalue())
+        self.assertIn("funnel_id", out.getvalue())
+
+
+class SalaryBandTest(IndexTestCase):
+    """Тестирование фильтров по диапазону зарплаты."""
+
+    def setUp(self):
+        """Вакансии с разной оплатой труда."""
+        super().setUp()
+        self.user = User.objects.create_user("hr@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        for title, salary in (
+            ("Стажер", [40000, 60000]),
+            ("Разработчик", [120000, 90000]),
+            ("Ведущий разработчик", [200000, 300000]),
+            ("Без оплаты", None),
+        ):
+            Vacancy.objects.create(
+                company=company,
+                author=self.user,
+                vacancy_title=title,
+                city="Москва",
+                vacancy_status="A",
+                salary=salary,
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get_titles(self, params):
+        """Названия вакансий, найденных по параметрам запроса."""
+        response = self.client.get(reverse("vacancies-list"), params)
+        return [vacancy["vacancy_title"] for vacancy in response.json()["results"]]
+
+    def test_salary_band_follows_salary(self):
+        """Диапазон заполняется из массива при сохранении и не ломает вывод."""
+        vacancy = Vacancy.objects.get(vacancy_title="Разработчик")
+        self.assertEqual(
+            (vacancy.salary_band.lower, vacancy.salary_band.upper), (90000, 120001)
+        )
+        self.assertIsNone(Vacancy.objects.get(vacancy_title="Без оплаты").salary_band)
+        response = self.client.get(reverse("vacancies-detail", args=[vacancy.id]))
+        self.assertEqual(response.json()["salary"], [120000, 90000])
+
+    def test_update_salary_bands(self):
+        """Пересчет диапазонов одним UPDATE совпадает с расчетом при сохранении."""
+        expected = dict(Vacancy.objects.values_list("id", "salary_band"))
+        Vacancy.objects.update(salary_band=None)
+        self.assertEqual(update_salary_bands(Vacancy.objects.all()), 4)
+        self.assertEqual(
+            dict(Vacancy.objects.values_list("id", "salary_band")), expected
+        )
+
+    def test_salary_filters(self):
+        """Фильтры пересечения и вхождения диапазона зарплаты."""
+        self.assertEqual(
+            self.get_titles({"salary_overlap": "100000,250000"}),
+            ["Разработчик", "Ведущий разработчик"],
+        )
+        self.assertEqual(
+            self.get_titles({"salary_within": "50000,150000"}), ["Разработчик"]
+        )
+        self.assertEqual(self.get_titles({"salary_overlap": "60000,60000"}), ["Стажер"])
+
+    def test_salary_filters_use_indexes(self):
+        """Фильтры по диапазону зарплаты обслуживаются GiST-индексами."""
+        band = NumericRange(100000, 150000, "[]")
+        cases = (
+            (ApplicantResume, "resume_salary_band_idx"),
+            (Candidate, "candidate_salary_band_idx"),
+            (Vacancy, "vacancy_salary_band_idx"),
+        )
+        for model, index_name in cases:
+            with self.subTest(model=model.__name__):
+                self.assert_uses_index(
+                    model.objects.filter(salary_band__overlap=band), index_name
+                )
+
+
+class ChoiceArrayTest(IndexTestCase):
+    """Тестирование хранения множественного выбора в массивах."""
+
+    def setUp(self):
+        """Вакансии с разными типами занятости."""
+        super().setUp()
+        self.user = User.objects.create_user("hr@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        for title, employment_type in (
+            ("Стажер", {"ST", "PO"}),
+            ("Разработчик", ["PO"]),
+            ("Консультант", ["CH", "PR"]),
+        ):
+            Vacancy.objects.create(
+                company=company,
+                author=self.user,
+                vacancy_title=title,
+                city="Москва",
+                vacancy_status="A",
+                employment_type=employment_type,
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_set_is_stored_in_choices_order(self):
+        """Множество из MultipleChoiceField сохраняется в порядке вариантов."""
+        vacancy = Vacancy.objects.get(vacancy_title="Стажер")
+        self.assertEqual(vacancy.employment_type, ["PO", "ST"])
+        response = self.client.get(reverse("vacancies-list"))
+        self.assertEqual(
+            response.json()["results"][0]["employment_type"], ["Полная", "Стажировка"]
+        )
+
+    def test_choice_array_filter(self):
+        """Фильтр возвращает вакансии с любым из выбранных вариантов."""
+        response = self.client.get(
+            reverse("vacancies-list"), {"employment_type": ["ST", "PR"]}
+        )
+        self.assertEqual(
+            [vacancy["vacancy_title"] for vacancy in response.json()["results"]],
+            ["Стажер", "Консультант"],
+        )
+
+    def test_choice_array_filters_use_indexes(self):
+        """Фильтры по вариантам выбора обслуживаются GIN-индексами."""
+        cases = (
+            (ApplicantResume, "employment_type", "resume_employment_type_idx"),
+            (ApplicantResume, "schedule_work", "resume_schedule_work_idx"),
+            (Candidate, "employment_type", "candidate_employment_type_idx"),
+            (Candidate, "schedule_work", "candidate_schedule_work_idx"),
+            (Vacancy, "employment_type", "vacancy_employment_type_idx"),
+            (Vacancy, "schedule_work", "vacancy_schedule_work_idx"),
+        )
+        for model, field, index_name in cases:
+            with self.subTest(model=model.__name__, field=field):
+                self.assert_uses_index(
+                    model.objects.filter(**{f"{field}__overlap": ["PO", "U"]}),
+                    index_name,
+                )
@@ -0,0 +1,141 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from api.telegram import TelegramBot
+from api.utils import get_bot
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from notifications.constants import EMAIL, FAILED, PENDING, SENT, TELEGRAM
+from notifications.models import OutboxMessage
+from notifications.services import deliver_pending, enqueue_email
+from notifications.transports import FakeTransport, TelegramTransport
+from rest_framework.test import APIClient
+from telebot import apihelper
+
+FAKE_TRANSPORTS = {
+    EMAIL: "notifications.transports.FakeTransport",
+    TELEGRAM: "notifications.transports.FakeTransport",
+}
+
+
+@override_settings(
+    NOTIFICATION_TRANSPORTS=FAKE_TRANSPORTS,
+    NOTIFICATION_MAX_ATTEMPTS=3,
+    NOTIFICATION_RETRY_DELAY=10,
+    TELEGRAM_CHAT_ID="-100",
+)
+class OutboxTest(TestCase):
+    """Тестирование очереди исходящих уведомлений."""
+
+    def setUp(self):
+        """Очистка локального транспорта."""
+        FakeTransport.reset()
+
+    def test_signup_enqueues_notifications(self):
+        """Регистрация ставит уведомления в очередь и ничего не отправляет."""
+        response = APIClient().post(
+            reverse("signup"),
+            {"email": "hr@example.com", "password": "Secret-password-1"},
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(FakeTransport.sent, [])
+        self.assertEqual(
+            sorted(OutboxMessage.objects.values_list("channel", "recipient")),
+            [(EMAIL, "hr@example.com"), (TELEGRAM, "-100")],
+        )
+
+        out = StringIO()
+        call_command("send_outbox", "--once", stdout=out)
+        self.assertIn("отправлено: 2", out.getvalue())
+        self.assertEqual(len(FakeTransport.sent), 2)
+        self.assertFalse(OutboxMessage.objects.exclude(status=SENT).exists())
+
+    def test_retry_with_backoff(self):
+        """Ошибка отправки откладывает попытку с растущей задержкой."""
+        message = enqueue_email("hr@example.com", "Тема", "Текст")
+        FakeTransport.error = ConnectionError("timeout")
+        for attempts, delay in ((1, 10), (2, 20)):
+            started = timezone.now()
+            self.assertEqual(deliver_pending(), (1, 0))
+            message.refresh_from_db()
+            self.assertEqual(message.status, PENDING)
+            self.assertEqual(message.attempts, attempts)
+            self.assertEqual(message.last_error, "ConnectionError: timeout")
+            self.assertGreaterEqual(
+                message.next_attempt_at, started + timedelta(seconds=delay)
+            )
+            self.assertEqual(deliver_pending(), (0, 0))
+            OutboxMessage.objects.update(next_attempt_at=timezone.now())
+
+        FakeTransport.error = None
+        self.assertEqual(deliver_pending(), (1, 1))
+        message.refresh_from_db()
+        self.assertEqual(message.status, SENT)
+        self.assertEqual(FakeTransport.sent, [message])
+
+    def test_failed_after_max_attempts(self):
+        """После последней попытки уведомление помечается недоставленным."""
+        enqueue_email("hr@example.com", "Тема", "Текст")
+        FakeTransport.error = ConnectionError("timeout")
+        for _ in range(3):
+            deliver_pending()
+            OutboxMessage.objects.filter(status=PENDING).update(
+                next_attempt_at=timezone.now()
+            )
+        self.assertEqual(OutboxMessage.objects.get().status, FAILED)
+        self.assertEqual(deliver_pending(), (0, 0))
+
+
+class TelegramBotTest(TestCase):
+    """Тестирование ленивого создания бота Telegram."""
+
+    def setUp(self):
+        """Сброс созданного бота до и после теста."""
+        get_bot.cache_clear()
+        self.addCleanup(get_bot.cache_clear)
+
+    @override_settings(TELEGRAM_BOT="api.telegram.LoggingBot")
+    def test_bot_created_once(self):
+        """Бот создается при первом обращении и переиспользуется."""
+        self.assertEqual(get_bot.cache_info().currsize, 0)
+        self.assertIs(get_bot(), get_bot())
+
+    @override_settings(TELEGRAM_BOT="api.telegram.LoggingBot")
+    def test_logging_bot(self):
+        """Транспорт Telegram записывает сообщение в лог вместо отправки."""
+        message = OutboxMessage(channel=TELEGRAM, recipient="-100", body="Текст")
+        with self.assertLogs("api.telegram") as logs:
+            TelegramTransport().send(message)
+        self.assertEqual(logs.output, ["INFO:api.telegram:Telegram -100: Текст"])
+
+    @override_settings(TELEGRAM_BOT="api.telegram.TelegramBot", TELEGRAM_TOKEN="1:x")
+    def test_own_session(self):
+        """Настоящий бот не запускает потоки и не меняет настройки apihelper."""
+        session, ttl = apihelper.session, apihelper.SESSION_TIME_TO_LIVE
+        bot = get_bot()
+        self.assertIsInstance(bot, TelegramBot)
+        self.assertFalse(bot.threaded)
+        self.assertIs(apihelper.session, session)
+        self.assertEqual(apihelper.SESSION_TIME_TO_LIVE, ttl)
+        adapter = bot.session.get_adapter("https://api.telegram.org")
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+    @override_settings(TELEGRAM_BOT="api.telegram.TelegramBot", TELEGRAM_TOKEN="1:x")
+    def test_send_message(self):
+        """Сообщение отправляется через сессию бота."""
+        bot = get_bot()
+        result = {"message_id": 1, "date": 0, "chat": {"id": -100, "type": "group"}}
+        with mock.patch.object(bot.session, "post") as post:
+            post.return_value.json.return_value = {"ok": True, "result": result}
+            message = bot.send_message(-100, "Текст", message_thread_id=None)
+        self.assertEqual(message.message_id, 1)
+        post.assert_called_once()
+        self.assertEqual(
+            post.call_args.args, ("https://api.telegram.org/bot1:x/sendMessage",)
+        )
+        self.assertEqual(
+            post.call_args.kwargs["data"], {"chat_id": "-100", "text": "Текст"}
+        )
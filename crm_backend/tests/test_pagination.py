@@ -0,0 +1,125 @@
+from datetime import date
+from unittest.mock import patch
+
+from api.pagination import ListCursorPagination
+from django.test import TestCase
+from django.urls import reverse
+from recruitment.models import Candidate, Company, Vacancy
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class VacancyPaginationTest(TestCase):
+    """Тестирование курсорной пагинации списка вакансий."""
+
+    def setUp(self):
+        """Настройка данных для тестирования."""
+        self.user = User.objects.create_user("hr@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        for number in range(5):
+            Vacancy.objects.create(
+                company=company,
+                author=self.user,
+                vacancy_title=f"Разработчик {number}",
+                city="Москва",
+                vacancy_status="A",
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("vacancies-list")
+
+    def test_pages_follow_cursor(self):
+        """Страницы по курсору возвращают все вакансии без повторов."""
+        response = self.client.get(self.url, {"page_size": 2})
+        titles = [vacancy["vacancy_title"] for vacancy in response.json()["results"]]
+        self.assertEqual(len(titles), 2)
+        while response.json()["next"]:
+            response = self.client.get(response.json()["next"])
+            titles += [
+                vacancy["vacancy_title"] for vacancy in response.json()["results"]
+            ]
+        self.assertEqual(titles, [f"Разработчик {number}" for number in range(5)])
+
+    def test_page_size_limit(self):
+        """Размер страницы ограничен значением max_page_size."""
+        with patch.object(ListCursorPagination, "max_page_size", 3):
+            response = self.client.get(self.url, {"page_size": 100})
+        self.assertEqual(len(response.json()["results"]), 3)
+
+    def test_pagination_opt_out(self):
+        """Параметр paginate=false отключает пагинацию."""
+        response = self.client.get(self.url, {"paginate": "false"})
+        self.assertEqual(len(response.json()), 5)
+
+
+class CandidatePaginationTest(TestCase):
+    """Тестирование пагинации кандидатов по полям с NULL и массивам."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Кандидаты с пустыми и повторяющимися значениями полей сортировки."""
+        cls.user = User.objects.create_user("hr@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        cls.vacancy = Vacancy.objects.create(
+            company=company, author=cls.user, vacancy_title="Backend", city="Москва"
+        )
+        jobs = ("Яндекс", None, "Ozon", None, "Яндекс", "Avito", None)
+        cls.ids = {
+            Candidate.objects.create(
+                first_name="Иван",
+                last_name=f"Петров {number}",
+                bday=date(1990, 1, 1),
+                city="Москва",
+                email=f"candidate{number}@example.com",
+                vacancy=cls.vacancy,
+                last_job=job,
+                salary_expectations=[100 * (number % 3), 200] if job else None,
+                employment_type=["FT"] if number % 2 else ["FT", "PT"],
+            ).id
+            for number, job in enumerate(jobs)
+        }
+
+    def setUp(self):
+        """Авторизация клиента."""
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("candidates-list", args=[self.vacancy.id])
+
+    def walk(self, ordering):
+        """Идентификаторы кандидатов со всех страниц по ссылкам next."""
+        response = self.client.get(self.url, {"ordering": ordering, "page_size": 2})
+        ids = []
+        while True:
+            self.assertEqual(response.status_code, 200)
+            ids += [candidate["id"] for candidate in response.json()["results"]]
+            if not response.json()["next"]:
+                return ids
+            response = self.client.get(response.json()["next"])
+
+    def test_all_orderings(self):
+        """Все кандидаты выводятся ровно один раз при любой сортировке."""
+        for ordering in (
+            "pub_date",
+            "-pub_date",
+            "last_job",
+            "-last_job",
+            "cur_position",
+            "salary_expectations",
+            "-employment_type",
+            "vacancy",
+        ):
+            with self.subTest(ordering=ordering):
+                ids = self.walk(ordering)
+                self.assertEqual(len(ids), len(self.ids))
+                self.assertEqual(set(ids), self.ids)
+
+    def test_previous_page(self):
+        """Ссылка previous ведет на предыдущую страницу при сортировке по NULL."""
+        first = self.client.get(self.url, {"ordering": "last_job", "page_size": 2})
+        second = self.client.get(first.json()["next"])
+        previous = self.client.get(second.json()["previous"])
+        self.assertEqual(previous.json()["results"], first.json()["results"])
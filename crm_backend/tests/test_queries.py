@@ -0,0 +1,174 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from recruitment.models import (
+    ApplicantResume,
+    Candidate,
+    Comment,
+    Company,
+    FunnelStage,
+    Note,
+    SubStage,
+    Vacancy,
+    WorkExperience,
+)
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class ListQueriesTestCase(TestCase):
+    """
+    Базовый класс для проверки количества запросов к БД у списков.
+
+    Тест падает, если количество запросов растет вместе с количеством строк.
+    """
+
+    def setUp(self):
+        """Настройка данных для тестирования."""
+        self.user = User.objects.create_user("hr@example.com", "password")
+        self.company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        self.vacancy = self.create_vacancy()
+        self.candidate = self.create_candidate(self.vacancy)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_vacancy(self, number=0):
+        """Создание вакансии."""
+        return Vacancy.objects.create(
+            company=self.company,
+            author=self.user,
+            vacancy_title=f"Разработчик {number}",
+            city="Москва",
+            vacancy_status="A",
+        )
+
+    def create_candidate(self, vacancy):
+        """Создание кандидата."""
+        number = Candidate.objects.count()
+        return Candidate.objects.create(
+            first_name="Иван",
+            last_name="Иванов",
+            bday=date(1990, 1, 1),
+            city="Москва",
+            email=f"candidate{number}@example.com",
+            vacancy=vacancy,
+        )
+
+    def get_list(self, url):
+        """Получение списка и количества выполненных запросов к БД."""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response
+
+    def assert_list_queries_constant(self, url, create_row, rows=10):
+        """Проверка, что количество запросов не зависит от количества строк."""
+        create_row(0)
+        queries_for_one, _ = self.get_list(url)
+        for number in range(1, rows):
+            create_row(number)
+        queries_for_many, response = self.get_list(url)
+        self.assertEqual(
+            queries_for_one,
+            queries_for_many,
+            f"{url}: количество запросов растет с количеством строк.",
+        )
+        return response
+
+
+class VacancyListQueriesTest(ListQueriesTestCase):
+    """Тестирование количества запросов при получении списка вакансий."""
+
+    def create_row(self, number):
+        """Создание вакансии с кандидатами."""
+        vacancy = self.create_vacancy(number)
+        for _ in range(number % 3):
+            self.create_candidate(vacancy)
+
+    def test_candidates_count(self):
+        """Проверка подсчета количества кандидатов на вакансию."""
+        Vacancy.objects.all().delete()
+        for number in range(3):
+            self.create_row(number)
+        _, response = self.get_list(reverse("vacancies-list"))
+        self.assertEqual(
+            [vacancy["candidates_count"] for vacancy in response.json()["results"]],
+            [0, 1, 2],
+        )
+
+    def test_vacancy_list_queries(self):
+        """Количество запросов не зависит от количества вакансий."""
+        self.assert_list_queries_constant(reverse("vacancies-list"), self.create_row)
+
+
+class CandidateListQueriesTest(ListQueriesTestCase):
+    """Тестирование количества запросов при получении списка кандидатов."""
+
+    def test_candidate_list_queries(self):
+        """Количество запросов не зависит от количества кандидатов."""
+        self.assert_list_queries_constant(
+            reverse("candidates-list", args=[self.vacancy.id]),
+            lambda number: self.create_candidate(self.vacancy),
+        )
+
+
+class ResumeListQueriesTest(ListQueriesTestCase):
+    """Тестирование количества запросов при получении списка резюме."""
+
+    def create_row(self, number):
+        """Создание резюме с опытом работы."""
+        resume = ApplicantResume.objects.create(
+            applicant=self.user,
+            job_title=f"Разработчик {number}",
+            phone_number="89501002030",
+            bday=date(1990, 1, 1),
+        )
+        resume.work_experiences.add(
+            WorkExperience.objects.create(
+                start_date=date(2020, 1, 1), position="Разработчик"
+            )
+        )
+
+    def test_resume_list_queries(self):
+        """Количество запросов не зависит от количества резюме."""
+        self.assert_list_queries_constant(reverse("resumes-list"), self.create_row)
+
+
+class NoteListQueriesTest(ListQueriesTestCase):
+    """Тестирование количества запросов при получении списка заметок."""
+
+    def create_row(self, number):
+        """Создание заметки с комментариями."""
+        note = Note.objects.create(
+            candidate=self.candidate, text=f"Заметка {number}", author=self.user
+        )
+        Comment.objects.create(note=note, text="Комментарий", author=self.user)
+
+    def test_note_list_queries(self):
+        """Количество запросов не зависит от количества заметок."""
+        self.assert_list_queries_constant(
+            reverse("notes-list", args=[self.candidate.id]), self.create_row
+        )
+
+
+class FunnelListQueriesTest(ListQueriesTestCase):
+    """Тестирование количества запросов при получении воронки кандидата."""
+
+    def create_row(self, number):
+        """Создание этапа воронки с подэтапами."""
+        stage = FunnelStage.objects.create(
+            candidate=self.candidate, name=f"Этап {number}", date=date(2023, 1, 1)
+        )
+        SubStage.objects.create(stage=stage, name="Подэтап", date=date(2023, 1, 2))
+
+    def test_funnel_list_queries(self):
+        """Количество запросов не зависит от количества этапов воронки."""
+        response = self.assert_list_queries_constant(
+            reverse("funnel-list", args=[self.candidate.id]), self.create_row
+        )
+        self.assertEqual(response.json()[0]["substages"][0]["name"], "Подэтап")
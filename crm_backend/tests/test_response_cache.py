@@ -0,0 +1,119 @@
+from io import StringIO
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from recruitment.models import Company, Vacancy
+from rest_framework.test import APIClient
+from users.models import User
+
+CACHES = {
+    alias: {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": f"test-{alias}",
+    }
+    for alias in ("default", "responses")
+}
+
+
+@override_settings(CACHES=CACHES)
+class ResponseCacheTest(TestCase):
+    """Тестирование кэша ответов списков."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Вакансия HR."""
+        cls.user = User.objects.create_user("hr@example.com", "password")
+        cls.company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        cls.vacancy = Vacancy.objects.create(
+            company=cls.company,
+            author=cls.user,
+            vacancy_title="Backend",
+            city="Москва",
+        )
+
+    def setUp(self):
+        """Авторизация клиента и пустой кэш."""
+        for alias in CACHES:
+            caches[alias].clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("vacancies-list")
+
+    def get(self, params=None):
+        """Ответ на запрос списка вакансий."""
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_hit(self):
+        """Повторный запрос отдается из кэша без запросов к БД."""
+        self.assertEqual(self.get()["X-Cache"], "MISS")
+        with self.assertNumQueries(0):
+            response = self.get()
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(response.data["results"][0]["company"], "Яндекс")
+
+    def test_params(self):
+        """Порядок и пустые параметры не влияют на ключ, пользователь -- влияет."""
+        self.get({"city": "Москва", "ordering": "deadline", "search": ""})
+        response = self.client.get(f"{self.url}?ordering=deadline&city=Москва")
+        self.assertEqual(response["X-Cache"], "HIT")
+        other = User.objects.create_user("other@example.com", "password")
+        self.client.force_authenticate(other)
+        response = self.client.get(f"{self.url}?ordering=deadline&city=Москва")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"], [])
+
+    def test_host(self):
+        """Ответы с абсолютными ссылками не переходят между хостами."""
+        self.get()
+        response = self.client.get(self.url, HTTP_HOST="localhost")
+        self.assertEqual(response["X-Cache"], "MISS")
+
+    @override_settings(
+        CACHES={
+            **CACHES,
+            "responses": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+        }
+    )
+    def test_disabled(self):
+        """Без настроенного кэша ответов списки не кэшируются."""
+        response = self.get()
+        self.assertNotIn("X-Cache", response)
+        self.assertEqual(response.data["results"][0]["company"], "Яндекс")
+
+    def test_invalidation(self):
+        """Изменение связанной модели сбрасывает кэшированные списки."""
+        self.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.company.company_title = "Яндекс Практикум"
+            self.company.save()
+        response = self.get()
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"][0]["company"], "Яндекс Практикум")
+        companies = self.client.get(reverse("companies-list"))
+        self.assertEqual(companies["X-Cache"], "MISS")
+
+    def test_not_modified(self):
+        """Условный запрос к списку из кэша отдает 304 без запросов к БД."""
+        url = reverse("candidates-list", kwargs={"vacancy_id": self.vacancy.id})
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_stats(self):
+        """Команда выводит и обнуляет счетчики попаданий."""
+        self.get()
+        self.get()
+        self.get()
+        out = StringIO()
+        call_command("response_cache_stats", "--reset", stdout=out)
+        self.assertIn("vacancies: hits=2 misses=1 hit_ratio=66.7%", out.getvalue())
+        out = StringIO()
+        call_command("response_cache_stats", stdout=out)
+        self.assertIn("vacancies: hits=0 misses=0", out.getvalue())
@@ -0,0 +1,137 @@
+import shutil
+import tempfile
+from datetime import date
+
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from recruitment.models import Candidate, Company, ResumeText, Vacancy
+from recruitment.resume_text import ResumeTextExtraction, normalize_text
+from rest_framework.test import APIClient
+from users.models import User
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def pdf(text):
+    """Одностраничный PDF с текстом text (только латиница)."""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+    ]
+    content = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(content))
+        content += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(content)
+    content += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    content += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    content += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return ContentFile(content, name="resume.pdf")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ResumeTextTest(TestCase):
+    """Тестирование извлечения текста резюме и поиска по нему."""
+
+    @classmethod
+    def tearDownClass(cls):
+        """Удаление загруженных файлов."""
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    @classmethod
+    def setUpTestData(cls):
+        """Кандидаты с резюме."""
+        cls.user = User.objects.create_user("hr@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        cls.vacancy = Vacancy.objects.create(
+            company=company,
+            author=cls.user,
+            vacancy_title="Разработчик",
+            city="Москва",
+        )
+        cls.python, cls.java, cls.copy = (
+            Candidate.objects.create(
+                first_name="Иван",
+                last_name="Петров",
+                bday=date(1990, 1, 1),
+                city="Москва",
+                email=f"candidate{number}@example.com",
+                vacancy=cls.vacancy,
+                resume=pdf(text),
+            )
+            for number, text in enumerate(
+                (
+                    "Senior developer: Python, Django, PostgreSQL",
+                    "Java developer, Spring",
+                    "Senior developer: Python, Django, PostgreSQL",
+                )
+            )
+        )
+
+    def setUp(self):
+        """Авторизация клиента."""
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("candidates-list", kwargs={"vacancy_id": self.vacancy.id})
+
+    def search(self, query):
+        """Идентификаторы кандидатов, найденных по тексту резюме."""
+        response = self.client.get(self.url, {"resume_q": query})
+        self.assertEqual(response.status_code, 200)
+        return {candidate["id"] for candidate in response.data["results"]}
+
+    def test_search(self):
+        """Кандидаты находятся по навыкам из текста резюме."""
+        extraction = ResumeTextExtraction(workers=0).run()
+        self.assertEqual((extraction.checked, extraction.extracted), (3, 2))
+        self.assertEqual(
+            ResumeText.objects.get(candidate=self.java).text, "Java developer, Spring"
+        )
+        self.assertEqual(self.search("django"), {self.python.id, self.copy.id})
+        self.assertEqual(self.search("spring -python"), {self.java.id})
+        self.assertEqual(self.search("golang"), set())
+
+    def test_incremental(self):
+        """Повторно разбираются только изменившиеся файлы."""
+        ResumeTextExtraction(workers=0).run()
+        extraction = ResumeTextExtraction(workers=0).run()
+        self.assertEqual((extraction.checked, extraction.extracted), (0, 0))
+        extraction = ResumeTextExtraction(workers=0).run(rehash=True)
+        self.assertEqual((extraction.checked, extraction.extracted), (3, 0))
+
+        self.java.resume = pdf("Golang developer")
+        self.java.save()
+        self.python.resume = None
+        self.python.save()
+        self.assertEqual(self.search("python"), {self.copy.id})
+        extraction = ResumeTextExtraction(workers=0).run()
+        self.assertEqual(
+            (extraction.checked, extraction.extracted, extraction.removed), (1, 1, 1)
+        )
+        self.assertEqual(self.search("golang"), {self.java.id})
+
+    def test_process_pool(self):
+        """Текст извлекается в пуле процессов."""
+        extraction = ResumeTextExtraction(workers=2, chunk_size=1).run()
+        self.assertEqual(extraction.extracted, 2)
+        self.assertEqual(self.search("postgresql"), {self.python.id, self.copy.id})
+
+    def test_normalize_text(self):
+        """Переносы склеиваются, пробелы и нулевые символы убираются."""
+        self.assertEqual(
+            normalize_text("Раз-\n работчик\x00  Py\xadthon\n\nDjango "),
+            "Разработчик Python Django",
+        )
@@ -0,0 +1,96 @@
+from datetime import date
+
+from django.test import TestCase
+from django.urls import reverse
+from recruitment.models import Candidate, Company, Vacancy
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class FullTextSearchTest(TestCase):
+    """Тестирование полнотекстового поиска."""
+
+    def setUp(self):
+        """Настройка данных для тестирования."""
+        self.user = User.objects.create_user("hr@example.com", "password")
+        self.company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        self.vacancy = Vacancy.objects.create(
+            company=self.company,
+            author=self.user,
+            vacancy_title="Python разработчик",
+            city="Москва",
+            vacancy_status="A",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_candidate(self, last_name, **fields):
+        """Создание кандидата."""
+        return Candidate.objects.create(
+            first_name="Иван",
+            last_name=last_name,
+            bday=date(1990, 1, 1),
+            city=fields.pop("city", "Москва"),
+            email=f"{last_name.lower()}@example.com",
+            vacancy=self.vacancy,
+            **fields,
+        )
+
+    def search_candidates(self, search):
+        """Поиск кандидатов вакансии."""
+        response = self.client.get(
+            reverse("candidates-list", args=[self.vacancy.id]), {"search": search}
+        )
+        self.assertEqual(response.status_code, 200)
+        return [candidate["last_name"] for candidate in response.json()["results"]]
+
+    def test_search_vector_updated_on_save(self):
+        """Поисковый вектор обновляется при сохранении кандидата."""
+        candidate = self.create_candidate("Petrov")
+        self.assertEqual(self.search_candidates("Petrov"), ["Petrov"])
+        candidate.last_name = "Sidorov"
+        candidate.save()
+        self.assertEqual(self.search_candidates("Petrov"), [])
+        self.assertEqual(self.search_candidates("Sidorov"), ["Sidorov"])
+
+    def test_search_uses_russian_stemming(self):
+        """Поиск учитывает морфологию русского языка."""
+        self.create_candidate("Petrov", cur_position="Разработчик")
+        self.create_candidate("Sidorov", cur_position="Дизайнер")
+        self.assertEqual(self.search_candidates("разработчики"), ["Petrov"])
+
+    def test_search_results_ranked(self):
+        """Результаты поиска отсортированы по релевантности."""
+        self.create_candidate("Petrov", city="Самара")
+        self.create_candidate("Sidorov", last_job="Самара")
+        self.assertEqual(self.search_candidates("Самара"), ["Sidorov", "Petrov"])
+
+    def test_vacancy_search_by_company(self):
+        """Поиск вакансий учитывает название компании."""
+        url = reverse("vacancies-list")
+        response = self.client.get(url, {"search": "Яндекс"})
+        self.assertEqual(len(response.json()["results"]), 1)
+        self.company.company_title = "Тинькофф"
+        self.company.save()
+        response = self.client.get(url, {"search": "Яндекс"})
+        self.assertEqual(response.json()["results"], [])
+
+    def test_search_pages(self):
+        """Постраничный обход результатов поиска отдает каждую строку один раз."""
+        for number in range(30):
+            self.create_candidate(
+                f"Petrov{number}",
+                cur_position=" ".join(["разработчик"] * (number % 4 + 1)),
+                last_job=" ".join(["Python", "разработчик"] * (number % 3)) or None,
+            )
+        url = reverse("candidates-list", args=[self.vacancy.id])
+        params = {"search": "разработчик", "page_size": 1}
+        ids = []
+        while url and len(ids) <= 30:
+            data = self.client.get(url, params).json()
+            ids += [candidate["id"] for candidate in data["results"]]
+            url, params = data["next"], None
+        self.assertEqual(len(ids), 30)
+        self.assertEqual(len(set(ids)), 30)
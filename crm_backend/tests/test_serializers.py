@@ -0,0 +1,185 @@
+from datetime import date
+from unittest.mock import patch
+
+from api.serializers import CandidatesSerializer, VacanciesSerializer
+from api.utils import EMPLOYMENT_TYPE_LABELS, render_choice_labels
+from api.views import CandidateViewSet, CompanyViewSet, ResumeViewSet, VacancyViewSet
+from django.test import TestCase
+from django.urls import reverse
+from recruitment.models import (
+    ApplicantResume,
+    Candidate,
+    Company,
+    Skills,
+    SkillStack,
+    Vacancy,
+    WorkExperience,
+)
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class ChoiceLabelsTest(TestCase):
+    """Тестирование вывода названий вариантов выбора в списках."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Вакансия с заполненными и пустыми вариантами выбора."""
+        user = User.objects.create_user("hr@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        cls.vacancy = Vacancy.objects.create(
+            company=company,
+            author=user,
+            vacancy_title="Разработчик",
+            city="Москва",
+            vacancy_status="A",
+            required_experience="2",
+            employment_type=["PO", "ST"],
+        )
+        cls.candidate = Candidate.objects.create(
+            first_name="Иван",
+            last_name="Иванов",
+            bday=date(1990, 1, 1),
+            city="Москва",
+            email="candidate@example.com",
+            vacancy=cls.vacancy,
+            interview_status="IHR",
+            candidate_status="F",
+        )
+
+    def test_list_and_single_object_labels(self):
+        """Список и отдельный объект выводят одинаковые названия."""
+        expected = {
+            "vacancy_status": "activeVacancies",
+            "required_experience": "1-3 года",
+            "employment_type": ["Полная", "Стажировка"],
+            "schedule_work": [None],
+        }
+        for data in (
+            VacanciesSerializer([self.vacancy], many=True).data[0],
+            VacanciesSerializer(self.vacancy).data,
+        ):
+            self.assertEqual({field: data[field] for field in expected}, expected)
+
+    def test_candidate_labels(self):
+        """Статусы кандидата выводятся названиями."""
+        data = CandidatesSerializer([self.candidate], many=True).data[0]
+        self.assertEqual(data["interview_status"], "Интервью с HR")
+        self.assertEqual(data["candidate_status"], "favoritesCandidates")
+        self.assertIsNone(data["work_experiences"])
+
+    def test_render_choice_labels(self):
+        """Замена кодов по колонкам для списка словарей."""
+        rows = [{"employment_type": ["CH"]}, {"employment_type": None}]
+        self.assertEqual(
+            render_choice_labels(
+                rows, multiple_choice_labels={"employment_type": EMPLOYMENT_TYPE_LABELS}
+            ),
+            [{"employment_type": ["Частичная"]}, {"employment_type": [None]}],
+        )
+
+
+class FastListSerializerTest(TestCase):
+    """Тестирование совпадения ответов быстрых и обычных сериализаторов."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Вакансии, кандидаты, резюме и компании с заполненными полями."""
+        cls.user = User.objects.create_user("hr@example.com", "password")
+        skills = [Skills.objects.create(name=name) for name in ("Python", "Django")]
+        for number in range(3):
+            company = Company.objects.create(
+                company_title=f"Компания {number}", website="https://yandex.ru"
+            )
+            vacancy = Vacancy.objects.create(
+                company=company,
+                author=cls.user,
+                vacancy_title=f"Разработчик {number}",
+                city="Москва",
+                vacancy_status="AFD"[number],
+                required_experience=str(number + 1),
+                employment_type=["PO", "ST"][: number + 1],
+                schedule_work=["U"] if number else None,
+                salary=[100000, 150000] if number else None,
+            )
+            for skill in skills[:number]:
+                vacancy.skill_stack.add(
+                    SkillStack.objects.create(
+                        skill_stack=skill, skill_stack_time=number, vacancy=vacancy
+                    )
+                )
+            for _ in range(number):
+                Candidate.objects.create(
+                    first_name="Иван",
+                    last_name="Петров",
+                    bday=date(1990, 1, 1),
+                    city="Москва",
+                    email=f"candidate{Candidate.objects.count()}@example.com",
+                    vacancy=vacancy,
+                    interview_status="PS",
+                    work_experiences=str(number),
+                )
+            resume = ApplicantResume.objects.create(
+                applicant=cls.user,
+                job_title=f"Разработчик {number}",
+                phone_number="89501002030",
+                bday=date(1990, 1, 1),
+            )
+            for _ in range(number):
+                resume.work_experiences.add(
+                    WorkExperience.objects.create(
+                        start_date=date(2020, 1, 1), position="Разработчик"
+                    )
+                )
+        cls.vacancy = vacancy
+
+    def setUp(self):
+        """Авторизация клиента."""
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assert_same_content(self, viewset, url, params=None):
+        """Ответ быстрого сериализатора побайтно совпадает с обычным."""
+        fast = self.client.get(url, params)
+        with patch.object(viewset, "fast_list_serializer_class", None):
+            expected = self.client.get(url, params)
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(fast.content, expected.content)
+
+    def test_same_content(self):
+        """Списки совпадают с пагинацией, поиском и сортировкой."""
+        cases = (
+            (VacancyViewSet, reverse("vacancies-list"), None),
+            (VacancyViewSet, reverse("vacancies-list"), {"page_size": 2}),
+            (VacancyViewSet, reverse("vacancies-list"), {"search": "разработчик"}),
+            (VacancyViewSet, reverse("vacancies-list"), {"ordering": "-deadline"}),
+            (VacancyViewSet, reverse("vacancies-list"), {"paginate": "false"}),
+            (
+                CandidateViewSet,
+                reverse("candidates-list", args=[self.vacancy.id]),
+                None,
+            ),
+            (
+                VacancyViewSet,
+                reverse("vacancies-list"),
+                {"fields": "id,skill_stack,vacancy_status", "page_size": 2},
+            ),
+            (
+                CandidateViewSet,
+                reverse("candidates-list", args=[self.vacancy.id]),
+                {"omit": "photo_thumbnail,candidate_status"},
+            ),
+            (ResumeViewSet, reverse("resumes-list"), None),
+            (CompanyViewSet, reverse("companies-list"), {"page_size": 2}),
+        )
+        for viewset, url, params in cases:
+            with self.subTest(url=url, params=params):
+                self.assert_same_content(viewset, url, params)
+
+    def test_next_page(self):
+        """Курсор следующей страницы совпадает с обычным сериализатором."""
+        url = reverse("vacancies-list")
+        next_url = self.client.get(url, {"page_size": 2}).json()["next"]
+        self.assert_same_content(VacancyViewSet, next_url)
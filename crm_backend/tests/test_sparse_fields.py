@@ -0,0 +1,105 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from recruitment.models import Candidate, Company, Skills, SkillStack, Vacancy
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class SparseFieldsTest(TestCase):
+    """Тестирование выбора полей ответа параметрами fields и omit."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Вакансия со стеком навыков и кандидат."""
+        cls.user = User.objects.create_user("hr@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        cls.vacancy = Vacancy.objects.create(
+            company=company,
+            author=cls.user,
+            vacancy_title="Backend",
+            city="Москва",
+        )
+        cls.vacancy.skill_stack.add(
+            SkillStack.objects.create(
+                skill_stack=Skills.objects.create(name="Python"),
+                skill_stack_time=3,
+                vacancy=cls.vacancy,
+            )
+        )
+        cls.candidate = Candidate.objects.create(
+            first_name="Иван",
+            last_name="Петров",
+            bday=date(1990, 1, 1),
+            city="Москва",
+            email="candidate@example.com",
+            vacancy=cls.vacancy,
+            salary_expectations=[100, 150],
+        )
+
+    def setUp(self):
+        """Авторизация клиента."""
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.candidate_url = reverse(
+            "candidates-detail",
+            kwargs={"vacancy_id": self.vacancy.id, "pk": self.candidate.id},
+        )
+        self.vacancy_url = reverse("vacancies-detail", kwargs={"pk": self.vacancy.id})
+
+    def get(self, url, params=None):
+        """Ответ на запрос и выполненные им запросы к БД."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json(), [query["sql"] for query in queries]
+
+    def test_fields(self):
+        """Карточка кандидата содержит только выбранные поля и их колонки."""
+        data, queries = self.get(
+            self.candidate_url, {"fields": "id, first_name,age,salary_expectations"}
+        )
+        self.assertEqual(
+            data,
+            {
+                "id": self.candidate.id,
+                "first_name": "Иван",
+                "age": data["age"],
+                "salary_expectations": {"min": 100, "max": 150},
+            },
+        )
+        candidate_query = next(sql for sql in queries if '"bday"' in sql)
+        self.assertNotIn('"resume"', candidate_query)
+        self.assertNotIn('"telegram"', candidate_query)
+
+    def test_omit(self):
+        """Вложенные объекты, не попавшие в ответ, не загружаются."""
+        data, full = self.get(self.vacancy_url)
+        self.assertIn("skill_stack", data)
+        data, queries = self.get(self.vacancy_url, {"omit": "company,skill_stack"})
+        self.assertNotIn("company", data)
+        self.assertNotIn("skill_stack", data)
+        self.assertEqual(data["vacancy_title"], "Backend")
+        # Без стека навыков не выполняются два запроса prefetch_related.
+        self.assertEqual((len(full), len(queries)), (3, 1))
+        self.assertNotIn("recruitment_company", queries[0])
+
+    def test_list(self):
+        """Список отдает выбранные поля без загрузки стека навыков."""
+        url = reverse("vacancies-list")
+        data, full = self.get(url)
+        data, queries = self.get(url, {"fields": "id,vacancy_title"})
+        self.assertEqual(
+            data["results"], [{"id": self.vacancy.id, "vacancy_title": "Backend"}]
+        )
+        self.assertEqual(len(queries), len(full) - 1)
+
+    def test_unknown_field(self):
+        """Неизвестное поле -- ошибка валидации."""
+        response = self.client.get(self.candidate_url, {"fields": "id,password"})
+        self.assertEqual(response.status_code, 400)
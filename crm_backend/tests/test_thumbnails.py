@@ -0,0 +1,181 @@
+import io
+import shutil
+import tempfile
+from datetime import date
+from unittest.mock import patch
+
+from api.views import CandidateViewSet
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+from recruitment.models import Candidate, Company, Vacancy
+from recruitment.thumbnails import generate_thumbnail, needs_thumbnail
+from rest_framework.test import APIClient
+from users.models import User
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def image(size, mode="RGB", image_format="PNG"):
+    """Изображение заданного размера в виде ContentFile."""
+    file = io.BytesIO()
+    Image.new(mode, size).save(file, image_format)
+    return ContentFile(file.getvalue(), name=f"image.{image_format.lower()}")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, THUMBNAIL_WORKERS=0)
+class ThumbnailTest(TestCase):
+    """Тестирование миниатюр фотографий и логотипов."""
+
+    @classmethod
+    def tearDownClass(cls):
+        """Удаление загруженных файлов."""
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    @classmethod
+    def setUpTestData(cls):
+        """Вакансия HR."""
+        cls.user = User.objects.create_user("hr@example.com", "password")
+        cls.company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        cls.vacancy = Vacancy.objects.create(
+            company=cls.company,
+            author=cls.user,
+            vacancy_title="Разработчик",
+            city="Москва",
+        )
+
+    def create_candidate(self, photo, email="candidate@example.com"):
+        """Кандидат с фотографией; миниатюра создается после фиксации."""
+        with self.captureOnCommitCallbacks(execute=True):
+            return Candidate.objects.create(
+                first_name="Иван",
+                last_name="Петров",
+                bday=date(1990, 1, 1),
+                city="Москва",
+                email=email,
+                vacancy=self.vacancy,
+                photo=photo,
+            )
+
+    def test_candidate_photo(self):
+        """Миниатюра фото создается в формате WebP размера THUMBNAIL_SIZE."""
+        candidate = self.create_candidate(image((400, 300)))
+        candidate.refresh_from_db()
+        name = candidate.photo_thumbnail.name
+        self.assertRegex(name, r"/thumbnails/image[^/]*\.png\.webp$")
+        with Image.open(candidate.photo_thumbnail) as thumbnail:
+            self.assertEqual(thumbnail.format, "WEBP")
+            self.assertEqual(thumbnail.size, (128, 128))
+
+    def test_replace_and_clear(self):
+        """Миниатюра обновляется при замене фото и очищается при удалении."""
+        candidate = self.create_candidate(image((200, 200)))
+        candidate.refresh_from_db()
+        first = candidate.photo_thumbnail.name
+        with self.captureOnCommitCallbacks(execute=True):
+            candidate.photo = image((50, 80), image_format="JPEG")
+            candidate.save()
+        candidate.refresh_from_db()
+        self.assertNotEqual(candidate.photo_thumbnail.name, first)
+        with self.captureOnCommitCallbacks(execute=True):
+            candidate.photo = None
+            candidate.save()
+        candidate.refresh_from_db()
+        self.assertFalse(candidate.photo_thumbnail)
+
+    def test_same_stem(self):
+        """Фото a.png и a.jpeg в одном каталоге получают разные миниатюры."""
+        first = self.create_candidate(image((200, 200)))
+        second = self.create_candidate(
+            image((100, 100), image_format="JPEG"), email="other@example.com"
+        )
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertNotEqual(first.photo_thumbnail.name, second.photo_thumbnail.name)
+        for candidate in (first, second):
+            with self.subTest(photo=candidate.photo.name):
+                self.assertFalse(needs_thumbnail(candidate))
+                self.assertTrue(
+                    candidate.photo_thumbnail.storage.exists(
+                        candidate.photo_thumbnail.name
+                    )
+                )
+
+    def test_shared_thumbnail(self):
+        """Прежняя миниатюра удаляется, только когда на нее никто не ссылается."""
+        first = self.create_candidate(image((200, 200)))
+        first.refresh_from_db()
+        shared = first.photo_thumbnail.name
+        other = self.create_candidate(image((50, 50)), email="other@example.com")
+        Candidate.objects.filter(pk=other.pk).update(photo_thumbnail=shared)
+        thumbnail = generate_thumbnail(Candidate, first.pk)
+        self.assertNotEqual(thumbnail, shared)
+        first.refresh_from_db()
+        self.assertFalse(needs_thumbnail(first))
+        storage = first.photo_thumbnail.storage
+        self.assertTrue(storage.exists(shared))
+        generate_thumbnail(Candidate, other.pk)
+        self.assertFalse(storage.exists(shared))
+
+    @override_settings(
+        CACHES={
+            alias: {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": f"thumbnails-{alias}",
+            }
+            for alias in ("default", "responses")
+        }
+    )
+    def test_cached_list(self):
+        """Миниатюра появляется в закэшированном списке кандидатов."""
+        candidate = self.create_candidate(image((200, 200)))
+        Candidate.objects.filter(pk=candidate.pk).update(photo_thumbnail=None)
+        client = APIClient()
+        client.force_authenticate(self.user)
+        url = reverse("candidates-list", kwargs={"vacancy_id": self.vacancy.id})
+        self.assertIsNone(client.get(url).data["results"][0]["photo_thumbnail"])
+        with self.captureOnCommitCallbacks(execute=True):
+            generate_thumbnail(Candidate, candidate.pk)
+        response = client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertIsNotNone(response.data["results"][0]["photo_thumbnail"])
+
+    def test_changed_source(self):
+        """Миниатюра не записывается, если фото изменилось во время создания."""
+        candidate = self.create_candidate(image((200, 200)))
+
+        def render(file):
+            Candidate.objects.filter(pk=candidate.pk).update(photo="other.png")
+            return b"thumbnail"
+
+        with patch("recruitment.thumbnails.render_thumbnail", render):
+            self.assertIsNone(generate_thumbnail(Candidate, candidate.pk))
+
+    def test_company_logo(self):
+        """Прозрачность логотипа сохраняется в WebP."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.company.logo = image((64, 32), mode="RGBA")
+            self.company.save()
+        self.company.refresh_from_db()
+        with Image.open(self.company.logo_thumbnail) as thumbnail:
+            self.assertEqual(thumbnail.mode, "RGBA")
+
+    def test_list(self):
+        """Ссылка на миниатюру в списке кандидатов совпадает у сериализаторов."""
+        self.create_candidate(image((200, 200)))
+        client = APIClient()
+        client.force_authenticate(self.user)
+        url = reverse("candidates-list", kwargs={"vacancy_id": self.vacancy.id})
+        fast = client.get(url)
+        with patch.object(CandidateViewSet, "fast_list_serializer_class", None):
+            expected = client.get(url)
+        candidate = Candidate.objects.get()
+        self.assertEqual(
+            fast.data["results"][0]["photo_thumbnail"],
+            f"http://testserver{candidate.photo_thumbnail.url}",
+        )
+        self.assertEqual(fast.content, expected.content)
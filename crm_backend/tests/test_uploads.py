@@ -0,0 +1,178 @@
+import base64
+import io
+import tempfile
+
+from api.serializers import StreamingBase64ImageField
+from api.uploads import decode_base64_file
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+from recruitment.models import Candidate, Company, Vacancy
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+from users.models import User
+
+PDF = b"%PDF-1.4\n" + bytes(range(256)) * 40
+
+
+def png():
+    """Небольшое изображение PNG."""
+    file = io.BytesIO()
+    Image.new("RGB", (8, 8)).save(file, "PNG")
+    return file.getvalue()
+
+
+class Base64DecodeTest(TestCase):
+    """Тестирование потокового декодирования base64."""
+
+    def test_chunks(self):
+        """Куски любой длины и переносы строк не меняют содержимое."""
+        encoded = base64.encodebytes(PDF).decode()
+        for chunk_size in (5, 64, 1024 * 1024):
+            with self.subTest(chunk_size=chunk_size):
+                file = decode_base64_file(
+                    f"data:application/pdf;base64,{encoded}",
+                    "temp.pdf",
+                    len(PDF),
+                    chunk_size,
+                )
+                self.assertEqual(file.content_type, "application/pdf")
+                self.assertEqual(file.size, len(PDF))
+                self.assertEqual(file.read(), PDF)
+
+    def test_max_size(self):
+        """Файл больше лимита отклоняется по ходу декодирования."""
+        with self.assertRaisesMessage(ValidationError, "не должен превышать"):
+            decode_base64_file(base64.b64encode(PDF).decode(), "a.pdf", 100, 64)
+
+    def test_invalid(self):
+        """Поврежденный base64 отклоняется."""
+        for data in ("data:application/pdf;base64,JVBE*", "JVBER"):
+            with self.subTest(data=data):
+                with self.assertRaisesMessage(ValidationError, "поврежден"):
+                    decode_base64_file(data, "a.pdf", 100)
+
+    def test_image_type(self):
+        """Расширение изображения определяется по содержимому."""
+        file = StreamingBase64ImageField().to_internal_value(
+            base64.b64encode(png()).decode()
+        )
+        self.assertTrue(file.name.endswith(".png"))
+        with self.assertRaises(ValidationError):
+            StreamingBase64ImageField().to_internal_value(
+                base64.b64encode(PDF).decode()
+            )
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class CandidateUploadTest(TestCase):
+    """Тестирование загрузки резюме и фото кандидата."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Вакансия для кандидатов."""
+        cls.user = User.objects.create_user("hr@example.com", "password")
+        company = Company.objects.create(
+            company_title="Яндекс", website="https://yandex.ru"
+        )
+        cls.vacancy = Vacancy.objects.create(
+            company=company,
+            author=cls.user,
+            vacancy_title="Разработчик",
+            city="Москва",
+        )
+
+    def setUp(self):
+        """Авторизация клиента."""
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("candidates-list", kwargs={"vacancy_id": self.vacancy.id})
+        self.data = {
+            "first_name": "Иван",
+            "last_name": "Петров",
+            "bday": "1990-01-01",
+            "city": "Москва",
+            "email": "candidate@example.com",
+            "employment_type": ["PO"],
+            "schedule_work": ["U"],
+            "work_experiences": "2",
+            "education": "SR",
+            "candidate_status": "A",
+        }
+
+    def test_base64(self):
+        """Резюме и фото в base64 сохраняются в хранилище."""
+        response = self.client.post(
+            self.url,
+            {
+                **self.data,
+                "resume": "data:application/pdf;base64,"
+                + base64.b64encode(PDF).decode(),
+                "photo": base64.b64encode(png()).decode(),
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201, response.data)
+        candidate = Candidate.objects.get()
+        self.assertEqual(candidate.resume.read(), PDF)
+        self.assertTrue(candidate.photo.name.endswith(".png"))
+
+    def test_multipart(self):
+        """Резюме и фото можно загрузить файлами multipart."""
+        response = self.client.post(
+            self.url,
+            {
+                **self.data,
+                "resume": SimpleUploadedFile("cv.pdf", PDF, "application/pdf"),
+                "photo": SimpleUploadedFile("photo.png", png(), "image/png"),
+            },
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(Candidate.objects.get().resume.read(), PDF)
+
+    @override_settings(UPLOAD_PDF_MAX_SIZE=1000)
+    def test_field_max_size(self):
+        """Резюме больше UPLOAD_PDF_MAX_SIZE отклоняется."""
+        response = self.client.post(
+            self.url,
+            {
+                **self.data,
+                "resume": SimpleUploadedFile("cv.pdf", PDF, "application/pdf"),
+                "photo": SimpleUploadedFile("photo.png", png(), "image/png"),
+            },
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Candidate.objects.exists())
+
+    @override_settings(FILE_UPLOAD_MAX_SIZE=1000)
+    def test_upload_max_size(self):
+        """Разбор multipart прерывается на файле больше FILE_UPLOAD_MAX_SIZE."""
+        response = self.client.post(
+            self.url,
+            {
+                **self.data,
+                "resume": SimpleUploadedFile("cv.pdf", PDF, "application/pdf"),
+            },
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("не должен превышать", str(response.data))
+
+    @override_settings(FILE_UPLOAD_MAX_SIZE=1000)
+    def test_admin_upload_max_size(self):
+        """Слишком большой файл в админке отклоняется ответом 400, а не 500."""
+        client = Client()
+        client.force_login(User.objects.create_superuser("admin@example.com", "pw"))
+        response = client.post(
+            reverse("admin:recruitment_company_add"),
+            {
+                "company_title": "Ozon",
+                "website": "https://ozon.ru",
+                "logo": SimpleUploadedFile("logo.png", PDF, "image/png"),
+            },
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Company.objects.filter(company_title="Ozon").exists())
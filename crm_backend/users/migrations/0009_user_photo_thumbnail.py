@@ -0,0 +1,18 @@
+# Generated by Django 4.1 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_alter_user_confirmation_code'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='photo_thumbnail',
+            field=models.ImageField(blank=True, editable=False, max_length=255, null=True, upload_to='', verbose_name='Миниатюра фото'),
+        ),
+    ]
@@ -88,6 +88,13 @@ class User(AbstractUser):
     photo = models.ImageField(
         upload_to="users/photo/", null=True, blank=True, verbose_name="Фото"
     )
+    photo_thumbnail = models.ImageField(
+        verbose_name="Миниатюра фото",
+        max_length=255,
+        null=True,
+        blank=True,
+        editable=False,
+    )
     position = models.CharField(max_length=40, blank=True, verbose_name="Должность")
     phone_number = models.CharField(
         validators=[PHONE_NUMBER_REGEX], max_length=16, blank=True